@@ -78,6 +78,9 @@ class ConfigLoaderAgent:
             killer_knows_identity=data.get("killer_knows_identity", False),
             # CLI flags override YAML
             generate_images=state.config.generate_images,
+            enable_image_cache=state.config.enable_image_cache,
+            enable_response_cache=state.config.enable_response_cache,
+            validator_ensemble=state.config.validator_ensemble,
             dry_run=state.config.dry_run,
             debug_model=state.config.debug_model,
             keep_work_dir=state.config.keep_work_dir,
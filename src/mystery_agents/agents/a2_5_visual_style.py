@@ -8,6 +8,30 @@ from mystery_agents.utils.prompts import A2_5_VISUAL_STYLE_SYSTEM_PROMPT
 
 from .base import BaseAgent
 
+# Static skeleton of the user message; only the setting fields are filled in per run
+_USER_MESSAGE_TEMPLATE = """Create a cohesive visual style guide for character portrait images.
+
+GAME CONTEXT:
+- Historical Period: {epoch}
+- Country/Culture: {country}
+- Location: {location_name}
+- Gathering Reason: {gathering_reason}
+- Visual Keywords: {visual_keywords}
+
+REQUIREMENTS:
+1. All character images should look like they're from the same "photoshoot" or "film production"
+2. COMPOSITION: All portraits must be BUST SHOTS (chest and head visible, like Clue/Cluedo game character cards)
+3. REALISM: Characters should look like REAL, EVERYDAY PEOPLE, not models or actors. Natural faces with realistic features.
+4. The style must be appropriate for {epoch} in {country}
+5. Consider historical photography/portrait art styles from {epoch}
+6. The color palette should reflect {country}'s cultural aesthetic in {epoch}
+7. Lighting should create mystery and drama while being period-appropriate
+8. The style should be sophisticated and elegant
+9. Explicitly exclude: any text/labels, pure black & white (unless historically required), modern elements
+10. All images must be in FULL COLOR unless the period absolutely demands otherwise
+
+Return the visual style guide in the exact JSON format specified in the system prompt."""
+
 
 class A2_5Output(BaseModel):
     """Output format for A2.5 Visual Style agent."""
@@ -29,11 +53,11 @@ class VisualStyleAgent(BaseAgent):
 
     def __init__(self) -> None:
         """Initialize the visual style agent."""
-        super().__init__(llm=LLMCache.get_model("tier2"), response_format=A2_5Output)
-
-    def get_system_prompt(self, state: GameState) -> str:
-        """Return the system prompt for visual style generation."""
-        return A2_5_VISUAL_STYLE_SYSTEM_PROMPT
+        super().__init__(
+            llm=lambda: LLMCache.get_model("tier2"),
+            response_format=A2_5Output,
+            system_prompt=A2_5_VISUAL_STYLE_SYSTEM_PROMPT,
+        )
 
     def run(self, state: GameState) -> GameState:
         """
@@ -48,6 +72,45 @@ class VisualStyleAgent(BaseAgent):
         if self._should_use_mock(state):
             return self._mock_output(state)
 
+        # Invoke LLM with structured output
+        result = self.invoke(state, self._build_user_message(state))
+
+        # Update state
+        state.visual_style = result.visual_style
+
+        return state
+
+    async def arun(self, state: GameState) -> GameState:
+        """
+        Generate visual style guide without blocking the event loop.
+
+        Args:
+            state: Current game state (requires world to be set)
+
+        Returns:
+            Updated state with visual_style populated
+        """
+        if self._should_use_mock(state):
+            return self._mock_output(state)
+
+        result = await self.ainvoke(state, self._build_user_message(state))
+        state.visual_style = result.visual_style
+
+        return state
+
+    def _build_user_message(self, state: GameState) -> str:
+        """
+        Build the user message describing the game setting.
+
+        Args:
+            state: Current game state (requires world to be set)
+
+        Returns:
+            User message for the LLM
+
+        Raises:
+            ValueError: If the world hasn't been generated yet
+        """
         # Verify world exists
         if not state.world:
             raise ValueError("Cannot generate visual style without world. Run A2 first.")
@@ -63,36 +126,13 @@ class VisualStyleAgent(BaseAgent):
             else "elegant, mysterious"
         )
 
-        user_message = f"""Create a cohesive visual style guide for character portrait images.
-
-GAME CONTEXT:
-- Historical Period: {epoch}
-- Country/Culture: {country}
-- Location: {location_name}
-- Gathering Reason: {gathering_reason}
-- Visual Keywords: {visual_keywords}
-
-REQUIREMENTS:
-1. All character images should look like they're from the same "photoshoot" or "film production"
-2. COMPOSITION: All portraits must be BUST SHOTS (chest and head visible, like Clue/Cluedo game character cards)
-3. REALISM: Characters should look like REAL, EVERYDAY PEOPLE, not models or actors. Natural faces with realistic features.
-4. The style must be appropriate for {epoch} in {country}
-5. Consider historical photography/portrait art styles from {epoch}
-6. The color palette should reflect {country}'s cultural aesthetic in {epoch}
-7. Lighting should create mystery and drama while being period-appropriate
-8. The style should be sophisticated and elegant
-9. Explicitly exclude: any text/labels, pure black & white (unless historically required), modern elements
-10. All images must be in FULL COLOR unless the period absolutely demands otherwise
-
-Return the visual style guide in the exact JSON format specified in the system prompt."""
-
-        # Invoke LLM with structured output
-        result = self.invoke(state, user_message)
-
-        # Update state
-        state.visual_style = result.visual_style
-
-        return state
+        return _USER_MESSAGE_TEMPLATE.format(
+            epoch=epoch,
+            country=country,
+            location_name=location_name,
+            gathering_reason=gathering_reason,
+            visual_keywords=visual_keywords,
+        )
 
     def _mock_output(self, state: GameState) -> GameState:
         """Generate mock data for dry run mode."""
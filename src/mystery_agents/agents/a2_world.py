@@ -28,19 +28,11 @@ class WorldAgent(BaseAgent):
 
     def __init__(self) -> None:
         """Initialize the world agent."""
-        super().__init__(llm=LLMCache.get_model("tier1"), response_format=A2Output)
-
-    def get_system_prompt(self, state: GameState) -> str:
-        """
-        Get the system prompt for world generation.
-
-        Args:
-            state: Current game state
-
-        Returns:
-            System prompt string
-        """
-        return A2_WORLD_SYSTEM_PROMPT
+        super().__init__(
+            llm=lambda: LLMCache.get_model("tier1"),
+            response_format=A2Output,
+            system_prompt=A2_WORLD_SYSTEM_PROMPT,
+        )
 
     def run(self, state: GameState) -> GameState:
         """
@@ -117,8 +109,6 @@ Return the response in the exact JSON format specified in the system prompt.
 
     def _mock_output(self, state: GameState) -> GameState:
         """Generate mock data for dry run mode."""
-        from mystery_agents.models.state import WorldBible
-
         state.world = WorldBible(
             epoch="Modern",
             location_type="Mansion",
@@ -10,10 +10,11 @@ from langchain_core.language_models import BaseChatModel
 
 from mystery_agents.agents.base import BaseAgent
 from mystery_agents.models.state import CharacterSpec, GameState
-from mystery_agents.utils.constants import IMAGE_GENERATION_MAX_CONCURRENT
+from mystery_agents.utils.cache import LLMCache
+from mystery_agents.utils.image_batch import get_image_batch_processor, run_image_batch, submit
 from mystery_agents.utils.image_generation import (
-    generate_image_with_gemini,
     get_character_image_output_dir,
+    sanitize_image_filename,
 )
 from mystery_agents.utils.prompts import (
     PORTRAIT_COMPOSITION_REQUIREMENTS,
@@ -35,13 +36,11 @@ class CharacterImageAgent(BaseAgent):
 
     Features:
     - Parallel image generation with rate limiting (respects Gemini API limits)
-    - Semaphore-based concurrency control
+    - Semaphore-based concurrency control via the shared image batch processor
     - Exponential backoff for rate limit errors
     - Mock generation in dry-run mode
     """
 
-    MAX_CONCURRENT_REQUESTS = IMAGE_GENERATION_MAX_CONCURRENT
-
     def __init__(self, llm: BaseChatModel | None = None) -> None:
         """
         Initialize the character image generation agent.
@@ -50,25 +49,12 @@ class CharacterImageAgent(BaseAgent):
             llm: The language model (not used for image generation,
                  optional for compatibility with base class)
         """
-        # Image generation doesn't use LLM, so we create a dummy one if not provided
-        from mystery_agents.utils.cache import LLMCache
-
-        if llm is None:
-            llm = LLMCache.get_model("tier3")  # Cheapest tier, won't be used anyway
-
-        super().__init__(llm, response_format=None)
-
-    def get_system_prompt(self, state: GameState) -> str:
-        """
-        Not used for image generation.
-
-        Args:
-            state: Current game state
-
-        Returns:
-            Empty string (not applicable for image generation)
-        """
-        return ""
+        # Image generation doesn't use the LLM; the cheapest tier is only created if accessed
+        super().__init__(
+            llm if llm is not None else lambda: LLMCache.get_model("tier3"),
+            response_format=None,
+            system_prompt="",
+        )
 
     def run(self, state: GameState) -> GameState:
         """
@@ -93,17 +79,19 @@ class CharacterImageAgent(BaseAgent):
             logger.warning("⚠️  No characters found, skipping image generation")
             return state
 
+        # Concurrency and request spacing come from the shared image batch processor
+        processor = get_image_batch_processor()
+        rate_limit = f", {processor.rate_limit} requests/min" if processor.rate_limit else ""
         logger.info(
             f"🎨 Generating {len(state.characters)} character images in parallel "
-            f"(max {self.MAX_CONCURRENT_REQUESTS} concurrent)"
+            f"(max {processor.max_concurrency} concurrent{rate_limit})"
         )
 
-        # Create output directory for images
+        # Output directory is created when the first image is written
         output_dir = self._get_image_output_dir(state)
-        output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Generate images in parallel using asyncio
-        asyncio.run(self._generate_all_images(state, output_dir))
+        # Generate images in parallel on the shared image batch event loop
+        run_image_batch(self._generate_all_images(state, output_dir))
 
         # Log success with paths for debugging
         images_with_paths = 0
@@ -127,41 +115,21 @@ class CharacterImageAgent(BaseAgent):
         """
         Generate all character images in parallel with concurrency control.
 
+        Concurrency and rate limiting are handled by the shared image batch processor.
+
         Args:
             state: Current game state
             output_dir: Directory to save images
         """
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REQUESTS)
-
         # Create tasks for all characters
         tasks = [
-            self._generate_character_image_with_semaphore(character, state, output_dir, semaphore)
+            self._generate_character_image(character, state, output_dir)
             for character in state.characters
         ]
 
         # Wait for all images to be generated
         await asyncio.gather(*tasks)
 
-    async def _generate_character_image_with_semaphore(
-        self,
-        character: CharacterSpec,
-        state: GameState,
-        output_dir: Path,
-        semaphore: asyncio.Semaphore,
-    ) -> None:
-        """
-        Generate a single character image with semaphore-based rate limiting.
-
-        Args:
-            character: Character specification
-            state: Current game state
-            output_dir: Directory to save image
-            semaphore: Asyncio semaphore for concurrency control
-        """
-        async with semaphore:
-            await self._generate_character_image(character, state, output_dir)
-
     async def _generate_character_image(
         self, character: CharacterSpec, state: GameState, output_dir: Path
     ) -> None:
@@ -171,20 +139,20 @@ class CharacterImageAgent(BaseAgent):
         Args:
             character: Character specification
             state: Current game state
-            output_dir: Directory to save image
+            output_dir: Absolute directory to save image
         """
         prompt = self._build_image_prompt(character, state)
-        image_filename = f"{character.id}_{character.name.lower().replace(' ', '_')}.png"
+        image_filename = f"{character.id}_{sanitize_image_filename(character.name)}.png"
         image_path = output_dir / image_filename
 
         logger.info(f"🎨 Generating image for {character.name}")
 
-        # Generate image with retry logic
-        success = await generate_image_with_gemini(prompt, image_path)
+        # Generate image with retry logic (bounded by the shared batch processor)
+        success = await submit(prompt, image_path, use_cache=state.config.enable_image_cache)
 
         if success:
-            # Update character with image path (absolute path for robustness)
-            character.image_path = str(image_path.absolute())
+            # Update character with image path (output_dir is already absolute)
+            character.image_path = str(image_path)
             logger.info(f"✅ Generated: {character.name} -> {image_path.name}")
         else:
             logger.error(f"❌ Failed to generate image for {character.name}")
@@ -214,7 +182,9 @@ class CharacterImageAgent(BaseAgent):
             else "mysterious"
         )
 
-        prompt = f"""Generate a photorealistic portrait of a {character.gender} character for a mystery party game.
+        parts: list[str] = []
+        parts.append(
+            f"""Generate a photorealistic portrait of a {character.gender} character for a mystery party game.
 
 {PORTRAIT_COMPOSITION_REQUIREMENTS}
 
@@ -235,15 +205,18 @@ SETTING CONTEXT:
 COSTUME:
 {character.costume_suggestion if character.costume_suggestion else f"Period-appropriate attire for {epoch} in {country}"}
 """
+        )
 
         # Add visual style consistency if available
         if state.visual_style:
-            prompt += build_visual_style_block(state.visual_style)
+            parts.append(build_visual_style_block(state.visual_style))
         else:
             # Fallback if no visual style (shouldn't happen, but safe)
-            prompt += build_fallback_style_requirements(epoch, country, personality, "character")
+            parts.append(
+                build_fallback_style_requirements(epoch, country, personality, "character")
+            )
 
-        return prompt
+        return "".join(parts)
 
     def _get_image_output_dir(self, state: GameState) -> Path:
         """
@@ -253,11 +226,11 @@ COSTUME:
             state: Current game state
 
         Returns:
-            Path to images directory
+            Absolute path to images directory
         """
-        # Use game_id from meta
+        # Use game_id from meta; made absolute once so per-image paths don't each call getcwd()
         game_id = state.meta.id[:8] if state.meta else "default"
-        return get_character_image_output_dir(game_id)
+        return get_character_image_output_dir(game_id).absolute()
 
     def _mock_output(self, state: GameState) -> GameState:
         """
@@ -269,13 +242,12 @@ COSTUME:
         Returns:
             State with mock image paths
         """
+        # Mock images are never written, so the directory isn't created
         output_dir = self._get_image_output_dir(state)
-        # Create directory structure even in dry-run mode for consistency
-        output_dir.mkdir(parents=True, exist_ok=True)
 
         for character in state.characters:
-            mock_filename = f"{character.id}_{character.name.lower().replace(' ', '_')}.png"
-            character.image_path = str((output_dir / mock_filename).absolute())
+            mock_filename = f"{character.id}_{sanitize_image_filename(character.name)}.png"
+            character.image_path = str(output_dir / mock_filename)
             logger.info(f"🎭 Mock image: {character.name} -> {mock_filename}")
 
         return state
@@ -33,7 +33,7 @@ class CharactersAgent(BaseAgent):
 
     def __init__(self) -> None:
         """Initialize the characters agent."""
-        super().__init__(llm=LLMCache.get_model("tier2"), response_format=A3Output)
+        super().__init__(llm=lambda: LLMCache.get_model("tier2"), response_format=A3Output)
 
     def get_system_prompt(self, state: GameState) -> str:
         """
@@ -62,6 +62,42 @@ class CharactersAgent(BaseAgent):
         if self._should_use_mock(state):
             return self._mock_output(state)
 
+        # Invoke LLM with structured output
+        result = self.invoke(state, self._build_user_message(state))
+
+        # Update state
+        state.characters = result.characters
+
+        return state
+
+    async def arun(self, state: GameState) -> GameState:
+        """
+        Generate characters without blocking the event loop.
+
+        Args:
+            state: Current game state with world
+
+        Returns:
+            Updated game state with characters
+        """
+        if self._should_use_mock(state):
+            return self._mock_output(state)
+
+        result = await self.ainvoke(state, self._build_user_message(state))
+        state.characters = result.characters
+
+        return state
+
+    def _build_user_message(self, state: GameState) -> str:
+        """
+        Build the user message describing the world and player constraints.
+
+        Args:
+            state: Current game state with world
+
+        Returns:
+            User message for the LLM
+        """
         # Prepare context for LLM
         gender_constraints = ""
         if state.config.players.male > 0:
@@ -69,7 +105,7 @@ class CharactersAgent(BaseAgent):
         if state.config.players.female > 0:
             gender_constraints += f"\n- {state.config.players.female} female characters"
 
-        user_message = f"""Generate {state.config.players.total} suspect characters for this mystery:
+        return f"""Generate {state.config.players.total} suspect characters for this mystery:
 
 WORLD:
 - Setting: {safe_get_world_location_name(state)}
@@ -100,14 +136,6 @@ REQUIREMENTS:
 Return the response in the exact JSON format specified in the system prompt.
 """
 
-        # Invoke LLM with structured output
-        result = self.invoke(state, user_message)
-
-        # Update state
-        state.characters = result.characters
-
-        return state
-
     def _mock_output(self, state: GameState) -> GameState:
         """Generate mock data for dry run mode."""
         num_players = state.config.players.total
@@ -32,19 +32,11 @@ class RelationshipsAgent(BaseAgent):
 
     def __init__(self) -> None:
         """Initialize the relationships agent."""
-        super().__init__(llm=LLMCache.get_model("tier2"), response_format=A4Output)
-
-    def get_system_prompt(self, state: GameState) -> str:
-        """
-        Get the system prompt for relationship generation.
-
-        Args:
-            state: Current game state
-
-        Returns:
-            System prompt string
-        """
-        return A4_RELATIONSHIPS_SYSTEM_PROMPT
+        super().__init__(
+            llm=lambda: LLMCache.get_model("tier2"),
+            response_format=A4Output,
+            system_prompt=A4_RELATIONSHIPS_SYSTEM_PROMPT,
+        )
 
     def run(self, state: GameState) -> GameState:
         """
@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel, Field
 
-from mystery_agents.models.state import CrimeSpec, GameState
+from mystery_agents.models.state import CrimeScene, CrimeSpec, GameState, MurderMethod, VictimSpec
 from mystery_agents.utils.cache import LLMCache
 from mystery_agents.utils.constants import GAME_TONE_STYLE, MOCK_VICTIM_NAME
 from mystery_agents.utils.prompts import A5_CRIME_SYSTEM_PROMPT
@@ -33,19 +33,11 @@ class CrimeAgent(BaseAgent):
 
     def __init__(self) -> None:
         """Initialize the crime agent."""
-        super().__init__(llm=LLMCache.get_model("tier1"), response_format=A5Output)
-
-    def get_system_prompt(self, state: GameState) -> str:
-        """
-        Get the system prompt for crime generation.
-
-        Args:
-            state: Current game state
-
-        Returns:
-            System prompt string
-        """
-        return A5_CRIME_SYSTEM_PROMPT
+        super().__init__(
+            llm=lambda: LLMCache.get_model("tier1"),
+            response_format=A5Output,
+            system_prompt=A5_CRIME_SYSTEM_PROMPT,
+        )
 
     def run(self, state: GameState) -> GameState:
         """
@@ -115,13 +107,6 @@ Return the response in the exact JSON format specified in the system prompt.
 
     def _mock_output(self, state: GameState) -> GameState:
         """Generate mock data for dry run mode."""
-        from mystery_agents.models.state import (
-            CrimeScene,
-            CrimeSpec,
-            MurderMethod,
-            VictimSpec,
-        )
-
         state.crime = CrimeSpec(
             victim=VictimSpec(
                 name=MOCK_VICTIM_NAME,
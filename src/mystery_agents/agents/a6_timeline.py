@@ -1,6 +1,6 @@
 """A6: Timeline Global Agent - Creates the event sequence."""
 
-from mystery_agents.models.state import GameState, GlobalTimeline
+from mystery_agents.models.state import GameState, GlobalEvent, GlobalTimeline, TimeBlock
 from mystery_agents.utils.cache import LLMCache
 from mystery_agents.utils.prompts import A6_SYSTEM_PROMPT
 from mystery_agents.utils.state_helpers import (
@@ -11,70 +11,21 @@ from mystery_agents.utils.state_helpers import (
 
 from .base import BaseAgent
 
-
-class TimelineAgent(BaseAgent):
-    """
-    A6: Timeline Global Agent.
-
-    Creates a timeline of events before/during Act 1.
-    """
-
-    def __init__(self) -> None:
-        """Initialize the timeline agent."""
-        super().__init__(llm=LLMCache.get_model("tier2"), response_format=GlobalTimeline)
-
-    def get_system_prompt(self, state: GameState) -> str:
-        """
-        Get the system prompt for timeline generation.
-
-        Args:
-            state: Current game state
-
-        Returns:
-            System prompt string
-        """
-        return A6_SYSTEM_PROMPT
-
-    def run(self, state: GameState) -> GameState:
-        """
-        Generate the global timeline.
-
-        Args:
-            state: Current game state with world, crime, and characters
-
-        Returns:
-            Updated game state with timeline
-        """
-        # If dry run, return mock data
-        if self._should_use_mock(state):
-            return self._mock_output(state)
-
-        # Prepare context for LLM
-        characters_list = []
-        for char in state.characters:
-            characters_list.append(f"- {char.name} (ID: {char.id}): {char.role}")
-
-        rooms_list = []
-        if state.maps:
-            for map_spec in state.maps:
-                for room in map_spec.rooms:
-                    rooms_list.append(f"- {room.name} (ID: {room.id})")
-
-        time_of_death = safe_get_crime_time_of_death(state)
-        user_message = f"""Generate a timeline of events for the mystery party game:
+# Static skeleton of the user message; only the game-specific blocks are filled in per run
+_USER_MESSAGE_TEMPLATE = """Generate a timeline of events for the mystery party game:
 
 SETTING:
-- Location: {safe_get_world_location_name(state)}
+- Location: {location_name}
 - Time of death: {time_of_death}
 
 CHARACTERS (SUSPECTS):
-{chr(10).join(characters_list) if characters_list else "No characters"}
+{characters_block}
 
 VICTIM (HOST):
-- {safe_get_crime_victim_name(state)}
+- {victim_name}
 
 ROOMS:
-{chr(10).join(rooms_list) if rooms_list else "Generate appropriate rooms"}
+{rooms_block}
 
 REQUIREMENTS:
 1. Create a "time_blocks" array with TimeBlock objects
@@ -96,6 +47,58 @@ The killer will be selected later, so the timeline should work for MULTIPLE poss
 Return the response in the exact JSON format specified in the system prompt.
 """
 
+
+class TimelineAgent(BaseAgent):
+    """
+    A6: Timeline Global Agent.
+
+    Creates a timeline of events before/during Act 1.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timeline agent."""
+        super().__init__(
+            llm=lambda: LLMCache.get_model("tier2"),
+            response_format=GlobalTimeline,
+            system_prompt=A6_SYSTEM_PROMPT,
+        )
+
+    def run(self, state: GameState) -> GameState:
+        """
+        Generate the global timeline.
+
+        Args:
+            state: Current game state with world, crime, and characters
+
+        Returns:
+            Updated game state with timeline
+        """
+        # If dry run, return mock data
+        if self._should_use_mock(state):
+            return self._mock_output(state)
+
+        # Prepare context for LLM
+        characters_block = (
+            "\n".join(f"- {char.name} (ID: {char.id}): {char.role}" for char in state.characters)
+            or "No characters"
+        )
+        rooms_block = (
+            "\n".join(
+                f"- {room.name} (ID: {room.id})"
+                for map_spec in state.maps or []
+                for room in map_spec.rooms
+            )
+            or "Generate appropriate rooms"
+        )
+
+        user_message = _USER_MESSAGE_TEMPLATE.format(
+            location_name=safe_get_world_location_name(state),
+            time_of_death=safe_get_crime_time_of_death(state),
+            characters_block=characters_block,
+            victim_name=safe_get_crime_victim_name(state),
+            rooms_block=rooms_block,
+        )
+
         # Invoke LLM with structured output
         result = self.invoke(state, user_message)
 
@@ -106,8 +109,6 @@ Return the response in the exact JSON format specified in the system prompt.
 
     def _mock_output(self, state: GameState) -> GameState:
         """Generate mock data for dry run mode."""
-        from mystery_agents.models.state import GlobalEvent, GlobalTimeline, TimeBlock
-
         time_blocks = [
             TimeBlock(
                 start="20:00",
@@ -1,11 +1,55 @@
 """A7: Killer Selection Agent - Chooses the culprit and ensures logic is sound."""
 
+import io
+
 from mystery_agents.models.state import GameState, KillerSelection
 from mystery_agents.utils.cache import LLMCache
 from mystery_agents.utils.prompts import A7_SYSTEM_PROMPT
 
 from .base import BaseAgent
 
+# Static skeleton of the user message; only the game-specific fields are filled in per run
+_USER_MESSAGE_TEMPLATE = """Select the killer from these suspects and ensure the mystery is logically sound:
+
+VICTIM (HOST - NOT A SUSPECT):
+- {victim_name}: {victim_role}
+
+SUSPECTS (PLAYERS - CHOOSE ONE AS KILLER):
+{suspects_block}
+
+CRIME DETAILS:
+- Method: {method}
+- Weapon: {weapon}
+- Location: {crime_scene}
+- Time of death: {time_of_death}
+
+TIMELINE (EXISTING EVENTS - DO NOT CONTRADICT):
+{timeline_summary}
+
+DIFFICULTY: {difficulty}
+
+**CRITICAL INSTRUCTIONS**:
+1. Review the timeline carefully and identify which suspect has the BEST opportunity based on EXISTING timeline events
+2. Look for moments where a suspect was:
+   - Alone or unaccounted for
+   - Near the crime location
+   - Had a plausible reason to slip away
+   - A gap in their whereabouts during or just before time of death
+3. Your truth_narrative MUST explain what happened during these EXISTING gaps/opportunities
+4. DO NOT invent new events (like "they met privately at X time") unless that event exists in the timeline
+5. If you need the killer to have done something, use an existing timeline event where they could have done it
+
+REQUIREMENTS:
+1. Create a KillerSelection object with: killer_id, rationale, modified_events, truth_narrative
+2. killer_id must match one of the suspect character IDs exactly who HAS an opportunity in the timeline
+3. rationale must explain why this character was chosen based on EXISTING timeline opportunities
+4. modified_events is an array of strings (can be empty [])
+5. truth_narrative must explain the murder using ONLY existing timeline events and gaps
+6. All string fields must have values - do not leave any empty
+
+Return the response in the exact JSON format specified in the system prompt.
+"""
+
 
 class KillerSelectionAgent(BaseAgent):
     """
@@ -17,19 +61,11 @@ class KillerSelectionAgent(BaseAgent):
 
     def __init__(self) -> None:
         """Initialize the killer selection agent."""
-        super().__init__(llm=LLMCache.get_model("tier1"), response_format=KillerSelection)
-
-    def get_system_prompt(self, state: GameState) -> str:
-        """
-        Get the system prompt for killer selection.
-
-        Args:
-            state: Current game state
-
-        Returns:
-            System prompt string
-        """
-        return A7_SYSTEM_PROMPT
+        super().__init__(
+            llm=lambda: LLMCache.get_model("tier1"),
+            response_format=KillerSelection,
+            system_prompt=A7_SYSTEM_PROMPT,
+        )
 
     def run(self, state: GameState) -> GameState:
         """
@@ -51,93 +87,78 @@ class KillerSelectionAgent(BaseAgent):
             suspects_info.append(
                 f"- {char.name} (ID: {char.id}): {char.role}, motive: {char.motive_for_crime}"
             )
+        char_name_by_id = {c.id: c.name for c in state.characters}
 
         # Format timeline with detailed events so A7 can see what actually happened
         timeline_summary = "No timeline yet"
         if state.timeline_global and state.timeline_global.time_blocks:
-            timeline_events = []
+            buf = io.StringIO()
             for block in state.timeline_global.time_blocks:
-                timeline_events.append(f"\n--- {block.start} to {block.end} ---")
+                buf.write(f"\n--- {block.start} to {block.end} ---\n")
                 for event in block.events:
-                    char_names = []
+                    # Many events (e.g. the murder itself) involve nobody; skip the lookup
+                    char_str = ""
                     if event.character_ids_involved:
-                        for char_id in event.character_ids_involved:
-                            matching_char = next(
-                                (c for c in state.characters if c.id == char_id), None
-                            )
-                            if matching_char:
-                                char_names.append(matching_char.name)
-
-                    char_str = f" [{', '.join(char_names)}]" if char_names else ""
+                        char_names = ", ".join(
+                            char_name_by_id[char_id]
+                            for char_id in event.character_ids_involved
+                            if char_id in char_name_by_id
+                        )
+                        if char_names:
+                            char_str = f" [{char_names}]"
                     location_str = f" (Location: {event.room_id})" if event.room_id else ""
-                    timeline_events.append(
-                        f"  • {event.time_approx}{char_str}{location_str}: {event.description}"
+                    buf.write(
+                        f"  • {event.time_approx}{char_str}{location_str}: {event.description}\n"
                     )
-            timeline_summary = "\n".join(timeline_events)
+            timeline_summary = buf.getvalue()
 
         # Validate that crime is set (should always be at this point in workflow)
         if not state.crime:
             raise ValueError("Crime specification is required for killer selection")
 
-        user_message = f"""Select the killer from these suspects and ensure the mystery is logically sound:
-
-VICTIM (HOST - NOT A SUSPECT):
-- {state.crime.victim.name}: {state.crime.victim.role_in_setting}
-
-SUSPECTS (PLAYERS - CHOOSE ONE AS KILLER):
-{chr(10).join(suspects_info)}
-
-CRIME DETAILS:
-- Method: {state.crime.murder_method.description}
-- Weapon: {state.crime.murder_method.weapon_used}
-- Location: {state.crime.crime_scene.description}
-- Time of death: {state.crime.time_of_death_approx}
-
-TIMELINE (EXISTING EVENTS - DO NOT CONTRADICT):
-{timeline_summary}
-
-DIFFICULTY: {state.config.difficulty}
-
-**CRITICAL INSTRUCTIONS**:
-1. Review the timeline carefully and identify which suspect has the BEST opportunity based on EXISTING timeline events
-2. Look for moments where a suspect was:
-   - Alone or unaccounted for
-   - Near the crime location
-   - Had a plausible reason to slip away
-   - A gap in their whereabouts during or just before time of death
-3. Your truth_narrative MUST explain what happened during these EXISTING gaps/opportunities
-4. DO NOT invent new events (like "they met privately at X time") unless that event exists in the timeline
-5. If you need the killer to have done something, use an existing timeline event where they could have done it
-
-REQUIREMENTS:
-1. Create a KillerSelection object with: killer_id, rationale, modified_events, truth_narrative
-2. killer_id must match one of the suspect character IDs exactly who HAS an opportunity in the timeline
-3. rationale must explain why this character was chosen based on EXISTING timeline opportunities
-4. modified_events is an array of strings (can be empty [])
-5. truth_narrative must explain the murder using ONLY existing timeline events and gaps
-6. All string fields must have values - do not leave any empty
-
-Return the response in the exact JSON format specified in the system prompt.
-"""
+        user_message = _USER_MESSAGE_TEMPLATE.format(
+            victim_name=state.crime.victim.name,
+            victim_role=state.crime.victim.role_in_setting,
+            suspects_block="\n".join(suspects_info),
+            method=state.crime.murder_method.description,
+            weapon=state.crime.murder_method.weapon_used,
+            crime_scene=state.crime.crime_scene.description,
+            time_of_death=state.crime.time_of_death_approx,
+            timeline_summary=timeline_summary,
+            difficulty=state.config.difficulty,
+        )
 
         # Invoke LLM with structured output
         result = self.invoke(state, user_message)
 
         # Validate killer is in suspects list
-        killer_ids = [c.id for c in state.characters]
-        if result.killer_id not in killer_ids:
+        if result.killer_id not in char_name_by_id:
             # Fallback: choose first character
-            result.killer_id = state.characters[0].id if state.characters else "unknown"
+            result.killer_id = self._default_killer_id(state)
 
         # Update state
         state.killer_selection = result
 
         return state
 
+    @staticmethod
+    def _default_killer_id(state: GameState, fallback: str = "unknown") -> str:
+        """
+        Get the killer ID to use when none (or an invalid one) was selected.
+
+        Args:
+            state: Current game state
+            fallback: ID to use when there are no characters
+
+        Returns:
+            ID of the first character, or fallback if there are none
+        """
+        return state.characters[0].id if state.characters else fallback
+
     def _mock_output(self, state: GameState) -> GameState:
         """Generate mock data for dry run mode."""
         # Choose first character as killer for mock
-        killer_id = state.characters[0].id if state.characters else "mock-killer"
+        killer_id = self._default_killer_id(state, fallback="mock-killer")
 
         state.killer_selection = KillerSelection(
             killer_id=killer_id,
@@ -2,26 +2,55 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+from collections.abc import Coroutine
 from pathlib import Path
+from typing import Any, Literal, NamedTuple
 
 from langchain_core.language_models import BaseChatModel
 
 from mystery_agents.agents.base import BaseAgent
-from mystery_agents.models.state import DetectiveRole, GameState, VictimSpec
+from mystery_agents.models.state import DetectiveRole, GameState, VictimSpec, VisualStyle
+from mystery_agents.utils.cache import LLMCache
+from mystery_agents.utils.image_batch import run_image_batch, submit
 from mystery_agents.utils.image_generation import (
-    generate_image_with_gemini,
     get_character_image_output_dir,
+    sanitize_image_filename,
 )
 from mystery_agents.utils.prompts import (
     PORTRAIT_COMPOSITION_REQUIREMENTS,
     REALISTIC_APPEARANCE_REQUIREMENTS,
     build_fallback_style_requirements,
+    build_visual_style_block,
 )
 from mystery_agents.utils.state_helpers import (
     safe_get_world_epoch,
     safe_get_world_location_name,
 )
 
+logger = logging.getLogger(__name__)
+
+
+class HostPromptContext(NamedTuple):
+    """Setting values shared by the victim and detective prompts, computed once per run."""
+
+    epoch: str
+    location: str
+    country: str
+    style_block: str | None
+
+
+class _PortraitSpec(NamedTuple):
+    """The fields that differ between the victim and detective portrait prompts."""
+
+    kind: Literal["victim", "detective"]
+    subject: str
+    detail_lines: list[str]
+    personality: str
+    costume: str
+    important_line: str
+
 
 class HostImageAgent(BaseAgent):
     """
@@ -30,6 +59,7 @@ class HostImageAgent(BaseAgent):
     Features:
     - Generates images for victim (Act 1) and detective (Act 2)
     - Same technology as CharacterImageAgent (Gemini Image API)
+    - Shares the image batch processor (concurrency + rate limits) with CharacterImageAgent
     - Exponential backoff for rate limit errors
     - Mock generation in dry-run mode
     """
@@ -42,25 +72,13 @@ class HostImageAgent(BaseAgent):
             llm: The language model (not used for image generation,
                  optional for compatibility with base class)
         """
-        # Image generation doesn't use LLM, so we create a dummy one if not provided
-        from mystery_agents.utils.cache import LLMCache
-
-        if llm is None:
-            llm = LLMCache.get_model("tier3")  # Cheapest tier, won't be used anyway
-
-        super().__init__(llm, response_format=None)
-
-    def get_system_prompt(self, state: GameState) -> str:
-        """
-        Not used for image generation.
-
-        Args:
-            state: Current game state
-
-        Returns:
-            Empty string (not applicable for image generation)
-        """
-        return ""
+        # Image generation doesn't use the LLM; the cheapest tier is only created if accessed
+        super().__init__(
+            llm if llm is not None else lambda: LLMCache.get_model("tier3"),
+            response_format=None,
+            system_prompt="",
+        )
+        self._style_block_cache: tuple[VisualStyle, str] | None = None
 
     def run(self, state: GameState) -> GameState:
         """
@@ -86,195 +104,251 @@ class HostImageAgent(BaseAgent):
         if not has_victim and not has_detective:
             return state
 
-        # Create output directory for images
+        # Output directory is created when the first image is written. Made absolute
+        # once here so per-image paths don't each need a getcwd() call.
         game_id = state.meta.id[:8] if state.meta else "default"
-        output_dir = get_character_image_output_dir(game_id)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = get_character_image_output_dir(game_id).absolute()
 
-        # Generate victim image
-        if state.crime and state.crime.victim:
-            self._generate_victim_image_sync(state.crime.victim, state, output_dir)
+        # Generate victim and detective images concurrently (independent API calls)
+        run_image_batch(self._generate_all_images(state, output_dir))
+
+        # Return updated state
+        return state
+
+    async def _generate_all_images(self, state: GameState, output_dir: Path) -> None:
+        """
+        Generate victim and detective images in parallel.
+
+        Args:
+            state: Current game state
+            output_dir: Directory to save images
+        """
+        # Compute the shared setting context and style block once for both prompts
+        context = self._build_prompt_context(state)
 
-        # Generate detective image
+        tasks: list[Coroutine[Any, Any, None]] = []
+        if state.crime and state.crime.victim:
+            tasks.append(
+                self._generate_victim_image(state.crime.victim, state, output_dir, context)
+            )
         if state.host_guide and state.host_guide.host_act2_detective_role:
-            self._generate_detective_image_sync(
-                state.host_guide.host_act2_detective_role, state, output_dir
+            tasks.append(
+                self._generate_detective_image(
+                    state.host_guide.host_act2_detective_role, state, output_dir, context
+                )
             )
 
-        # Return updated state
-        return state
+        await asyncio.gather(*tasks)
 
-    def _generate_victim_image_sync(
-        self, victim: VictimSpec, state: GameState, output_dir: Path
+    async def _generate_victim_image(
+        self,
+        victim: VictimSpec,
+        state: GameState,
+        output_dir: Path,
+        context: HostPromptContext | None = None,
     ) -> None:
         """
-        Generate image for the victim character (synchronous wrapper).
+        Generate image for the victim character.
+
+        Failures are isolated so they don't cancel the detective image.
 
         Args:
             victim: Victim specification
             state: Current game state
-            output_dir: Directory to save image
+            output_dir: Absolute directory to save image
+            context: Precomputed prompt context (computed on demand if None)
         """
-        import asyncio
-
-        async def generate() -> None:
-            prompt = self._build_victim_image_prompt(victim, state)
-            image_filename = f"{victim.id}_{victim.name.lower().replace(' ', '_')}.png"
+        try:
+            prompt = self._build_victim_image_prompt(victim, state, context)
+            image_filename = f"{victim.id}_{sanitize_image_filename(victim.name)}.png"
             image_path = output_dir / image_filename
 
-            success = await generate_image_with_gemini(prompt, image_path)
-
-            if success:
-                victim.image_path = str(image_path.absolute())
-            else:
-                victim.image_path = None
+            success = await submit(prompt, image_path, use_cache=state.config.enable_image_cache)
 
-        asyncio.run(generate())
+            victim.image_path = str(image_path) if success else None
+        except Exception as e:
+            logger.error(f"❌ Failed to generate image for victim {victim.name}: {e}")
+            victim.image_path = None
 
-    def _generate_detective_image_sync(
-        self, detective: DetectiveRole, state: GameState, output_dir: Path
+    async def _generate_detective_image(
+        self,
+        detective: DetectiveRole,
+        state: GameState,
+        output_dir: Path,
+        context: HostPromptContext | None = None,
     ) -> None:
         """
-        Generate image for the detective character (synchronous wrapper).
+        Generate image for the detective character.
+
+        Failures are isolated so they don't cancel the victim image.
 
         Args:
             detective: Detective role specification
             state: Current game state
-            output_dir: Directory to save image
+            output_dir: Absolute directory to save image
+            context: Precomputed prompt context (computed on demand if None)
         """
-        import asyncio
-
-        async def generate() -> None:
-            prompt = self._build_detective_image_prompt(detective, state)
+        try:
+            prompt = self._build_detective_image_prompt(detective, state, context)
             # Use a unique ID for detective
             detective_id = f"detective-{state.meta.id[:8]}"
             image_filename = (
-                f"{detective_id}_{detective.character_name.lower().replace(' ', '_')}.png"
+                f"{detective_id}_{sanitize_image_filename(detective.character_name)}.png"
             )
             image_path = output_dir / image_filename
 
-            success = await generate_image_with_gemini(prompt, image_path)
-
-            if success:
-                detective.image_path = str(image_path.absolute())
-            else:
-                detective.image_path = None
+            success = await submit(prompt, image_path, use_cache=state.config.enable_image_cache)
 
-        asyncio.run(generate())
+            detective.image_path = str(image_path) if success else None
+        except Exception as e:
+            logger.error(
+                f"❌ Failed to generate image for detective {detective.character_name}: {e}"
+            )
+            detective.image_path = None
 
-    def _build_victim_image_prompt(self, victim: VictimSpec, state: GameState) -> str:
+    def _build_prompt_context(self, state: GameState) -> HostPromptContext:
         """
-        Build a detailed image generation prompt for the victim character.
+        Compute the setting values shared by the victim and detective prompts.
 
         Args:
-            victim: Victim specification
             state: Current game state
 
         Returns:
-            Detailed prompt for image generation
+            Prompt context with epoch, location, country and visual style block
         """
-        # Get world context
-        epoch = safe_get_world_epoch(state)
-        location = safe_get_world_location_name(state)
-        country = state.config.country if state.config else "Unknown"
-
-        # Build detailed prompt
-        personality = (
-            ", ".join(victim.personality_traits)
-            if victim.personality_traits
-            else "mysterious, commanding"
+        return HostPromptContext(
+            epoch=safe_get_world_epoch(state),
+            location=safe_get_world_location_name(state),
+            country=state.config.country if state.config else "Unknown",
+            style_block=(
+                self._render_style_block(state.visual_style) if state.visual_style else None
+            ),
         )
 
-        prompt = f"""Generate a photorealistic portrait of a {victim.gender} character for a mystery party game.
-
-{PORTRAIT_COMPOSITION_REQUIREMENTS}
-
-{REALISTIC_APPEARANCE_REQUIREMENTS}
-
-CHARACTER DETAILS:
-- Name: {victim.name}
-- Age: {victim.age}
-- Role: {victim.role_in_setting}
-- Description: {victim.public_persona}
-- Personality: {personality}
-- Context: This is the VICTIM of the mystery - a central figure who will be murdered
-
-SETTING CONTEXT:
-- Historical Period: {epoch}
-- Location: {location}
-- Country/Culture: {country}
-
-COSTUME:
-{victim.costume_suggestion if victim.costume_suggestion else f"Period-appropriate formal attire for {epoch} in {country}"}
-"""
-
-        # Add visual style consistency if available
-        if state.visual_style:
-            vs = state.visual_style
+    def _render_style_block(self, visual_style: VisualStyle) -> str:
+        """
+        Render the visual style block shared by the victim and detective prompts.
 
-            prompt += f"""
-VISUAL STYLE CONSISTENCY (CRITICAL - Apply to this character):
-Style: {vs.style_description}
-Art Direction: {vs.art_direction}
+        The block is identical for both host characters, so it's rendered once
+        and reused while the same VisualStyle object is in use.
 
-Color Palette: {", ".join(vs.color_palette) if vs.color_palette else "natural colors"}
-Color Grading: {vs.color_grading}
+        Args:
+            visual_style: Visual style guide for the game
 
-Lighting: {vs.lighting_setup}
-Mood: {vs.lighting_mood}
+        Returns:
+            Formatted visual style block
+        """
+        cached = self._style_block_cache
+        if cached is not None and cached[0] is visual_style:
+            return cached[1]
 
-Background: {vs.background_aesthetic}
-Focus: {vs.background_blur}
+        style_block = build_visual_style_block(visual_style)
+        self._style_block_cache = (visual_style, style_block)
+        return style_block
 
-Technical: {vs.technical_specs}
-Camera: {vs.camera_specs}
+    def _build_victim_image_prompt(
+        self, victim: VictimSpec, state: GameState, context: HostPromptContext | None = None
+    ) -> str:
+        """
+        Build a detailed image generation prompt for the victim character.
 
-IMPORTANT: This is the VICTIM - a central, authoritative figure with commanding presence
+        Args:
+            victim: Victim specification
+            state: Current game state
+            context: Precomputed prompt context (computed on demand if None)
 
-STRICT EXCLUSIONS (DO NOT INCLUDE):
-{chr(10).join(f"- {item}" for item in vs.negative_prompts)}
-"""
-        else:
-            # Fallback if no visual style
-            prompt += build_fallback_style_requirements(epoch, country, personality, "victim")
+        Returns:
+            Detailed prompt for image generation
+        """
+        if context is None:
+            context = self._build_prompt_context(state)
 
-        return prompt
+        personality = (
+            ", ".join(victim.personality_traits)
+            if victim.personality_traits
+            else "mysterious, commanding"
+        )
+        spec = _PortraitSpec(
+            kind="victim",
+            subject=f"a {victim.gender} character",
+            detail_lines=[
+                f"- Name: {victim.name}",
+                f"- Age: {victim.age}",
+                f"- Role: {victim.role_in_setting}",
+                f"- Description: {victim.public_persona}",
+                f"- Personality: {personality}",
+                "- Context: This is the VICTIM of the mystery - a central figure who will be murdered",
+            ],
+            personality=personality,
+            costume=victim.costume_suggestion
+            or f"Period-appropriate formal attire for {context.epoch} in {context.country}",
+            important_line="IMPORTANT: This is the VICTIM - a central, authoritative figure with commanding presence",
+        )
+        return self._build_portrait_prompt(spec, context)
 
-    def _build_detective_image_prompt(self, detective: DetectiveRole, state: GameState) -> str:
+    def _build_detective_image_prompt(
+        self, detective: DetectiveRole, state: GameState, context: HostPromptContext | None = None
+    ) -> str:
         """
         Build a detailed image generation prompt for the detective character.
 
         Args:
             detective: Detective role specification
             state: Current game state
+            context: Precomputed prompt context (computed on demand if None)
 
         Returns:
             Detailed prompt for image generation
         """
-        # Get world context
-        epoch = safe_get_world_epoch(state)
-        location = safe_get_world_location_name(state)
-        country = state.config.country if state.config else "Unknown"
+        if context is None:
+            context = self._build_prompt_context(state)
 
-        # Build detailed prompt
         personality = (
             ", ".join(detective.personality_traits)
             if detective.personality_traits
             else "analytical, observant, methodical"
         )
+        spec = _PortraitSpec(
+            kind="detective",
+            subject="a detective character",
+            detail_lines=[
+                f"- Name: {detective.character_name}",
+                "- Role: Detective investigating the murder",
+                f"- Description: {detective.public_description}",
+                f"- Personality: {personality}",
+                "- Context: This is the DETECTIVE who will solve the mystery in Act 2",
+            ],
+            personality=personality,
+            costume=detective.costume_suggestion
+            or f"Classic detective attire for {context.epoch} in {context.country}",
+            important_line="IMPORTANT: This is the DETECTIVE - sharp, intelligent, investigative presence with perceptive gaze",
+        )
+        return self._build_portrait_prompt(spec, context)
 
-        prompt = f"""Generate a photorealistic portrait of a detective character for a mystery party game.
+    def _build_portrait_prompt(self, spec: _PortraitSpec, context: HostPromptContext) -> str:
+        """
+        Render the portrait prompt shared by the victim and detective characters.
+
+        Args:
+            spec: Character-specific prompt fields
+            context: Shared setting context and visual style block
+
+        Returns:
+            Detailed prompt for image generation
+        """
+        epoch, location, country, style_block = context
+        details = "\n".join(spec.detail_lines)
+
+        parts: list[str] = []
+        parts.append(
+            f"""Generate a photorealistic portrait of {spec.subject} for a mystery party game.
 
 {PORTRAIT_COMPOSITION_REQUIREMENTS}
 
 {REALISTIC_APPEARANCE_REQUIREMENTS}
 
 CHARACTER DETAILS:
-- Name: {detective.character_name}
-- Role: Detective investigating the murder
-- Description: {detective.public_description}
-- Personality: {personality}
-- Context: This is the DETECTIVE who will solve the mystery in Act 2
+{details}
 
 SETTING CONTEXT:
 - Historical Period: {epoch}
@@ -282,40 +356,21 @@ SETTING CONTEXT:
 - Country/Culture: {country}
 
 COSTUME:
-{detective.costume_suggestion if detective.costume_suggestion else f"Classic detective attire for {epoch} in {country}"}
+{spec.costume}
 """
+        )
 
         # Add visual style consistency if available
-        if state.visual_style:
-            vs = state.visual_style
-
-            prompt += f"""
-VISUAL STYLE CONSISTENCY (CRITICAL - Apply to this character):
-Style: {vs.style_description}
-Art Direction: {vs.art_direction}
-
-Color Palette: {", ".join(vs.color_palette) if vs.color_palette else "natural colors"}
-Color Grading: {vs.color_grading}
-
-Lighting: {vs.lighting_setup}
-Mood: {vs.lighting_mood}
-
-Background: {vs.background_aesthetic}
-Focus: {vs.background_blur}
-
-Technical: {vs.technical_specs}
-Camera: {vs.camera_specs}
-
-IMPORTANT: This is the DETECTIVE - sharp, intelligent, investigative presence with perceptive gaze
-
-STRICT EXCLUSIONS (DO NOT INCLUDE):
-{chr(10).join(f"- {item}" for item in vs.negative_prompts)}
-"""
+        if style_block is not None:
+            parts.append(style_block)
+            parts.append(f"\n{spec.important_line}\n")
         else:
             # Fallback if no visual style
-            prompt += build_fallback_style_requirements(epoch, country, personality, "detective")
+            parts.append(
+                build_fallback_style_requirements(epoch, country, spec.personality, spec.kind)
+            )
 
-        return prompt
+        return "".join(parts)
 
     def _mock_output(self, state: GameState) -> GameState:
         """
@@ -328,23 +383,22 @@ STRICT EXCLUSIONS (DO NOT INCLUDE):
             State with mock image paths
         """
         game_id = state.meta.id[:8] if state.meta else "default"
-        output_dir = get_character_image_output_dir(game_id)
-        # Create directory structure even in dry-run mode for consistency
-        output_dir.mkdir(parents=True, exist_ok=True)
+        # Mock images are never written, so the directory isn't created
+        output_dir = get_character_image_output_dir(game_id).absolute()
 
         # Mock victim image
         if state.crime and state.crime.victim:
             victim = state.crime.victim
-            mock_filename = f"{victim.id}_{victim.name.lower().replace(' ', '_')}.png"
-            victim.image_path = str((output_dir / mock_filename).absolute())
+            mock_filename = f"{victim.id}_{sanitize_image_filename(victim.name)}.png"
+            victim.image_path = str(output_dir / mock_filename)
 
         # Mock detective image
         if state.host_guide and state.host_guide.host_act2_detective_role:
             detective = state.host_guide.host_act2_detective_role
             detective_id = f"detective-{state.meta.id[:8]}"
             mock_filename = (
-                f"{detective_id}_{detective.character_name.lower().replace(' ', '_')}.png"
+                f"{detective_id}_{sanitize_image_filename(detective.character_name)}.png"
             )
-            detective.image_path = str((output_dir / mock_filename).absolute())
+            detective.image_path = str(output_dir / mock_filename)
 
         return state
@@ -2,7 +2,13 @@
 
 from pydantic import BaseModel, Field
 
-from mystery_agents.models.state import ClueSpec, GameState, HostGuide
+from mystery_agents.models.state import (
+    ClueSolutionEntry,
+    ClueSpec,
+    DetectiveRole,
+    GameState,
+    HostGuide,
+)
 from mystery_agents.utils.cache import LLMCache
 from mystery_agents.utils.constants import (
     GAME_TONE_DESCRIPTION,
@@ -16,17 +22,9 @@ from mystery_agents.utils.constants import (
 )
 from mystery_agents.utils.prompts import A8_SYSTEM_PROMPT
 from mystery_agents.utils.state_helpers import (
-    safe_get_crime_method_description,
-    safe_get_crime_scene_description,
-    safe_get_crime_time_of_death,
-    safe_get_crime_victim_name,
-    safe_get_crime_victim_persona,
-    safe_get_crime_victim_role,
-    safe_get_crime_victim_secrets,
-    safe_get_crime_weapon,
-    safe_get_world_epoch,
-    safe_get_world_location_name,
-    safe_get_world_visual_keywords,
+    get_characters_by_id,
+    get_crime_fields,
+    get_world_fields,
 )
 
 from .base import BaseAgent
@@ -56,7 +54,7 @@ class ContentGenerationAgent(BaseAgent):
 
     def __init__(self) -> None:
         """Initialize the content generation agent."""
-        super().__init__(llm=LLMCache.get_model("tier2"), response_format=A8Output)
+        super().__init__(llm=lambda: LLMCache.get_model("tier2"), response_format=A8Output)
 
     def get_system_prompt(self, state: GameState) -> str:
         """
@@ -92,7 +90,7 @@ class ContentGenerationAgent(BaseAgent):
         killer = None
         if state.killer_selection:
             killer_id = state.killer_selection.killer_id
-            killer = next((c for c in state.characters if c.id == killer_id), None)
+            killer = get_characters_by_id(state).get(killer_id)
 
         characters_summary = []
         for char in state.characters:
@@ -101,6 +99,9 @@ class ContentGenerationAgent(BaseAgent):
                 f"- {char.name}{is_killer}: {char.role}, motive: {char.motive_for_crime}"
             )
 
+        world = get_world_fields(state)
+        crime = get_crime_fields(state)
+
         user_message = f"""Generate ALL written content for this mystery party game:
 
 GAME INFO:
@@ -111,16 +112,16 @@ GAME INFO:
 - Host gender: {state.config.host_gender}
 
 SETTING:
-- Location: {safe_get_world_location_name(state)}
-- Epoch: {safe_get_world_epoch(state)}
+- Location: {world.location_name}
+- Epoch: {world.epoch}
 - Country/Culture: {state.config.country}
-- Atmosphere: {safe_get_world_visual_keywords(state)}
+- Atmosphere: {world.visual_keywords}
 
 VICTIM (HOST'S ACT 1 ROLE):
-- Name: {safe_get_crime_victim_name(state)}
-- Role: {safe_get_crime_victim_role(state)}
-- Public persona: {safe_get_crime_victim_persona(state)}
-- Secrets: {safe_get_crime_victim_secrets(state)}
+- Name: {crime.victim_name}
+- Role: {crime.victim_role}
+- Public persona: {crime.victim_persona}
+- Secrets: {crime.victim_secrets}
 
 CHARACTERS (SUSPECTS):
 {chr(10).join(characters_summary) if characters_summary else "No characters"}
@@ -130,10 +131,10 @@ KILLER:
 - Killer knows identity: {state.config.killer_knows_identity}
 
 CRIME:
-- Method: {safe_get_crime_method_description(state)}
-- Weapon: {safe_get_crime_weapon(state)}
-- Time: {safe_get_crime_time_of_death(state)}
-- Location: {safe_get_crime_scene_description(state)}
+- Method: {crime.method_description}
+- Weapon: {crime.weapon}
+- Time: {crime.time_of_death}
+- Location: {crime.scene_description}
 
 SOLUTION:
 {state.killer_selection.truth_narrative if state.killer_selection else "No solution"}
@@ -152,8 +153,8 @@ REQUIREMENTS:
 
 **CRITICAL FOR ACT 2 INTRO SCRIPT**:
 - The act_2_intro_script MUST include the CAUSE OF DEATH clearly
-- Murder method type: {safe_get_crime_method_description(state)}
-- Weapon: {safe_get_crime_weapon(state)}
+- Murder method type: {crime.method_description}
+- Weapon: {crime.weapon}
 - Players need to know if it was: stabbing, poisoning, blunt force trauma, shooting, etc.
 - Example: "The victim has been found in the study with a stab wound to the back" or "Signs point to poisoning - the victim collapsed after drinking"
 
@@ -178,13 +179,6 @@ Return the response in the exact JSON format specified in the system prompt.
 
     def _mock_output(self, state: GameState) -> GameState:
         """Generate mock data for dry run mode."""
-        from mystery_agents.models.state import (
-            ClueSolutionEntry,
-            ClueSpec,
-            DetectiveRole,
-            HostGuide,
-        )
-
         # Mock host guide
         state.host_guide = HostGuide(
             spoiler_free_intro=f"Welcome to {MOCK_WORLD_NAME}! A mystery awaits...",
@@ -1,7 +1,9 @@
 """A9: Packaging Agent - Organizes final deliverables."""
 
 import os
+import shutil
 import zipfile
+from collections.abc import Mapping
 from concurrent.futures import ProcessPoolExecutor
 from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
@@ -33,7 +35,10 @@ from mystery_agents.utils.i18n import (
 )
 from mystery_agents.utils.logging_config import AgentLogger
 from mystery_agents.utils.prompts import A9_SYSTEM_PROMPT
-from mystery_agents.utils.state_helpers import safe_get_world_location_name
+from mystery_agents.utils.state_helpers import (
+    get_characters_by_id,
+    safe_get_world_location_name,
+)
 
 from .base import BaseAgent
 
@@ -91,7 +96,7 @@ class PackagingAgent(BaseAgent):
 
     def __init__(self) -> None:
         """Initialize the packaging agent."""
-        super().__init__(llm=LLMCache.get_model("tier3"))
+        super().__init__(llm=lambda: LLMCache.get_model("tier3"), system_prompt=A9_SYSTEM_PROMPT)
 
     def _get_game_context(self, state: GameState) -> tuple[str, str]:
         """
@@ -117,18 +122,6 @@ class PackagingAgent(BaseAgent):
 
         return era, location_detail
 
-    def get_system_prompt(self, state: GameState) -> str:
-        """
-        Get the system prompt for packaging.
-
-        Args:
-            state: Current game state
-
-        Returns:
-            System prompt string
-        """
-        return A9_SYSTEM_PROMPT
-
     def _generate_all_pdfs(
         self,
         pdf_tasks: list[tuple[Path, Path]],
@@ -487,7 +480,7 @@ ZIP file: {zip_path}
         killer = None
         if state.killer_selection:
             killer_id = state.killer_selection.killer_id
-            killer = next((c for c in state.characters if c.id == killer_id), None)
+            killer = get_characters_by_id(state).get(killer_id)
 
         content = f"""# {labels["solution_title"]}
 
@@ -510,7 +503,7 @@ ZIP file: {zip_path}
 
         path.write_text(content, encoding="utf-8")
 
-    def _format_timeline(self, state: GameState, labels: dict[str, str]) -> str:
+    def _format_timeline(self, state: GameState, labels: Mapping[str, str]) -> str:
         """Format the timeline with complete event details including the murder."""
         timeline = state.timeline_global
         if not timeline or not timeline.time_blocks:
@@ -657,11 +650,10 @@ ZIP file: {zip_path}
         # Build relationships section
         character_relationships = []
         if state.relationships:
+            characters_by_id = get_characters_by_id(state)
             for rel in state.relationships:
                 if rel.from_character_id == character.id:
-                    other_char = next(
-                        (c for c in state.characters if c.id == rel.to_character_id), None
-                    )
+                    other_char = characters_by_id.get(rel.to_character_id)
                     if other_char:
                         translated_rel_type = translate_relationship_type(
                             rel.type, state.config.language
@@ -675,9 +667,7 @@ ZIP file: {zip_path}
                             )
                         character_relationships.append(relationship_desc)
                 elif rel.to_character_id == character.id:
-                    other_char = next(
-                        (c for c in state.characters if c.id == rel.from_character_id), None
-                    )
+                    other_char = characters_by_id.get(rel.from_character_id)
                     if other_char:
                         translated_rel_type = translate_relationship_type(
                             rel.type, state.config.language
@@ -999,8 +989,6 @@ Tu objetivo es **evitar ser descubierto** durante la investigación:
             output_dir: Base output directory
             log: Logger instance
         """
-        import shutil
-
         log.info("  Organizing final package (PDFs only)...")
 
         # Collect all markdown, image, and text files
@@ -1,57 +1,174 @@
 """Base agent class for all game generation agents."""
 
-from abc import ABC, abstractmethod
-from typing import Any
+import inspect
+import logging
+from collections.abc import Callable
+from functools import cached_property, lru_cache
+from typing import Any, cast
 
 from langchain.agents import create_agent
 from langchain_core.language_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.runnables import Runnable
 from pydantic import BaseModel
 
 from mystery_agents.models.state import GameState
 from mystery_agents.utils.constants import LANG_CODE_ENGLISH
 from mystery_agents.utils.debug_middleware import log_model_response
 from mystery_agents.utils.i18n import get_language_name
+from mystery_agents.utils.response_cache import (
+    load_cached_response,
+    response_cache_key,
+    store_cached_response,
+)
 
+logger = logging.getLogger(__name__)
 
-class BaseAgent(ABC):
+LLMFactory = Callable[[], BaseChatModel]
+
+
+@lru_cache(maxsize=8)
+def _language_injection(language: str) -> str:
+    """
+    Build the language instructions injected into system prompts.
+
+    The text only depends on the language, so it's built once per language.
+
+    Args:
+        language: Target language code
+
+    Returns:
+        Language injection string (empty for English)
+    """
+    if language == LANG_CODE_ENGLISH:
+        return ""
+
+    target_lang = get_language_name(language)
+
+    return f"""
+
+---
+CRITICAL LANGUAGE REQUIREMENTS (HIGHEST PRIORITY):
+
+1. Output Language: ALL creative and narrative content (descriptions, dialogues,
+   names, backstories, secrets, motives, etc.) MUST be written in fluent,
+   natural {target_lang}.
+
+2. JSON Structure Integrity: Keep ALL JSON keys in English.
+   NEVER translate field names.
+   ✓ CORRECT: {{"description": "Texto en español"}}
+   ✗ WRONG:   {{"descripción": "Texto en español"}}
+
+3. Context Consistency: Input context may already be in {target_lang}.
+   Maintain narrative consistency and continue in that language.
+
+4. Cultural Adaptation: Use culturally appropriate expressions, idioms,
+   and references for {target_lang} speakers.
+
+These requirements override any language assumptions in the instructions above.
+"""
+
+
+class BaseAgent:
     """
     Base class for all agents in the mystery game generation system.
 
     Uses provider-agnostic BaseChatModel to support any LLM provider.
     """
 
-    def __init__(self, llm: BaseChatModel, response_format: type[BaseModel] | None = None) -> None:
+    def __init__(
+        self,
+        llm: BaseChatModel | LLMFactory,
+        response_format: type[BaseModel] | None = None,
+        system_prompt: str | None = None,
+    ) -> None:
         """
         Initialize the base agent.
 
+        The model and its structured-output binding are created lazily on first
+        use, so agents that are built but never invoked (dry-run, partial flows,
+        image agents) don't pay for LLM client instantiation.
+
         Args:
-            llm: The language model to use (provider-agnostic BaseChatModel)
+            llm: The language model to use (provider-agnostic BaseChatModel),
+                 or a zero-argument callable returning it
             response_format: Optional Pydantic model for structured output
+            system_prompt: Static system prompt. Agents whose prompt depends on
+                           the game state override get_system_prompt instead.
         """
-        self.llm = llm
+        self._llm_source = llm
         self.response_format = response_format
+        self._system_prompt = system_prompt
+        self._full_system_prompts: dict[str, str] = {}
+
+    @cached_property
+    def llm(self) -> BaseChatModel:
+        """
+        Get the language model, creating it from the factory on first access.
 
-        # Create agent without middleware (will be added dynamically in invoke if debug is enabled)
-        self.agent = create_agent(
-            model=llm,
+        Returns:
+            The language model used by this agent
+        """
+        source = self._llm_source
+        if inspect.isroutine(source):
+            return cast(LLMFactory, source)()
+        return cast(BaseChatModel, source)
+
+    @cached_property
+    def structured_llm(self) -> Runnable[list[BaseMessage], Any]:
+        """
+        Get the model bound to this agent's response format, creating it on first access.
+
+        Agents have no tools, so the model is called directly instead of through
+        a LangChain agent graph; invocations with debug_model enabled use
+        debug_agent instead.
+
+        Returns:
+            Runnable returning the structured response (or an AIMessage without response_format)
+        """
+        if self.response_format is None:
+            return self.llm
+        return self.llm.with_structured_output(self.response_format)
+
+    @cached_property
+    def debug_agent(self) -> Any:
+        """
+        Get the LangChain agent with debug middleware, creating it on first access.
+
+        The middleware hooks into the agent graph, so this is the only path that
+        still goes through create_agent. Only used when debug_model is enabled.
+
+        Returns:
+            Compiled agent that logs model responses
+        """
+        return create_agent(
+            model=self.llm,
             tools=[],
-            middleware=[],
-            response_format=response_format,
+            middleware=[log_model_response],
+            response_format=self.response_format,
         )
 
-    @abstractmethod
     def get_system_prompt(self, state: GameState) -> str:
         """
         Get the system prompt for this agent.
 
+        Returns the static prompt passed to __init__. Override for prompts
+        that depend on the game state.
+
         Args:
             state: Current game state
 
         Returns:
             System prompt string
+
+        Raises:
+            NotImplementedError: If no static prompt was given and the agent doesn't override this
         """
-        pass
+        if self._system_prompt is None:
+            raise NotImplementedError(
+                f"{type(self).__name__} must pass system_prompt or override get_system_prompt"
+            )
+        return self._system_prompt
 
     def _mock_output(self, state: GameState) -> GameState:
         """
@@ -93,55 +210,49 @@ class BaseAgent(ABC):
         Returns:
             Language injection string (empty for English)
         """
-        if state.config.language == LANG_CODE_ENGLISH:
-            return ""
-
-        target_lang = get_language_name(state.config.language)
-
-        return f"""
+        return _language_injection(state.config.language)
 
----
-CRITICAL LANGUAGE REQUIREMENTS (HIGHEST PRIORITY):
-
-1. Output Language: ALL creative and narrative content (descriptions, dialogues,
-   names, backstories, secrets, motives, etc.) MUST be written in fluent,
-   natural {target_lang}.
-
-2. JSON Structure Integrity: Keep ALL JSON keys in English.
-   NEVER translate field names.
-   ✓ CORRECT: {{"description": "Texto en español"}}
-   ✗ WRONG:   {{"descripción": "Texto en español"}}
-
-3. Context Consistency: Input context may already be in {target_lang}.
-   Maintain narrative consistency and continue in that language.
+    def _get_full_system_prompt(self, state: GameState) -> str:
+        """
+        Get the system prompt with the language injection appended.
 
-4. Cultural Adaptation: Use culturally appropriate expressions, idioms,
-   and references for {target_lang} speakers.
+        For agents with a static prompt the result only depends on the
+        language, so it's built once per language and reused.
 
-These requirements override any language assumptions in the instructions above.
-"""
+        Args:
+            state: Current game state
 
-    def invoke(self, state: GameState, user_message: str = "") -> Any:
+        Returns:
+            Full system prompt for this invocation
         """
-        Invoke the agent with the current state.
-
-        For non-English languages, automatically injects language instructions
-        to generate content directly in the target language.
+        language = state.config.language
+        if (
+            self._system_prompt is None
+            or type(self).get_system_prompt is not BaseAgent.get_system_prompt
+        ):
+            return self.get_system_prompt(state) + _language_injection(language)
+
+        full_prompt = self._full_system_prompts.get(language)
+        if full_prompt is None:
+            full_prompt = self._system_prompt + _language_injection(language)
+            self._full_system_prompts[language] = full_prompt
+        return full_prompt
+
+    def _build_messages(self, state: GameState, user_message: str) -> list[BaseMessage]:
+        """
+        Build the system and user messages for an invocation.
 
         Args:
             state: Current game state
             user_message: Optional user message (defaults to empty for auto-generation)
 
         Returns:
-            LLM response (structured if response_format is set, otherwise raw)
-            For structured output, access via result["structured_response"]
+            List of messages to send to the agent
         """
         # Get base system prompt and inject language instructions if needed
-        system_prompt = self.get_system_prompt(state)
-        language_injection = self._get_language_injection(state)
-        full_system_prompt = system_prompt + language_injection
+        full_system_prompt = self._get_full_system_prompt(state)
 
-        messages = [
+        return [
             SystemMessage(content=full_system_prompt),
             HumanMessage(
                 content=user_message
@@ -150,19 +261,88 @@ These requirements override any language assumptions in the instructions above.
             ),
         ]
 
-        # Use agent with debug middleware if debug_model is enabled
-        agent_to_use = self.agent
-        if state.config.debug_model and self.response_format:
-            # Create agent with debug middleware for this invocation
-            agent_to_use = create_agent(
-                model=self.llm,
-                tools=[],
-                middleware=[log_model_response],
-                response_format=self.response_format,
-            )
+    def _use_debug_agent(self, state: GameState) -> bool:
+        """
+        Check whether an invocation should go through the debug middleware agent.
+
+        Args:
+            state: Current game state
+
+        Returns:
+            True if debug_model is enabled and a structured response is expected
+        """
+        return state.config.debug_model and self.response_format is not None
+
+    def _response_cache_key(
+        self, state: GameState, messages: list[BaseMessage], sample: int | None = None
+    ) -> str | None:
+        """
+        Get the response cache key for an invocation, if caching applies.
+
+        Only structured responses are cached. The retry counters are part of
+        the key: retries send the same prompts, and must not get back the
+        response that just failed validation. For the same reason, independent
+        samples of the same prompt are told apart by their sample index.
+
+        Args:
+            state: Current game state
+            messages: Messages for this invocation
+            sample: Index of this sample when the same prompt is sampled several times
+
+        Returns:
+            Cache key, or None if the response cache is disabled or not applicable
+        """
+        if not state.config.enable_response_cache or self.response_format is None:
+            return None
+
+        retries = f"world_retry={state.world_retry_count},retry={state.retry_count}"
+        if sample is not None:
+            retries += f",sample={sample}"
+        return response_cache_key(
+            str(getattr(self.llm, "model", type(self.llm).__name__)),
+            str(getattr(self.llm, "temperature", "")),
+            self.response_format.__name__,
+            retries,
+            *(str(message.content) for message in messages),
+        )
 
-        result: dict[str, Any] = agent_to_use.invoke({"messages": messages})  # type: ignore[arg-type]
+    def _extract_model_response(self, output: Any) -> Any:
+        """
+        Extract the agent's output from a structured_llm result.
+
+        Args:
+            output: Result returned by structured_llm
 
+        Returns:
+            Structured response if response_format is set, otherwise the message content
+
+        Raises:
+            ValueError: If a structured response was expected but not returned
+        """
+        if self.response_format:
+            if output is None:
+                raise ValueError(
+                    "No structured response returned. "
+                    "The LLM returned text instead of the required structured format."
+                )
+            return output
+
+        return output.content
+
+    def _extract_response(self, state: GameState, result: dict[str, Any]) -> Any:
+        """
+        Extract the agent's output from a raw debug_agent result.
+
+        Args:
+            state: Current game state
+            result: Raw result returned by debug_agent
+
+        Returns:
+            Structured response if response_format is set, otherwise the last message content
+
+        Raises:
+            ValueError: If a structured response was expected but not returned
+        """
         if self.response_format:
             if "structured_response" in result:
                 return result["structured_response"]
@@ -171,21 +351,90 @@ These requirements override any language assumptions in the instructions above.
                     "No structured_response in agent result. "
                     "The LLM returned text instead of the required structured format."
                 )
-                if state.config.debug_model:
+                if state.config.debug_model and logger.isEnabledFor(logging.DEBUG):
                     # Provide detailed error info when debug is enabled
-                    print(f"[DEBUG] ✗ {error_msg}")
-                    print(f"[DEBUG] Available state keys: {list(result.keys())}")
+                    logger.debug(f"✗ {error_msg}")
+                    logger.debug(f"Available state keys: {list(result.keys())}")
                     if "messages" in result and result["messages"]:
                         last_msg = result["messages"][-1]
-                        print(f"[DEBUG] Last message type: {type(last_msg).__name__}")
+                        logger.debug(f"Last message type: {type(last_msg).__name__}")
                         if hasattr(last_msg, "content"):
                             content = last_msg.content
                             if isinstance(content, str):
-                                print(f"[DEBUG] Response Content:\n{'-' * 80}\n{content[:1000]}")
+                                logger.debug(f"Response Content:\n{'-' * 80}\n{content[:1000]}")
                                 if len(content) > 1000:
-                                    print(f"\n... (truncated, total length: {len(content)} chars)")
+                                    logger.debug(
+                                        f"... (truncated, total length: {len(content)} chars)"
+                                    )
                             else:
-                                print(f"[DEBUG] Response Content: {content}")
+                                logger.debug(f"Response Content: {content}")
                 raise ValueError(error_msg)
 
         return result["messages"][-1].content if result.get("messages") else result
+
+    def invoke(self, state: GameState, user_message: str = "") -> Any:
+        """
+        Invoke the agent with the current state.
+
+        For non-English languages, automatically injects language instructions
+        to generate content directly in the target language.
+
+        Args:
+            state: Current game state
+            user_message: Optional user message (defaults to empty for auto-generation)
+
+        Returns:
+            LLM response (structured if response_format is set, otherwise the message content)
+        """
+        messages = self._build_messages(state, user_message)
+        cache_key = self._response_cache_key(state, messages)
+        if cache_key and self.response_format:
+            cached = load_cached_response(cache_key, self.response_format)
+            if cached is not None:
+                return cached
+
+        if self._use_debug_agent(state):
+            result = self.debug_agent.invoke({"messages": messages})
+            response = self._extract_response(state, result)
+        else:
+            response = self._extract_model_response(self.structured_llm.invoke(messages))
+
+        if cache_key:
+            store_cached_response(cache_key, response)
+        return response
+
+    async def ainvoke(
+        self, state: GameState, user_message: str = "", sample: int | None = None
+    ) -> Any:
+        """
+        Invoke the agent asynchronously with the current state.
+
+        Same as invoke, but awaits the LLM call so independent agents can
+        overlap their network latency (e.g. with asyncio.gather).
+
+        Args:
+            state: Current game state
+            user_message: Optional user message (defaults to empty for auto-generation)
+            sample: Index of this sample when the same prompt is sampled several
+                    times concurrently, so each sample gets its own cache entry
+
+        Returns:
+            LLM response (structured if response_format is set, otherwise the message content)
+        """
+        messages = self._build_messages(state, user_message)
+        cache_key = self._response_cache_key(state, messages, sample)
+        if cache_key and self.response_format:
+            cached = load_cached_response(cache_key, self.response_format)
+            if cached is not None:
+                return cached
+
+        if self._use_debug_agent(state):
+            result = await self.debug_agent.ainvoke({"messages": messages})
+            response = self._extract_response(state, result)
+        else:
+            output = await self.structured_llm.ainvoke(messages)
+            response = self._extract_model_response(output)
+
+        if cache_key:
+            store_cached_response(cache_key, response)
+        return response
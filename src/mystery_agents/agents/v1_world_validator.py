@@ -2,7 +2,7 @@
 
 from pydantic import BaseModel, Field
 
-from mystery_agents.models.state import GameState
+from mystery_agents.models.state import GameState, WorldValidation
 from mystery_agents.utils.cache import LLMCache
 from mystery_agents.utils.constants import GAME_TONE_STYLE
 from mystery_agents.utils.prompts import V1_WORLD_VALIDATOR_SYSTEM_PROMPT
@@ -37,19 +37,11 @@ class WorldValidatorAgent(BaseAgent):
 
     def __init__(self) -> None:
         """Initialize the world validator agent."""
-        super().__init__(llm=LLMCache.get_model("tier2"), response_format=V1Output)
-
-    def get_system_prompt(self, state: GameState) -> str:
-        """
-        Get the system prompt for world validation.
-
-        Args:
-            state: Current game state
-
-        Returns:
-            System prompt string
-        """
-        return V1_WORLD_VALIDATOR_SYSTEM_PROMPT
+        super().__init__(
+            llm=lambda: LLMCache.get_model("tier2"),
+            response_format=V1Output,
+            system_prompt=V1_WORLD_VALIDATOR_SYSTEM_PROMPT,
+        )
 
     def run(self, state: GameState) -> GameState:
         """
@@ -149,8 +141,6 @@ Return the validation result in JSON format."""
         result = self.invoke(state, user_message)
 
         # Store validation result in state
-        from mystery_agents.models.state import WorldValidation
-
         state.world_validation = WorldValidation(
             is_coherent=result.is_coherent,
             issues=result.issues,
@@ -161,8 +151,6 @@ Return the validation result in JSON format."""
 
     def _mock_output(self, state: GameState) -> GameState:
         """Generate mock validation for dry run mode."""
-        from mystery_agents.models.state import WorldValidation
-
         state.world_validation = WorldValidation(
             is_coherent=True,
             issues=[],
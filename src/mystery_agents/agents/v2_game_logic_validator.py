@@ -1,19 +1,52 @@
 """V2: Game Logic Validator - Validates complete game logic consistency."""
 
-from mystery_agents.models.state import GameState, ValidationReport
+import asyncio
+
+from mystery_agents.models.state import GameState, ValidationIssue, ValidationReport
 from mystery_agents.utils.cache import LLMCache
+from mystery_agents.utils.constants import VALIDATOR_ENSEMBLE_SIZE
 from mystery_agents.utils.prompts import V2_GAME_LOGIC_VALIDATOR_SYSTEM_PROMPT
 from mystery_agents.utils.state_helpers import (
-    safe_get_crime_method_description,
-    safe_get_crime_scene_room_id,
-    safe_get_crime_time_of_death,
-    safe_get_crime_victim_name,
-    safe_get_crime_victim_role,
-    safe_get_crime_weapon,
+    get_characters_by_id,
+    get_crime_fields,
 )
 
 from .base import BaseAgent
 
+# Dry-run report (always pass); ValidationReport is frozen, so one instance is shared
+_MOCK_VALIDATION_REPORT = ValidationReport(is_consistent=True, issues=[], suggested_fixes=[])
+
+
+def _merge_reports(reports: list[ValidationReport]) -> ValidationReport:
+    """
+    Combine independent validation samples by majority vote.
+
+    The verdict is the majority of is_consistent (ties fail validation). Issues and
+    suggested fixes are only taken from the samples that agree with the verdict,
+    de-duplicated in order.
+
+    Args:
+        reports: Validation reports from independent samples
+
+    Returns:
+        Merged validation report
+    """
+    is_consistent = sum(report.is_consistent for report in reports) * 2 > len(reports)
+    agreeing = [report for report in reports if report.is_consistent == is_consistent]
+
+    issues: dict[tuple[str, str], ValidationIssue] = {}
+    suggested_fixes: dict[str, None] = {}
+    for report in agreeing:
+        for issue in report.issues:
+            issues.setdefault((issue.type, issue.description), issue)
+        suggested_fixes.update(dict.fromkeys(report.suggested_fixes))
+
+    return ValidationReport(
+        is_consistent=is_consistent,
+        issues=list(issues.values()),
+        suggested_fixes=list(suggested_fixes),
+    )
+
 
 class GameLogicValidatorAgent(BaseAgent):
     """
@@ -27,59 +60,107 @@ class GameLogicValidatorAgent(BaseAgent):
 
     def __init__(self) -> None:
         """Initialize the game logic validator agent."""
-        super().__init__(llm=LLMCache.get_model("tier1"), response_format=ValidationReport)
+        super().__init__(
+            llm=lambda: LLMCache.get_model("tier1"),
+            response_format=ValidationReport,
+            system_prompt=V2_GAME_LOGIC_VALIDATOR_SYSTEM_PROMPT,
+        )
 
-    def get_system_prompt(self, state: GameState) -> str:
+    def run(self, state: GameState) -> GameState:
         """
-        Get the system prompt for game logic validation.
+        Validate the game state for logical consistency.
+
+        Args:
+            state: Current game state with all components
+
+        Returns:
+            Updated game state with validation report
+        """
+        # If dry run, return mock validation (always pass)
+        if self._should_use_mock(state):
+            return self._mock_output(state)
+
+        user_message = self._build_user_message(state)
+
+        # Invoke LLM with structured output
+        if state.config.validator_ensemble:
+            result = asyncio.run(self._ainvoke_ensemble(state, user_message))
+        else:
+            result = self.invoke(state, user_message)
+
+        # Update state
+        state.validation = result
+
+        return state
+
+    async def _ainvoke_ensemble(self, state: GameState, user_message: str) -> ValidationReport:
+        """
+        Sample the validator several times concurrently and merge the verdicts.
+
+        Each sample has its own response cache entry, so cached runs still vote
+        over independent samples.
 
         Args:
             state: Current game state
+            user_message: Validation prompt shared by all samples
 
         Returns:
-            System prompt string
+            Majority-vote validation report
         """
-        return V2_GAME_LOGIC_VALIDATOR_SYSTEM_PROMPT
+        reports = await asyncio.gather(
+            *(
+                self.ainvoke(state, user_message, sample=sample)
+                for sample in range(VALIDATOR_ENSEMBLE_SIZE)
+            )
+        )
+        return _merge_reports(list(reports))
 
-    def run(self, state: GameState) -> GameState:
+    def _build_user_message(self, state: GameState) -> str:
         """
-        Validate the game state for logical consistency.
+        Build the validation prompt from the complete game state.
+
+        Only called on the LLM path, so dry runs skip the context assembly.
 
         Args:
             state: Current game state with all components
 
         Returns:
-            Updated game state with validation report
+            User message for the validator
         """
-        # If dry run, return mock validation (always pass)
-        if self._should_use_mock(state):
-            return self._mock_output(state)
-
         # Prepare comprehensive context for validation
-        victim_name = safe_get_crime_victim_name(state)
+        crime = get_crime_fields(state)
         killer_name = "Unknown"
         if state.killer_selection:
             killer_id = state.killer_selection.killer_id
-            killer = next((c for c in state.characters if c.id == killer_id), None)
+            killer = get_characters_by_id(state).get(killer_id)
             killer_name = killer.name if killer else "Unknown"
 
-        timeline_events = []
-        if state.timeline_global and state.timeline_global.time_blocks:
-            for block in state.timeline_global.time_blocks:
-                for event in block.events:
-                    timeline_events.append(
-                        f"[{block.start}-{block.end}] {event.time_approx}: {event.description} (characters: {event.character_ids_involved}, room: {event.room_id or 'N/A'})"
-                    )
-
-        characters_summary = []
-        for char in state.characters:
-            characters_summary.append(
+        blocks = state.timeline_global.time_blocks if state.timeline_global else []
+        event_count = sum(len(block.events) for block in blocks)
+        timeline_str = (
+            "\n".join(
+                f"[{block.start}-{block.end}] {event.time_approx}: {event.description} (characters: {event.character_ids_involved}, room: {event.room_id or 'N/A'})"
+                for block in blocks
+                for event in block.events
+            )
+            or "No timeline events"
+        )
+
+        characters_summary = (
+            "\n".join(
                 f"- {char.name} (ID: {char.id}): {char.role}, motive: {char.motive_for_crime}"
+                for char in state.characters
             )
+            or "No characters"
+        )
 
         # Include full truth narrative for context
         truth_narrative = ""
         if state.killer_selection:
+            modified_events = (
+                "\n".join(f"- {event}" for event in state.killer_selection.modified_events)
+                or "- None"
+            )
             truth_narrative = f"""
 COMPLETE TRUTH NARRATIVE:
 {state.killer_selection.truth_narrative}
@@ -88,10 +169,10 @@ KILLER RATIONALE:
 {state.killer_selection.rationale}
 
 MODIFIED EVENTS (if any):
-{chr(10).join(f"- {event}" for event in state.killer_selection.modified_events) if state.killer_selection.modified_events else "- None"}
+{modified_events}
 """
 
-        user_message = f"""Validate this mystery party game for logical consistency:
+        return f"""Validate this mystery party game for logical consistency:
 
 GAME CONFIGURATION:
 - Difficulty: {state.config.difficulty}
@@ -99,22 +180,22 @@ GAME CONFIGURATION:
 - Duration: {state.config.duration_minutes} minutes
 
 VICTIM (HOST):
-- {victim_name}: {safe_get_crime_victim_role(state)}
+- {crime.victim_name}: {crime.victim_role}
 
 KILLER (SELECTED):
 - {killer_name} (ID: {state.killer_selection.killer_id if state.killer_selection else "N/A"})
 
 SUSPECTS:
-{chr(10).join(characters_summary) if characters_summary else "No characters"}
+{characters_summary}
 
 CRIME:
-- Method: {safe_get_crime_method_description(state)}
-- Weapon: {safe_get_crime_weapon(state)}
-- Location: {safe_get_crime_scene_room_id(state)}
-- Time: {safe_get_crime_time_of_death(state)}
+- Method: {crime.method_description}
+- Weapon: {crime.weapon}
+- Location: {crime.scene_room_id}
+- Time: {crime.time_of_death}
 
-COMPLETE TIMELINE ({len(timeline_events)} events):
-{chr(10).join(timeline_events) if timeline_events else "No timeline events"}
+COMPLETE TIMELINE ({event_count} events):
+{timeline_str}
 {truth_narrative}
 
 REQUIREMENTS:
@@ -141,15 +222,7 @@ IMPORTANT:
 Return the response in the exact JSON format specified in the system prompt.
 """
 
-        # Invoke LLM with structured output
-        result = self.invoke(state, user_message)
-
-        # Update state
-        state.validation = result
-
-        return state
-
     def _mock_output(self, state: GameState) -> GameState:
         """Generate mock validation (always pass) for dry run mode."""
-        state.validation = ValidationReport(is_consistent=True, issues=[], suggested_fixes=[])
+        state.validation = _MOCK_VALIDATION_REPORT
         return state
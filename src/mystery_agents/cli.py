@@ -33,7 +33,7 @@ from mystery_agents.utils.constants import DEFAULT_OUTPUT_DIR
     "--debug",
     is_flag=True,
     default=False,
-    help="Enable debug mode to log model responses (useful for troubleshooting)",
+    help="Log model responses to stderr, in any verbosity mode (useful for troubleshooting)",
 )
 @click.option(
     "--no-images",
@@ -41,6 +41,24 @@ from mystery_agents.utils.constants import DEFAULT_OUTPUT_DIR
     default=False,
     help="Skip character portrait image generation (images are generated by default)",
 )
+@click.option(
+    "--image-cache",
+    is_flag=True,
+    default=False,
+    help="Reuse previously generated portraits for identical prompts (skips repeated API calls)",
+)
+@click.option(
+    "--response-cache",
+    is_flag=True,
+    default=False,
+    help="Reuse LLM responses from previous runs with identical inputs (skips repeated API calls)",
+)
+@click.option(
+    "--validator-ensemble",
+    is_flag=True,
+    default=False,
+    help="Validate game logic with several concurrent LLM samples and a majority vote",
+)
 @click.option(
     "--keep-work-dir",
     is_flag=True,
@@ -71,6 +89,9 @@ def generate(
     dry_run: bool,
     debug: bool,
     no_images: bool,
+    image_cache: bool,
+    response_cache: bool,
+    validator_ensemble: bool,
     keep_work_dir: bool,
     verbose: int,
     quiet: bool,
@@ -108,7 +129,12 @@ def generate(
     # Setup logging system
     from mystery_agents.utils.logging_config import setup_logging
 
-    setup_logging(verbosity=verbose, quiet=quiet, log_file=str(log_file) if log_file else None)
+    setup_logging(
+        verbosity=verbose,
+        quiet=quiet,
+        log_file=str(log_file) if log_file else None,
+        debug_model=debug,
+    )
 
     click.echo("\n" + "=" * 60)
     click.echo("       MYSTERY PARTY GAME GENERATOR")
@@ -152,6 +178,9 @@ def generate(
         config=GameConfig(
             players=PlayerConfig(total=6),
             generate_images=generate_images,
+            enable_image_cache=image_cache,
+            enable_response_cache=response_cache,
+            validator_ensemble=validator_ensemble,
             dry_run=dry_run,
             debug_model=debug,
             duration_minutes=90,
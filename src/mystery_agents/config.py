@@ -1,7 +1,8 @@
 """LLM configuration for multi-tier agent system."""
 
 import os
-from typing import Literal
+from functools import lru_cache
+from typing import Literal, NamedTuple
 
 from langchain_core.language_models import BaseChatModel
 from langchain_google_genai import ChatGoogleGenerativeAI
@@ -16,6 +17,54 @@ from mystery_agents.utils.constants import (
     LLM_TEMPERATURE_TIER3,
 )
 
+# Default (model, temperature) per tier, overridable via environment variables
+_TIER_DEFAULTS: dict[str, tuple[str, float]] = {
+    "tier1": (LLM_MODEL_TIER1, LLM_TEMPERATURE_TIER1),
+    "tier2": (LLM_MODEL_TIER2, LLM_TEMPERATURE_TIER2),
+    "tier3": (LLM_MODEL_TIER3, LLM_TEMPERATURE_TIER3),
+}
+
+
+class _TierSpec(NamedTuple):
+    """Resolved model name and temperature for one tier."""
+
+    model: str
+    temperature: float
+
+
+class _LLMSettings(NamedTuple):
+    """LLM settings resolved from the environment."""
+
+    api_key: str
+    tiers: dict[str, _TierSpec]
+
+
+@lru_cache(maxsize=1)
+def _load_llm_settings() -> _LLMSettings:
+    """
+    Read the LLM environment variables once per process.
+
+    Resolved on first use rather than at import, so variables loaded from
+    .env by the CLI are still picked up.
+
+    Returns:
+        API key and per-tier model settings
+    """
+    # In dry_run mode, agents use mocks, so API key not needed
+    # Use a dummy key that will fail gracefully if actually used
+    api_key = os.getenv("GOOGLE_API_KEY") or DRY_RUN_DUMMY_API_KEY
+
+    tiers = {
+        tier: _TierSpec(
+            model=os.getenv(f"LLM_MODEL_{tier.upper()}", default_model),
+            temperature=float(
+                os.getenv(f"LLM_TEMPERATURE_{tier.upper()}", str(default_temperature))
+            ),
+        )
+        for tier, (default_model, default_temperature) in _TIER_DEFAULTS.items()
+    }
+    return _LLMSettings(api_key=api_key, tiers=tiers)
+
 
 class LLMConfig:
     """
@@ -51,39 +100,14 @@ class LLMConfig:
             Model names and temperatures can be overridden via environment variables:
             - LLM_MODEL_TIER1, LLM_MODEL_TIER2, LLM_MODEL_TIER3
             - LLM_TEMPERATURE_TIER1, LLM_TEMPERATURE_TIER2, LLM_TEMPERATURE_TIER3
-            Default values are configured in constants.py
+            Default values are configured in constants.py. The environment is
+            read once, on the first call.
         """
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
-            # In dry_run mode, agents use mocks, so API key not needed
-            # Use a dummy key that will fail gracefully if actually used
-            api_key = DRY_RUN_DUMMY_API_KEY
-
-        # Get model names from environment or use defaults
-        model_tier1 = os.getenv("LLM_MODEL_TIER1", LLM_MODEL_TIER1)
-        model_tier2 = os.getenv("LLM_MODEL_TIER2", LLM_MODEL_TIER2)
-        model_tier3 = os.getenv("LLM_MODEL_TIER3", LLM_MODEL_TIER3)
-
-        # Get temperatures from environment or use defaults
-        temp_tier1 = float(os.getenv("LLM_TEMPERATURE_TIER1", str(LLM_TEMPERATURE_TIER1)))
-        temp_tier2 = float(os.getenv("LLM_TEMPERATURE_TIER2", str(LLM_TEMPERATURE_TIER2)))
-        temp_tier3 = float(os.getenv("LLM_TEMPERATURE_TIER3", str(LLM_TEMPERATURE_TIER3)))
-
-        models: dict[str, BaseChatModel] = {
-            "tier1": ChatGoogleGenerativeAI(
-                model=model_tier1,
-                google_api_key=api_key,
-                temperature=temp_tier1,
-            ),
-            "tier2": ChatGoogleGenerativeAI(
-                model=model_tier2,
-                google_api_key=api_key,
-                temperature=temp_tier2,
-            ),
-            "tier3": ChatGoogleGenerativeAI(
-                model=model_tier3,
-                google_api_key=api_key,
-                temperature=temp_tier3,
-            ),
-        }
-        return models[tier]
+        settings = _load_llm_settings()
+        spec = settings.tiers[tier]
+
+        return ChatGoogleGenerativeAI(
+            model=spec.model,
+            google_api_key=settings.api_key,
+            temperature=spec.temperature,
+        )
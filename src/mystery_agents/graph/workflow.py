@@ -1,5 +1,6 @@
 """LangGraph workflow for mystery party game generation."""
 
+import asyncio
 from typing import Any, Literal, cast
 
 from langgraph.graph import END, START, StateGraph
@@ -58,31 +59,34 @@ def v1_world_validator_node(state: GameState) -> GameState:
     return cast(GameState, result)
 
 
-def a2_5_visual_style_node(state: GameState) -> GameState:
-    """A2.5: Visual style generation node."""
+def a2_5_a3_style_and_characters_node(state: GameState) -> GameState:
+    """
+    A2.5 + A3: Visual style and characters generation node.
+
+    Both agents only depend on the validated world, so their LLM calls run
+    concurrently instead of back to back.
+    """
     from mystery_agents.agents.a2_5_visual_style import VisualStyleAgent
+    from mystery_agents.agents.a3_characters import CharactersAgent
 
-    log = AgentLogger("a2_5_visual_style", state)
-    log.info("Generating visual style guide...")
-    agent = AgentFactory.get_agent(VisualStyleAgent)
-    result = agent.run(state)
+    style_log = AgentLogger("a2_5_visual_style", state)
+    chars_log = AgentLogger("a3_characters", state)
+    style_log.info("Generating visual style guide...")
+    chars_log.info("Generating characters...")
 
-    if result.visual_style:
-        log.info(f"✓ Visual style: {result.visual_style.style_description}")
+    style_agent = AgentFactory.get_agent(VisualStyleAgent)
+    chars_agent = AgentFactory.get_agent(CharactersAgent)
 
-    return cast(GameState, result)
+    async def generate() -> None:
+        # Both agents update different fields of the same state object
+        await asyncio.gather(style_agent.arun(state), chars_agent.arun(state))
 
+    asyncio.run(generate())
 
-def a3_characters_node(state: GameState) -> GameState:
-    """A3: Characters generation node (no relationships)."""
-    from mystery_agents.agents.a3_characters import CharactersAgent
-
-    log = AgentLogger("a3_characters", state)
-    log.info("Generating characters...")
-    agent = AgentFactory.get_agent(CharactersAgent)
-    result = agent.run(state)
-    log.info(f"✓ Generated {len(result.characters)} characters")
-    return cast(GameState, result)
+    if state.visual_style:
+        style_log.info(f"✓ Visual style: {state.visual_style.style_description}")
+    chars_log.info(f"✓ Generated {len(state.characters)} characters")
+    return state
 
 
 def a3_5_character_images_node(state: GameState) -> GameState:
@@ -300,8 +304,7 @@ def create_workflow() -> Any:
     graph.add_node("a1_config", a1_config_node)
     graph.add_node("a2_world", a2_world_node)
     graph.add_node("v1_world_validator", v1_world_validator_node)
-    graph.add_node("a2_5_visual_style", a2_5_visual_style_node)
-    graph.add_node("a3_characters", a3_characters_node)
+    graph.add_node("a2_5_a3_style_and_characters", a2_5_a3_style_and_characters_node)
     graph.add_node("a3_5_character_images", a3_5_character_images_node)
     graph.add_node("a4_relationships", a4_relationships_node)
     graph.add_node("a5_crime", a5_crime_node)
@@ -322,17 +325,15 @@ def create_workflow() -> Any:
         "v1_world_validator",
         should_retry_world_validation,
         {
-            "pass": "a2_5_visual_style",
+            "pass": "a2_5_a3_style_and_characters",
             "retry": "a2_world",
             "fail": END,
         },
     )
 
-    # Visual style generation (after world validation)
-    graph.add_edge("a2_5_visual_style", "a3_characters")
-
-    # Continue main flow (with optional image generation)
-    graph.add_edge("a3_characters", "a3_5_character_images")
+    # Visual style and characters are generated concurrently (after world validation),
+    # then the main flow continues (with optional image generation)
+    graph.add_edge("a2_5_a3_style_and_characters", "a3_5_character_images")
     graph.add_edge("a3_5_character_images", "a4_relationships")
     graph.add_edge("a4_relationships", "a5_crime")
     graph.add_edge("a5_crime", "a6_timeline")
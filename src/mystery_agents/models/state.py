@@ -6,7 +6,7 @@ from datetime import UTC, datetime
 from typing import Literal
 from uuid import uuid4
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from mystery_agents.utils.constants import DEFAULT_COUNTRY_ES
 
@@ -51,6 +51,9 @@ class GameConfig(BaseModel):
     difficulty: DifficultyLevel = "medium"
     killer_knows_identity: bool = False  # If True, killer's character sheet reveals their identity
     generate_images: bool = False
+    enable_image_cache: bool = False  # Reuse previously generated images for identical prompts
+    enable_response_cache: bool = False  # Reuse structured LLM responses for identical requests
+    validator_ensemble: bool = False  # Majority-vote V2 over several concurrent samples
     dry_run: bool = False
     debug_model: bool = False
     config_file: str | None = None  # Path to YAML config file (skips wizard if provided)
@@ -600,6 +603,9 @@ class ValidationIssue(BaseModel):
 class ValidationReport(BaseModel):
     """Validation report."""
 
+    # Reports are never edited after creation; frozen so a shared instance is safe
+    model_config = ConfigDict(frozen=True)
+
     is_consistent: bool = Field(
         description="Whether the game state is logically consistent and playable. Must be true for the game to proceed."
     )
@@ -12,7 +12,10 @@ logger = logging.getLogger(__name__)
 
 class LLMCache:
     """
-    Singleton cache for LLM instances to avoid creating duplicate models.
+    Process-wide cache for LLM instances to avoid creating duplicate models.
+
+    All state lives in class attributes and is accessed through classmethods,
+    so the class is never instantiated.
 
     Benefits:
     - Reduces initialization overhead
@@ -20,15 +23,8 @@ class LLMCache:
     - Reduces memory footprint (1 instance per tier instead of 20+)
     """
 
-    _instance: LLMCache | None = None
     _cache: dict[str, BaseChatModel] = {}
 
-    def __new__(cls) -> LLMCache:
-        """Ensure singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     @classmethod
     def get_model(cls, tier: Literal["tier1", "tier2", "tier3"]) -> BaseChatModel:
         """
@@ -40,24 +36,28 @@ class LLMCache:
         Returns:
             Cached chat model instance
         """
-        cache = cls()._cache
+        cache = cls._cache
 
-        if tier not in cache:
+        # Single dict probe on the hot (cache hit) path
+        model = cache.get(tier)
+        if model is None:
             # Import here to avoid circular dependency
             from mystery_agents.config import LLMConfig
 
-            logger.debug(f"Creating new LLM instance for {tier}")
-            cache[tier] = LLMConfig.get_model(tier)
+            logger.debug("Creating new LLM instance for %s", tier)
+            # setdefault is atomic: if another thread stored a model for this tier
+            # while ours was being built, everyone keeps using that one
+            model = cache.setdefault(tier, LLMConfig.get_model(tier))
         else:
-            logger.debug(f"Reusing cached LLM instance for {tier}")
+            logger.debug("Reusing cached LLM instance for %s", tier)
 
-        return cache[tier]
+        return model
 
     @classmethod
     def clear(cls) -> None:
         """Clear the LLM cache (useful for testing)."""
         logger.debug("Clearing LLM cache")
-        cls()._cache.clear()
+        cls._cache.clear()
 
     @classmethod
     def cache_stats(cls) -> dict[str, Any]:
@@ -68,31 +68,26 @@ class LLMCache:
             Dictionary with cache size and tier information
         """
         return {
-            "cached_models": len(cls()._cache),
-            "tiers": list(cls()._cache.keys()),
+            "cached_models": len(cls._cache),
+            "tiers": list(cls._cache.keys()),
         }
 
 
 class AgentFactory:
     """
-    Singleton factory for agent instances to avoid creating duplicates.
+    Process-wide factory for agent instances to avoid creating duplicates.
+
+    Like LLMCache, all state lives in class attributes.
 
     Benefits:
     - Agents are stateless, so we can safely reuse them
     - Reduces LLM instance creation (through LLMCache)
-    - Reduces create_agent() calls from LangChain
+    - Reduces structured-output model bindings (with_structured_output)
     - Improves performance in retry loops (V1, V2)
     """
 
-    _instance: AgentFactory | None = None
     _cache: dict[str, Any] = {}
 
-    def __new__(cls) -> AgentFactory:
-        """Ensure singleton pattern."""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
-
     @classmethod
     def get_agent(cls, agent_class: type[Any]) -> Any:
         """
@@ -104,22 +99,24 @@ class AgentFactory:
         Returns:
             Cached agent instance
         """
-        cache = cls()._cache
+        cache = cls._cache
         agent_name = agent_class.__name__
 
-        if agent_name not in cache:
-            logger.debug(f"Creating new agent instance: {agent_name}")
-            cache[agent_name] = agent_class()
+        # Single dict probe on the hot (cache hit) path
+        agent = cache.get(agent_name)
+        if agent is None:
+            logger.debug("Creating new agent instance: %s", agent_name)
+            agent = cache.setdefault(agent_name, agent_class())
         else:
-            logger.debug(f"Reusing cached agent: {agent_name}")
+            logger.debug("Reusing cached agent: %s", agent_name)
 
-        return cache[agent_name]
+        return agent
 
     @classmethod
     def clear(cls) -> None:
         """Clear the agent cache (useful for testing)."""
         logger.info("[Cache] Clearing agent cache")
-        cls()._cache.clear()
+        cls._cache.clear()
 
     @classmethod
     def cache_stats(cls) -> dict[str, Any]:
@@ -130,8 +127,8 @@ class AgentFactory:
             Dictionary with cache size and agent names
         """
         return {
-            "cached_agents": len(cls()._cache),
-            "agents": list(cls()._cache.keys()),
+            "cached_agents": len(cls._cache),
+            "agents": list(cls._cache.keys()),
         }
 
 
@@ -79,6 +79,14 @@ IMAGE_GENERATION_TEMPERATURE = 0.6
 IMAGE_GENERATION_MAX_RETRIES = 3
 IMAGE_GENERATION_RETRY_DELAY_BASE = 2.0  # seconds
 IMAGE_GENERATION_MAX_CONCURRENT = 5  # parallel requests limit
+IMAGE_GENERATION_RATE_LIMIT_PER_MINUTE = 60  # request starts per minute (0 = unlimited)
+IMAGE_CACHE_DIR = "~/.cache/mystery_agents/gemini"  # used with --image-cache
+
+# LLM response cache configuration
+RESPONSE_CACHE_DIR = "~/.cache/mystery_agents/responses"  # used with --response-cache
+
+# Game logic validator (V2) ensemble configuration
+VALIDATOR_ENSEMBLE_SIZE = 3  # concurrent samples majority-voted with --validator-ensemble
 
 # Mock data placeholders (for dry run mode)
 MOCK_WORLD_NAME = "Thornfield Manor"
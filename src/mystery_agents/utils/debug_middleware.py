@@ -1,96 +1,143 @@
 """Debugging middleware for LangChain agents."""
 
 import json
+import logging
+import traceback
+from collections.abc import Mapping
+from itertools import islice
 from typing import Any
 
 from langchain.agents.middleware import AgentState, after_model
 from langchain_core.messages import AIMessage
 from langgraph.runtime import Runtime
 
+logger = logging.getLogger(__name__)
 
-def _log_model_response_impl(state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+_PREVIEW_LIMIT = 1000
+_KEYS_PREVIEW_LIMIT = 20
+
+
+def _dump_preview(obj: Any, limit: int = _PREVIEW_LIMIT) -> str:
     """
-    Internal implementation of log_model_response.
+    Serialize an object as indented JSON, stopping once the preview is long enough.
 
-    This is the actual function that does the logging.
-    The @after_model decorator wraps this to create the middleware.
+    The encoder is consumed lazily, so the cost is bounded by the limit rather
+    than by the size of the object.
+
+    Args:
+        obj: JSON-serializable object (non-serializable values are rendered with str)
+        limit: Maximum number of characters to keep
+
+    Returns:
+        The JSON text, truncated to limit characters with a note if it was longer
     """
+    parts: list[str] = []
+    length = 0
+    for chunk in json.JSONEncoder(indent=2, default=str).iterencode(obj):
+        parts.append(chunk)
+        length += len(chunk)
+        if length > limit:
+            return "".join(parts)[:limit] + "\n... (truncated)"
+    return "".join(parts)
+
+
+def _format_keys(state: Mapping[str, object]) -> str:
+    """
+    Format the keys of the agent state, listing at most _KEYS_PREVIEW_LIMIT of them.
+
+    Args:
+        state: Agent state
+
+    Returns:
+        The listed keys, with a count of the ones left out
+    """
+    keys = list(islice(state, _KEYS_PREVIEW_LIMIT))
+    remaining = len(state) - len(keys)
+    return f"{keys} (+{remaining} more)" if remaining else str(keys)
+
+
+def _log_model_response_impl(state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
     """
     Log model responses for debugging.
 
+    Internal implementation of log_model_response; the @after_model decorator
+    wraps this to create the middleware.
+
     This middleware logs:
     - The raw response content from the model
     - The structured response if available
     - Any errors or issues with the response format
     - Full state information for debugging
+
+    Everything is logged as one DEBUG record. When DEBUG is disabled the hook
+    returns immediately, without previewing or serializing the response.
     """
-    print("\n" + "=" * 80)
-    print("[DEBUG MIDDLEWARE] After Model Hook")
-    print("=" * 80)
+    if not logger.isEnabledFor(logging.DEBUG):
+        return None
+
+    # Collect the report and emit it as a single log record, so concurrent
+    # agents can't interleave their output
+    parts: list[str] = []
+    out = parts.append
+
+    out("=" * 80)
+    out("[DEBUG MIDDLEWARE] After Model Hook")
+    out("=" * 80)
 
     # Log state keys
-    print(
-        f"\n[DEBUG] State keys: {list(state.keys()) if isinstance(state, dict) else 'Not a dict'}"
-    )
+    out(f"State keys: {_format_keys(state) if isinstance(state, dict) else 'Not a dict'}")
 
     # Log messages
     messages = state.get("messages", []) if isinstance(state, dict) else []
-    print(f"\n[DEBUG] Number of messages: {len(messages)}")
+    out(f"Number of messages: {len(messages)}")
 
     if messages:
         last_message = messages[-1]
-        print(f"\n[DEBUG] Last message type: {type(last_message).__name__}")
+        out(f"Last message type: {type(last_message).__name__}")
 
         if isinstance(last_message, AIMessage):
-            print("[DEBUG] Response Content:")
-            print("-" * 80)
             content = last_message.content
             if content:
                 # Show first 1000 chars, or full content if shorter
-                preview = content[:1000]
-                print(preview)
+                out(f"Response Content:\n{'-' * 80}\n{content[:1000]}")
                 if len(content) > 1000:
-                    print(f"\n... (truncated, total length: {len(content)} chars)")
+                    out(f"... (truncated, total length: {len(content)} chars)")
             else:
-                print("(empty content)")
-            print("-" * 80)
-
-            # Try to parse as JSON if it looks like JSON
-            if content and isinstance(content, str) and content.strip().startswith("{"):
-                try:
-                    parsed = json.loads(content)
-                    print("\n[DEBUG] Content is valid JSON:")
-                    print(json.dumps(parsed, indent=2, default=str)[:500])
-                except json.JSONDecodeError:
-                    print("\n[DEBUG] Content looks like JSON but is invalid")
+                out("Response Content: (empty content)")
+
+            # Show the content as JSON if it parses; one parse attempt, no pre-check
+            try:
+                parsed = json.loads(content) if isinstance(content, str) else None
+            except json.JSONDecodeError:
+                parsed = None
+            if isinstance(parsed, dict):
+                out(f"Content is valid JSON:\n{_dump_preview(parsed, 500)}")
         else:
-            print(f"[DEBUG] Last message: {last_message}")
+            out(f"Last message: {last_message}")
 
     # Check for structured response
     if isinstance(state, dict):
         if "structured_response" in state:
-            print("\n[DEBUG] ✓ Structured Response Found in state:")
+            out("✓ Structured Response Found in state:")
             try:
                 structured = state["structured_response"]
-                print(f"[DEBUG] Type: {type(structured).__name__}")
+                out(f"Type: {type(structured).__name__}")
                 if hasattr(structured, "model_dump"):
-                    print("[DEBUG] Structured Data (first 1000 chars):")
-                    data_str = json.dumps(structured.model_dump(), indent=2, default=str)
-                    print(data_str[:1000])
-                    if len(data_str) > 1000:
-                        print("... (truncated)")
+                    out(
+                        f"Structured Data (first {_PREVIEW_LIMIT} chars):\n"
+                        f"{_dump_preview(structured.model_dump())}"
+                    )
                 else:
-                    print(f"[DEBUG] Structured Data: {structured}")
+                    out(f"Structured Data: {structured}")
             except Exception as e:
-                print(f"[DEBUG] ✗ Error accessing structured response: {e}")
-                import traceback
-
-                traceback.print_exc()
+                out(f"✗ Error accessing structured response: {e}")
+                out(traceback.format_exc().rstrip())
         else:
-            print("\n[DEBUG] ✗ No structured_response in state")
-            print(f"[DEBUG] Available state keys: {list(state.keys())}")
+            # The state keys are already listed at the top of the report
+            out("✗ No structured_response in state")
 
-    print("=" * 80 + "\n")
+    out("=" * 80)
+    logger.debug("\n".join(parts))
 
     return None
 
@@ -13,7 +13,9 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any, TypedDict
 
 from babel import Locale
@@ -277,6 +279,8 @@ class TranslationManager:
 
         # Manual cache for get() method to avoid lru_cache memory leak with singleton
         self._get_cache: dict[tuple[str, tuple[tuple[str, Any], ...]], str] = {}
+        # Read-only section views handed out by get_document_labels/get_clue_labels
+        self._section_views: dict[str, Mapping[str, str]] = {}
 
         self._initialized = True
 
@@ -433,9 +437,47 @@ class TranslationManager:
         # We know this is dict[str, str] from our JSON structure
         return dict(section_data)
 
+    def _section_view(self, section: str) -> Mapping[str, str]:
+        """
+        Get a read-only view of a translation section, built once per manager.
+
+        Args:
+            section: Section name (e.g., "document", "clue")
+
+        Returns:
+            Read-only mapping of keys to translated strings
+        """
+        view = self._section_views.get(section)
+        if view is None:
+            view = MappingProxyType(self._get_section(section))
+            self._section_views[section] = view
+        return view
+
+
+def get_translation_manager(language: str) -> TranslationManager:
+    """
+    Get the TranslationManager for a language.
+
+    The module-level helpers below are called for every translated label, so
+    they look the singleton up in TranslationManager._instances instead of
+    calling TranslationManager(), which runs __new__ and __init__ every time.
+    There is no separate cache, so this always returns the same instance as
+    TranslationManager(language), even after _instances is cleared.
+
+    Args:
+        language: Language code (e.g., "en", "es")
+
+    Returns:
+        TranslationManager instance for the language
+    """
+    manager = TranslationManager._instances.get(language)
+    if manager is None or not manager._initialized:
+        manager = TranslationManager(language)
+    return manager
+
 
 # Backward compatibility functions - maintain existing API
-def get_document_labels(language: str) -> dict[str, str]:
+def get_document_labels(language: str) -> Mapping[str, str]:
     """
     Get translated labels for document templates.
 
@@ -446,13 +488,12 @@ def get_document_labels(language: str) -> dict[str, str]:
         language: Language code (e.g., "en", "es")
 
     Returns:
-        Dictionary mapping label keys to translated strings
+        Read-only mapping of label keys to translated strings, built once per manager
     """
-    tm = TranslationManager(language)
-    return tm._get_section("document")
+    return get_translation_manager(language)._section_view("document")
 
 
-def get_clue_labels(language: str) -> dict[str, str]:
+def get_clue_labels(language: str) -> Mapping[str, str]:
     """
     Get translated labels for clue metadata.
 
@@ -463,10 +504,9 @@ def get_clue_labels(language: str) -> dict[str, str]:
         language: Language code (e.g., "en", "es")
 
     Returns:
-        Dictionary mapping label keys to translated strings
+        Read-only mapping of label keys to translated strings, built once per manager
     """
-    tm = TranslationManager(language)
-    return tm._get_section("clue")
+    return get_translation_manager(language)._section_view("clue")
 
 
 def get_language_name(language_code: str) -> str:
@@ -479,7 +519,7 @@ def get_language_name(language_code: str) -> str:
     Returns:
         Full language name (e.g., "English", "Spanish")
     """
-    tm = TranslationManager(LANG_CODE_ENGLISH)
+    tm = get_translation_manager(LANG_CODE_ENGLISH)
     name = tm._lookup(tm.translations, f"language.{language_code}")
     return name if name else language_code
 
@@ -495,7 +535,7 @@ def get_filename(filename_key: str, language: str) -> str:
     Returns:
         Translated filename
     """
-    tm = TranslationManager(language)
+    tm = get_translation_manager(language)
     filename = tm._lookup(tm.translations, f"filenames.{filename_key}")
     return filename if filename else filename_key
 
@@ -511,7 +551,7 @@ def translate_epoch(epoch: str, language: str) -> str:
     Returns:
         Translated epoch name
     """
-    tm = TranslationManager(language)
+    tm = get_translation_manager(language)
     epoch_lower = epoch.lower()
 
     # Map epoch values to label keys
@@ -545,11 +585,11 @@ def translate_room_name(room_id: str | None, language: str) -> str:
         Translated room name or formatted original
     """
     if not room_id:
-        tm = TranslationManager(language)
+        tm = get_translation_manager(language)
         return tm.get("document.unknown")
 
     # Try to get translation from JSON
-    tm = TranslationManager(language)
+    tm = get_translation_manager(language)
     key = f"room.{room_id}"
     translated = tm.get(key)
 
@@ -572,7 +612,7 @@ def translate_clue_type(clue_type: str, language: str) -> str:
     Returns:
         Translated clue type, or original if not found
     """
-    tm = TranslationManager(language)
+    tm = get_translation_manager(language)
 
     # Normalize the type (lowercase, replace spaces with underscores)
     normalized_type = clue_type.lower().replace(" ", "_")
@@ -598,7 +638,7 @@ def translate_relationship_type(rel_type: str, language: str) -> str:
     Returns:
         Translated relationship type, or original if not found
     """
-    tm = TranslationManager(language)
+    tm = get_translation_manager(language)
 
     # Normalize the type (lowercase)
     normalized_type = rel_type.lower()
@@ -624,7 +664,7 @@ def translate_country_name(country: str, language: str) -> str:
     Returns:
         Translated country name, or original if not found
     """
-    tm = TranslationManager(language)
+    tm = get_translation_manager(language)
 
     # Try to get translation from country section
     translated_country = tm.get(f"country.{country}")
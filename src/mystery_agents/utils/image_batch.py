@@ -0,0 +1,184 @@
+"""Shared batch processor for Gemini image generation requests."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import threading
+from collections.abc import Coroutine
+from pathlib import Path
+from typing import Any
+
+from mystery_agents.utils.constants import (
+    IMAGE_GENERATION_MAX_CONCURRENT,
+    IMAGE_GENERATION_RATE_LIMIT_PER_MINUTE,
+)
+from mystery_agents.utils.image_cache import load_cached_image, store_cached_image
+from mystery_agents.utils.image_generation import generate_image_with_gemini
+
+
+class ImageBatchProcessor:
+    """
+    Bounded-concurrency processor for image generation requests.
+
+    All portrait generation (characters, victim, detective) is submitted here so
+    a single game shares one concurrency limit and one rate limit.
+
+    Features:
+    - Semaphore-based concurrency control
+    - Request spacing to stay under the per-minute rate limit (avoids 429s)
+    - Runs batches on one persistent event loop, reused across agents and calls
+    - Rebinds its primitives when used from a different event loop
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = IMAGE_GENERATION_MAX_CONCURRENT,
+        rate_limit: int = IMAGE_GENERATION_RATE_LIMIT_PER_MINUTE,
+    ) -> None:
+        """
+        Initialize the image batch processor.
+
+        Args:
+            max_concurrency: Maximum number of in-flight image requests
+            rate_limit: Maximum number of requests started per minute (0 disables)
+        """
+        self.max_concurrency = max_concurrency
+        self.rate_limit = rate_limit
+        self._min_interval = 60.0 / rate_limit if rate_limit > 0 else 0.0
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._semaphore: asyncio.Semaphore | None = None
+        self._rate_lock: asyncio.Lock | None = None
+        self._next_slot = 0.0
+        self._runner: asyncio.Runner | None = None
+        self._runner_lock = threading.Lock()
+
+    def run[T](self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Run a batch coroutine to completion on the processor's event loop.
+
+        Unlike asyncio.run, the loop is kept alive between calls, so character
+        and host image batches don't each set up and tear down a new loop and
+        keep sharing the same rate limit state.
+
+        Args:
+            coro: Coroutine to run (typically an agent's _generate_all_images)
+
+        Returns:
+            The coroutine's result
+        """
+        with self._runner_lock:
+            if self._runner is None:
+                self._runner = asyncio.Runner()
+            return self._runner.run(coro)
+
+    def close(self) -> None:
+        """Close the persistent event loop, if one was created."""
+        with self._runner_lock:
+            if self._runner is not None:
+                self._runner.close()
+                self._runner = None
+
+    def _bind_to_running_loop(self) -> tuple[asyncio.Semaphore, asyncio.Lock]:
+        """
+        Get the asyncio primitives for the current event loop.
+
+        Returns:
+            Tuple of (semaphore, rate limit lock) bound to the running loop
+        """
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._rate_lock is None or loop is not self._loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._rate_lock = asyncio.Lock()
+            self._next_slot = 0.0
+        return self._semaphore, self._rate_lock
+
+    async def _wait_for_rate_limit(self, rate_lock: asyncio.Lock) -> None:
+        """
+        Space out request starts according to the configured rate limit.
+
+        Args:
+            rate_lock: Lock guarding the next available request slot
+        """
+        if not self._min_interval:
+            return
+
+        async with rate_lock:
+            now = asyncio.get_running_loop().time()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._min_interval
+
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def submit(self, prompt: str, output_path: Path, use_cache: bool = False) -> bool:
+        """
+        Generate a single image, respecting concurrency and rate limits.
+
+        Args:
+            prompt: Text prompt for image generation
+            output_path: Path where to save the generated image
+            use_cache: Reuse a cached image for an identical prompt (and cache new ones)
+
+        Returns:
+            True if image was generated successfully, False otherwise
+        """
+        # Cache copies run in a worker thread so they don't block the shared loop
+        if use_cache and await asyncio.to_thread(load_cached_image, prompt, output_path):
+            return True
+
+        semaphore, rate_lock = self._bind_to_running_loop()
+        async with semaphore:
+            await self._wait_for_rate_limit(rate_lock)
+            success = await generate_image_with_gemini(prompt, output_path)
+
+        if success and use_cache:
+            await asyncio.to_thread(store_cached_image, prompt, output_path)
+
+        return success
+
+
+_processor: ImageBatchProcessor | None = None
+
+
+def get_image_batch_processor() -> ImageBatchProcessor:
+    """
+    Get the shared image batch processor.
+
+    Returns:
+        Process-wide ImageBatchProcessor instance
+    """
+    global _processor
+    if _processor is None:
+        _processor = ImageBatchProcessor()
+        atexit.register(_processor.close)
+    return _processor
+
+
+async def submit(prompt: str, output_path: Path, use_cache: bool = False) -> bool:
+    """
+    Submit an image generation request to the shared batch processor.
+
+    Args:
+        prompt: Text prompt for image generation
+        output_path: Path where to save the generated image
+        use_cache: Reuse a cached image for an identical prompt (and cache new ones)
+
+    Returns:
+        True if image was generated successfully, False otherwise
+    """
+    return await get_image_batch_processor().submit(prompt, output_path, use_cache)
+
+
+def run_image_batch[T](coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a batch coroutine on the shared processor's persistent event loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result
+    """
+    return get_image_batch_processor().run(coro)
@@ -0,0 +1,95 @@
+"""Content-addressed on-disk cache for generated images."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from mystery_agents.utils.constants import IMAGE_CACHE_DIR, IMAGE_GENERATION_MODEL
+
+logger = logging.getLogger(__name__)
+
+
+def image_cache_key(prompt: str) -> str:
+    """
+    Compute the cache key for an image prompt.
+
+    The image model is part of the key so switching models never serves
+    images generated by a different one.
+
+    Args:
+        prompt: Text prompt for image generation
+
+    Returns:
+        SHA-256 hex digest identifying the prompt
+    """
+    return hashlib.sha256(f"{IMAGE_GENERATION_MODEL}\n{prompt}".encode()).hexdigest()
+
+
+def get_image_cache_dir() -> Path:
+    """
+    Get the directory where cached images are stored.
+
+    Returns:
+        Path to the image cache directory
+    """
+    return Path(IMAGE_CACHE_DIR).expanduser()
+
+
+def load_cached_image(prompt: str, output_path: Path) -> bool:
+    """
+    Copy a previously generated image for this prompt to output_path.
+
+    Args:
+        prompt: Text prompt for image generation
+        output_path: Where to place the cached image
+
+    Returns:
+        True if a cached image was found and copied, False otherwise
+    """
+    cached_path = get_image_cache_dir() / f"{image_cache_key(prompt)}.png"
+    if not cached_path.is_file():
+        return False
+
+    try:
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached_path, output_path)
+    except OSError as e:
+        logger.warning(f"Could not read cached image {cached_path.name}: {e}")
+        return False
+
+    logger.debug(f"Reusing cached image {cached_path.name} -> {output_path.name}")
+    return True
+
+
+def store_cached_image(prompt: str, image_path: Path) -> None:
+    """
+    Store a generated image in the cache for future runs.
+
+    The image is copied to a temporary file and renamed into place, so an
+    interrupted or concurrent write never leaves a partial image that later
+    runs would serve as a hit. Cache write failures are logged and otherwise
+    ignored.
+
+    Args:
+        prompt: Text prompt used to generate the image
+        image_path: Path of the generated image
+    """
+    cache_dir = get_image_cache_dir()
+    key = image_cache_key(prompt)
+    tmp_path: Path | None = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=cache_dir, prefix=f"{key}.", suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_name)
+        shutil.copyfile(image_path, tmp_path)
+        tmp_path.replace(cache_dir / f"{key}.png")
+    except OSError as e:
+        logger.warning(f"Could not store image in cache: {e}")
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
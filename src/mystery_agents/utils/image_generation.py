@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import base64
 import os
+import re
 from io import BytesIO
 from pathlib import Path
 
@@ -19,6 +20,12 @@ from mystery_agents.utils.constants import (
     IMAGE_GENERATION_TEMPERATURE,
 )
 
+# Anything that isn't a word character, dot or dash is unsafe in a filename
+# (keeps accented and non-Latin letters so localized names stay readable)
+_UNSAFE_FILENAME_CHARS = re.compile(r"[^\w.-]+")
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
 
 async def generate_image_with_gemini(
     prompt: str,
@@ -112,7 +119,27 @@ async def _call_gemini_image_api(prompt: str, output_path: Path) -> None:
     img_b64 = url_str.split(",")[-1]
     img_data = base64.b64decode(img_b64)
 
-    # Open and save image
+    # Write to disk off the event loop so concurrent generations don't block each other
+    await asyncio.to_thread(_save_image_bytes, img_data, output_path)
+
+
+def _save_image_bytes(img_data: bytes, output_path: Path) -> None:
+    """
+    Save encoded image bytes to disk as PNG.
+
+    PNG payloads are written as-is, avoiding a full decode into a bitmap and
+    re-encode. Other formats are converted to PNG with Pillow. The parent
+    directory is created here, so it only exists once an image is produced.
+
+    Args:
+        img_data: Encoded image bytes from the API response
+        output_path: Where to save the image
+    """
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if img_data.startswith(_PNG_SIGNATURE):
+        output_path.write_bytes(img_data)
+        return
+
     image = PILImage.open(BytesIO(img_data))
     image.save(str(output_path), "PNG")
 
@@ -128,3 +155,19 @@ def get_character_image_output_dir(game_id: str) -> Path:
         Path to the images/characters directory for this game
     """
     return Path("output") / f"game_{game_id}" / "images" / "characters"
+
+
+def sanitize_image_filename(name: str) -> str:
+    """
+    Convert a character name into a filesystem-safe filename component.
+
+    Lowercases the name and collapses spaces and unsafe characters
+    (e.g. "/", ":", control characters) into underscores.
+
+    Args:
+        name: Character name
+
+    Returns:
+        Sanitized name suitable for use in an image filename
+    """
+    return _UNSAFE_FILENAME_CHARS.sub("_", name.lower())
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import sys
+import warnings
 from typing import TYPE_CHECKING
 
 import click
@@ -12,24 +13,29 @@ if TYPE_CHECKING:
     from mystery_agents.models.state import GameState
 
 
-class CustomFormatter(logging.Formatter):
-    """Custom formatter with [agent_name] context."""
+LOG_FORMAT = "%(asctime)s %(levelname)s [%(agent_name)s] %(message)s"
+LOG_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+_NOISY_THIRD_PARTY_LOGGERS = ("weasyprint", "fontTools", "PIL", "weasyprint.css", "weasyprint.html")
+_NOISY_THIRD_PARTY_MODULES = r"(weasyprint|fontTools|PIL)(\.|$)"
+
+# Loggers that report model responses when --debug (debug_model) is enabled
+_DEBUG_MODEL_LOGGERS = ("mystery_agents.utils.debug_middleware", "mystery_agents.agents.base")
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record with agent context."""
-        # Extract agent name from logger name (e.g., mystery_agents.agents.a2_world -> a2_world)
-        parts = record.name.split(".")
-        agent_name = parts[-1] if parts else record.name
 
-        # Create formatted message with [agent_name] context
-        timestamp = self.formatTime(record, "%Y-%m-%d %H:%M:%S")
-        level = record.levelname
-        message = record.getMessage()
+class AgentNameFilter(logging.Filter):
+    """Add the [agent_name] context used by LOG_FORMAT to each record."""
 
-        return f"{timestamp} {level} [{agent_name}] {message}"
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Set record.agent_name from the logger name and keep the record."""
+        # Extract agent name from logger name (e.g., mystery_agents.agents.a2_world -> a2_world)
+        record.agent_name = record.name.rpartition(".")[2]
+        return True
 
 
-def setup_logging(verbosity: int, quiet: bool, log_file: str | None = None) -> None:
+def setup_logging(
+    verbosity: int, quiet: bool, log_file: str | None = None, debug_model: bool = False
+) -> None:
     """
     Configure logging system based on verbosity level.
 
@@ -37,6 +43,8 @@ def setup_logging(verbosity: int, quiet: bool, log_file: str | None = None) -> N
         verbosity: Logging level (0=default/no logs, 1=INFO, 2=DEBUG)
         quiet: If True, suppress all logging output to console
         log_file: Optional file path to write logs to (always writes INFO+ logs if specified)
+        debug_model: If True (--debug), always show model response logs on stderr,
+                     regardless of verbosity
     """
     # Get root logger
     root_logger = logging.getLogger()
@@ -61,42 +69,56 @@ def setup_logging(verbosity: int, quiet: bool, log_file: str | None = None) -> N
         # -vv: DEBUG level
         root_logger.setLevel(logging.DEBUG)
 
-    formatter = CustomFormatter()
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
+    agent_name_filter = AgentNameFilter()
 
     # Console handler (stderr, so it doesn't mix with stdout progress)
     if not quiet and verbosity > 0:
         console_handler = logging.StreamHandler(sys.stderr)
         console_handler.setLevel(logging.DEBUG)
         console_handler.setFormatter(formatter)
+        console_handler.addFilter(agent_name_filter)
         root_logger.addHandler(console_handler)
 
     # File handler (if specified)
-    # Always writes INFO level logs by default, or DEBUG if -vv is used
+    # Always writes INFO level logs by default, or DEBUG if -vv is used.
+    # The file is only opened when the first record is written.
     if log_file:
-        file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8")
+        file_handler = logging.FileHandler(log_file, mode="a", encoding="utf-8", delay=True)
         if verbosity >= 2:
             file_handler.setLevel(logging.DEBUG)
         else:
             file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
+        file_handler.addFilter(agent_name_filter)
         root_logger.addHandler(file_handler)
 
     # Silence noisy third-party loggers
     # weasyprint logs many warnings about unsupported CSS properties
     # Only show them in DEBUG mode (-vv)
-    import warnings
-
-    for logger_name in ["weasyprint", "fontTools", "PIL", "weasyprint.css", "weasyprint.html"]:
+    for logger_name in _NOISY_THIRD_PARTY_LOGGERS:
         third_party_logger = logging.getLogger(logger_name)
         if verbosity < 2:
             third_party_logger.setLevel(logging.ERROR)
         third_party_logger.propagate = True
 
-    # Also silence warnings from these modules
+    # Also silence warnings from these modules (and their submodules), with a single filter
     if verbosity < 2:
-        warnings.filterwarnings("ignore", module="weasyprint")
-        warnings.filterwarnings("ignore", module="fontTools")
-        warnings.filterwarnings("ignore", module="PIL")
+        warnings.filterwarnings("ignore", module=_NOISY_THIRD_PARTY_MODULES)
+
+    # --debug logs model responses at DEBUG level, so it must not depend on -vv.
+    # The console handler (-v/-vv) already accepts DEBUG records; in default and
+    # quiet modes there is none, so these loggers get their own stderr handler.
+    for logger_name in _DEBUG_MODEL_LOGGERS:
+        debug_model_logger = logging.getLogger(logger_name)
+        debug_model_logger.handlers.clear()
+        debug_model_logger.setLevel(logging.DEBUG if debug_model else logging.NOTSET)
+        if debug_model and (quiet or verbosity == 0):
+            debug_handler = logging.StreamHandler(sys.stderr)
+            debug_handler.setLevel(logging.DEBUG)
+            debug_handler.setFormatter(formatter)
+            debug_handler.addFilter(agent_name_filter)
+            debug_model_logger.addHandler(debug_handler)
 
 
 class AgentLogger:
@@ -122,6 +144,15 @@ class AgentLogger:
         self.state = state
         self.logger = logging.getLogger(name)
 
+        # The output mode doesn't change during a run, so resolve it once
+        config = state.config
+        # Use logger if: verbose mode OR log_file is configured
+        self._use_logger = config.verbosity > 0 or bool(config.log_file)
+        # Console output for default mode (only if not using logger for console)
+        self._echo = not config.quiet_mode and config.verbosity == 0
+        self._debug = config.verbosity >= 2
+        self._warn = not config.quiet_mode
+
     def info(self, message: str) -> None:
         """
         Log info-level message.
@@ -134,16 +165,11 @@ class AgentLogger:
         Args:
             message: Message to log
         """
-        # Determine if we should use structured logging
-        # Use logger if: verbose mode OR log_file is configured
-        use_logger = self.state.config.verbosity > 0 or self.state.config.log_file
-
-        if use_logger:
+        if self._use_logger:
             # Structured log (goes to console if verbose, and/or to file if configured)
             self.logger.info(message)
 
-        # Console output for default mode (only if not using logger for console)
-        if not self.state.config.quiet_mode and self.state.config.verbosity == 0:
+        if self._echo:
             # Default mode: visual progress with click.echo
             click.echo(message)
 
@@ -156,7 +182,7 @@ class AgentLogger:
         Args:
             message: Message to log
         """
-        if self.state.config.verbosity >= 2:
+        if self._debug:
             self.logger.debug(message)
 
     def warning(self, message: str) -> None:
@@ -168,7 +194,7 @@ class AgentLogger:
         Args:
             message: Message to log
         """
-        if not self.state.config.quiet_mode:
+        if self._warn:
             self.logger.warning(message)
 
     def error(self, message: str) -> None:
@@ -3,139 +3,186 @@
 Note: Logging configuration for weasyprint is handled in logging_config.py
 """
 
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
 import markdown
 from weasyprint import HTML
+from weasyprint.text.fonts import FontConfiguration
+
+# Default CSS for professional styling
+_DEFAULT_CSS = """
+    @page {
+        size: A4;
+        margin: 2cm;
+    }
+    body {
+        font-family: "DejaVu Sans", Arial, sans-serif;
+        font-size: 11pt;
+        line-height: 1.6;
+        color: #333;
+    }
+    h1 {
+        font-size: 20pt;
+        font-weight: bold;
+        text-align: center;
+        margin-top: 0.5em;
+        margin-bottom: 1em;
+        color: #2c3e50;
+        border-bottom: 2px solid #3498db;
+        padding-bottom: 0.3em;
+    }
+    img {
+        display: block;
+        margin: 1em auto;
+        max-width: 300px;
+        max-height: 300px;
+        border-radius: 8px;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+    }
+    h2 {
+        font-size: 16pt;
+        font-weight: bold;
+        margin-top: 1em;
+        margin-bottom: 0.5em;
+        color: #34495e;
+    }
+    h3 {
+        font-size: 13pt;
+        font-weight: bold;
+        margin-top: 0.8em;
+        margin-bottom: 0.4em;
+        color: #34495e;
+    }
+    p {
+        margin-bottom: 0.5em;
+    }
+    ul, ol {
+        margin-left: 0;
+        padding-left: 1em;
+        margin-bottom: 0.5em;
+    }
+    li {
+        margin-bottom: 0.3em;
+    }
+    strong {
+        font-weight: bold;
+        color: #2c3e50;
+    }
+    em {
+        font-style: italic;
+    }
+    hr {
+        border: none;
+        border-top: 1px solid #bdc3c7;
+        margin: 1em 0;
+    }
+    blockquote {
+        border-left: 4px solid #3498db;
+        padding-left: 1em;
+        margin-left: 0;
+        font-style: italic;
+        color: #555;
+    }
+"""
+
+# RTL CSS for right-to-left languages (Hebrew, Arabic, etc.)
+_RTL_CSS = """
+    body {
+        direction: rtl;
+        text-align: right;
+    }
+    h1, h2, h3 {
+        direction: rtl;
+        text-align: right;
+    }
+    ul, ol {
+        margin-right: 0;
+        padding-right: 1em;
+        margin-left: 0;
+    }
+    blockquote {
+        border-left: none;
+        border-right: 4px solid #3498db;
+        padding-left: 0;
+        padding-right: 1em;
+        margin-right: 0;
+    }
+"""
+
+
+@lru_cache(maxsize=1)
+def _font_config() -> FontConfiguration:
+    """
+    Get the font configuration shared by all conversions in this process.
+
+    Returns:
+        WeasyPrint font configuration
+    """
+    return FontConfiguration()
+
+
+@lru_cache(maxsize=1)
+def _markdown_converter() -> markdown.Markdown:
+    """
+    Get the Markdown converter shared by all conversions in this process.
+
+    Building a converter loads and registers every extension, so it's done once
+    and the converter is reset between documents instead.
+
+    Returns:
+        Markdown converter with the extensions used for game documents
+    """
+    return markdown.Markdown(
+        extensions=[
+            "extra",  # Tables, fenced code, etc.
+            "nl2br",  # Newlines become <br>
+            "attr_list",  # Attributes on images
+        ]
+    )
+
+
+def _markdown_to_html(md_content: str) -> str:
+    """
+    Convert markdown text to an HTML fragment.
+
+    Args:
+        md_content: Markdown source
+
+    Returns:
+        HTML for the document body
+    """
+    converter = _markdown_converter()
+    # Clear per-document state (footnotes, abbreviations, ...) left by the last conversion
+    converter.reset()
+    html: str = converter.convert(md_content)
+    return html
 
 
 def markdown_to_pdf(
     markdown_path: Path,
-    pdf_path: Path,
+    pdf_path: Path | BinaryIO,
     css: str | None = None,
     language: str = "en",
+    compress: bool = True,
 ) -> None:
     """
     Convert a markdown file to a professional PDF.
 
     Args:
         markdown_path: Path to the markdown file
-        pdf_path: Path where to save the PDF
+        pdf_path: Path where to save the PDF, or a binary file object to write it to
         css: Optional CSS string for styling
         language: Language code for RTL support (e.g., "he" for Hebrew)
+        compress: Compress the PDF streams. Disabling it skips the deflate step
+                  at the cost of larger files (useful for tests and debugging).
     """
     # Read markdown
     md_content = markdown_path.read_text(encoding="utf-8")
 
     # Convert markdown to HTML
-    html_content = markdown.markdown(
-        md_content,
-        extensions=[
-            "extra",  # Tables, fenced code, etc.
-            "nl2br",  # Newlines become <br>
-            "attr_list",  # Attributes on images
-        ],
-    )
-
-    # Default CSS for professional styling
-    default_css = """
-        @page {
-            size: A4;
-            margin: 2cm;
-        }
-        body {
-            font-family: "DejaVu Sans", Arial, sans-serif;
-            font-size: 11pt;
-            line-height: 1.6;
-            color: #333;
-        }
-        h1 {
-            font-size: 20pt;
-            font-weight: bold;
-            text-align: center;
-            margin-top: 0.5em;
-            margin-bottom: 1em;
-            color: #2c3e50;
-            border-bottom: 2px solid #3498db;
-            padding-bottom: 0.3em;
-        }
-        img {
-            display: block;
-            margin: 1em auto;
-            max-width: 300px;
-            max-height: 300px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-        }
-        h2 {
-            font-size: 16pt;
-            font-weight: bold;
-            margin-top: 1em;
-            margin-bottom: 0.5em;
-            color: #34495e;
-        }
-        h3 {
-            font-size: 13pt;
-            font-weight: bold;
-            margin-top: 0.8em;
-            margin-bottom: 0.4em;
-            color: #34495e;
-        }
-        p {
-            margin-bottom: 0.5em;
-        }
-        ul, ol {
-            margin-left: 0;
-            padding-left: 1em;
-            margin-bottom: 0.5em;
-        }
-        li {
-            margin-bottom: 0.3em;
-        }
-        strong {
-            font-weight: bold;
-            color: #2c3e50;
-        }
-        em {
-            font-style: italic;
-        }
-        hr {
-            border: none;
-            border-top: 1px solid #bdc3c7;
-            margin: 1em 0;
-        }
-        blockquote {
-            border-left: 4px solid #3498db;
-            padding-left: 1em;
-            margin-left: 0;
-            font-style: italic;
-            color: #555;
-        }
-    """
-
-    # RTL CSS for right-to-left languages (Hebrew, Arabic, etc.)
-    rtl_css = """
-        body {
-            direction: rtl;
-            text-align: right;
-        }
-        h1, h2, h3 {
-            direction: rtl;
-            text-align: right;
-        }
-        ul, ol {
-            margin-right: 0;
-            padding-right: 1em;
-            margin-left: 0;
-        }
-        blockquote {
-            border-left: none;
-            border-right: 4px solid #3498db;
-            padding-left: 0;
-            padding-right: 1em;
-            margin-right: 0;
-        }
-    """
+    html_content = _markdown_to_html(md_content)
 
     # Determine if RTL language
     is_rtl = language in ["he", "ar"]
@@ -144,7 +191,7 @@ def markdown_to_pdf(
     if css:
         final_css = css
     else:
-        final_css = default_css + (rtl_css if is_rtl else "")
+        final_css = _DEFAULT_CSS + (_RTL_CSS if is_rtl else "")
 
     # Wrap HTML with styling
     full_html = f"""
@@ -164,4 +211,6 @@ def markdown_to_pdf(
 
     # Generate PDF (base_url helps resolve relative paths for images)
     base_url = f"file://{markdown_path.parent.absolute()}/"
-    HTML(string=full_html, base_url=base_url).write_pdf(pdf_path)
+    HTML(string=full_html, base_url=base_url).write_pdf(
+        pdf_path, font_config=_font_config(), uncompressed_pdf=not compress
+    )
@@ -0,0 +1,89 @@
+"""Content-addressed on-disk cache for structured LLM responses."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from pathlib import Path
+
+from pydantic import BaseModel, ValidationError
+
+from mystery_agents.utils.constants import RESPONSE_CACHE_DIR
+
+logger = logging.getLogger(__name__)
+
+
+def response_cache_key(*parts: str) -> str:
+    """
+    Compute the cache key for an LLM request.
+
+    Callers pass every input that affects the response (model, temperature,
+    output schema, prompts, ...), so any change produces a different key.
+
+    Args:
+        *parts: Request inputs identifying the response
+
+    Returns:
+        SHA-256 hex digest identifying the request
+    """
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def get_response_cache_dir() -> Path:
+    """
+    Get the directory where cached responses are stored.
+
+    Returns:
+        Path to the response cache directory
+    """
+    return Path(RESPONSE_CACHE_DIR).expanduser()
+
+
+def load_cached_response[T: BaseModel](key: str, response_format: type[T]) -> T | None:
+    """
+    Load a previously cached response for this key.
+
+    Args:
+        key: Cache key from response_cache_key
+        response_format: Pydantic model to parse the cached response into
+
+    Returns:
+        The cached response, or None if there is no usable entry
+    """
+    cached_path = get_response_cache_dir() / f"{key}.json"
+    if not cached_path.is_file():
+        return None
+
+    try:
+        response = response_format.model_validate_json(cached_path.read_bytes())
+    except (OSError, ValidationError) as e:
+        # Unreadable or stale entry (e.g. the output schema changed): treat as a miss
+        logger.warning(f"Ignoring cached response {cached_path.name}: {e}")
+        return None
+
+    logger.debug(f"Reusing cached {response_format.__name__} response {cached_path.name}")
+    return response
+
+
+def store_cached_response(key: str, response: BaseModel) -> None:
+    """
+    Store a response in the cache for future runs.
+
+    The entry is written to a temporary file and renamed into place, so a
+    concurrent reader never sees a partial entry. Cache write failures are
+    logged and otherwise ignored.
+
+    Args:
+        key: Cache key from response_cache_key
+        response: Structured response to cache
+    """
+    cache_dir = get_response_cache_dir()
+    cached_path = cache_dir / f"{key}.json"
+    tmp_path = cache_dir / f"{key}.{os.getpid()}.tmp"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_text(response.model_dump_json(), encoding="utf-8")
+        tmp_path.replace(cached_path)
+    except OSError as e:
+        logger.warning(f"Could not store response in cache: {e}")
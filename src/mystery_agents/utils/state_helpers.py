@@ -1,6 +1,35 @@
 """Helper functions for safe access to nested GameState fields."""
 
-from mystery_agents.models.state import GameState
+from typing import NamedTuple
+
+from mystery_agents.models.state import CharacterSpec, GameState
+
+
+class WorldFields(NamedTuple):
+    """World values used in prompts, with 'N/A' when the world isn't generated yet."""
+
+    location_name: str
+    epoch: str
+    location_type: str
+    visual_keywords: str
+
+
+class CrimeFields(NamedTuple):
+    """Crime values used in prompts, with 'N/A' when the crime isn't generated yet."""
+
+    victim_name: str
+    victim_role: str
+    victim_persona: str
+    victim_secrets: str
+    method_description: str
+    weapon: str
+    time_of_death: str
+    scene_description: str
+    scene_room_id: str
+
+
+_MISSING_WORLD = WorldFields(*("N/A",) * len(WorldFields._fields))
+_MISSING_CRIME = CrimeFields(*("N/A",) * len(CrimeFields._fields))
 
 
 def safe_get_world_location_name(state: GameState) -> str:
@@ -70,3 +99,72 @@ def safe_get_crime_scene_description(state: GameState) -> str:
 def safe_get_crime_scene_room_id(state: GameState) -> str:
     """Safely get crime scene room ID, returning 'N/A' if not available."""
     return state.crime.crime_scene.room_id if state.crime else "N/A"
+
+
+def get_world_fields(state: GameState) -> WorldFields:
+    """
+    Get all world prompt values at once.
+
+    Prompts that use several world values should call this once instead of
+    several safe_get_world_* helpers, which each repeat the None check.
+
+    Args:
+        state: Current game state
+
+    Returns:
+        World values, all 'N/A' if the world is not available
+    """
+    world = state.world
+    if not world:
+        return _MISSING_WORLD
+    return WorldFields(
+        location_name=world.location_name,
+        epoch=world.epoch,
+        location_type=world.location_type,
+        visual_keywords=", ".join(world.visual_keywords) if world.visual_keywords else "N/A",
+    )
+
+
+def get_crime_fields(state: GameState) -> CrimeFields:
+    """
+    Get all crime prompt values at once.
+
+    Prompts that use several crime values should call this once instead of
+    several safe_get_crime_* helpers, which each repeat the None check.
+
+    Args:
+        state: Current game state
+
+    Returns:
+        Crime values, all 'N/A' if the crime is not available
+    """
+    crime = state.crime
+    if not crime:
+        return _MISSING_CRIME
+    victim = crime.victim
+    return CrimeFields(
+        victim_name=victim.name,
+        victim_role=victim.role_in_setting,
+        victim_persona=victim.public_persona,
+        victim_secrets=", ".join(victim.secrets) if victim.secrets else "N/A",
+        method_description=crime.murder_method.description,
+        weapon=crime.murder_method.weapon_used,
+        time_of_death=crime.time_of_death_approx,
+        scene_description=crime.crime_scene.description,
+        scene_room_id=crime.crime_scene.room_id,
+    )
+
+
+def get_characters_by_id(state: GameState) -> dict[str, CharacterSpec]:
+    """
+    Index the game's characters by ID for repeated lookups.
+
+    Build it once per operation rather than scanning state.characters per lookup.
+
+    Args:
+        state: Current game state
+
+    Returns:
+        Mapping of character ID to character
+    """
+    return {char.id: char for char in state.characters}
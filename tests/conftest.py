@@ -6,6 +6,34 @@ import pytest
 MOCK_API_KEY = "test-mock-api-key-for-testing"
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Register the option that enables the extra PDF rendering tests."""
+    parser.addoption(
+        "--run-pdf-variants",
+        action="store_true",
+        default=False,
+        help="run the pdf_variant tests (each renders a full PDF with WeasyPrint)",
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """
+    Deselect pdf_variant tests unless --run-pdf-variants is given.
+
+    test_markdown_to_pdf_basic always runs as the PDF smoke test; the variants
+    render the same pipeline with different markdown and are slow.
+    """
+    if config.getoption("--run-pdf-variants"):
+        return
+
+    selected = [item for item in items if item.get_closest_marker("pdf_variant") is None]
+    if len(selected) < len(items):
+        config.hook.pytest_deselected(
+            items=[item for item in items if item.get_closest_marker("pdf_variant") is not None]
+        )
+        items[:] = selected
+
+
 @pytest.fixture(autouse=True)
 def mock_google_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
     """
@@ -61,7 +61,7 @@ def test_cli_handles_dict_state_correctly(test_output_dir: Path) -> None:
         patch("mystery_agents.graph.workflow.a1_config_node") as mock_a1,
         patch("mystery_agents.graph.workflow.a2_world_node") as mock_a2,
         patch("mystery_agents.graph.workflow.v1_world_validator_node") as mock_v1_world,
-        patch("mystery_agents.graph.workflow.a3_characters_node") as mock_a3,
+        patch("mystery_agents.graph.workflow.a2_5_a3_style_and_characters_node") as mock_a3,
         patch("mystery_agents.graph.workflow.a3_5_character_images_node") as mock_a3_5,
         patch("mystery_agents.graph.workflow.a4_relationships_node") as mock_a4,
         patch("mystery_agents.graph.workflow.a5_crime_node") as mock_a5,
@@ -229,7 +229,7 @@ def test_cli_handles_validation_failure_correctly() -> None:
         patch("mystery_agents.graph.workflow.a1_config_node") as mock_a1,
         patch("mystery_agents.graph.workflow.a2_world_node") as mock_a2,
         patch("mystery_agents.graph.workflow.v1_world_validator_node") as mock_v1_world,
-        patch("mystery_agents.graph.workflow.a3_characters_node") as mock_a3,
+        patch("mystery_agents.graph.workflow.a2_5_a3_style_and_characters_node") as mock_a3,
         patch("mystery_agents.graph.workflow.a3_5_character_images_node") as mock_a3_5,
         patch("mystery_agents.graph.workflow.a4_relationships_node") as mock_a4,
         patch("mystery_agents.graph.workflow.a5_crime_node") as mock_a5,
@@ -358,7 +358,7 @@ def test_cli_accesses_nested_objects_correctly() -> None:
         patch("mystery_agents.graph.workflow.a1_config_node") as mock_a1,
         patch("mystery_agents.graph.workflow.a2_world_node") as mock_a2,
         patch("mystery_agents.graph.workflow.v1_world_validator_node") as mock_v1_world,
-        patch("mystery_agents.graph.workflow.a3_characters_node") as mock_a3,
+        patch("mystery_agents.graph.workflow.a2_5_a3_style_and_characters_node") as mock_a3,
         patch("mystery_agents.graph.workflow.a3_5_character_images_node") as mock_a3_5,
         patch("mystery_agents.graph.workflow.a4_relationships_node") as mock_a4,
         patch("mystery_agents.graph.workflow.a5_crime_node") as mock_a5,
@@ -2,15 +2,19 @@
 
 These tests actually generate PDFs to verify the full integration with weasyprint.
 They are slower than unit tests but ensure the PDF generation works correctly.
+Tests that only check the PDF is written skip stream compression (compress=False);
+test_markdown_to_pdf_basic keeps the default, compressed output.
 """
 
+import io
 from pathlib import Path
 
 import pytest
 
-from mystery_agents.utils.pdf_generator import markdown_to_pdf
+from mystery_agents.utils.pdf_generator import _markdown_to_html, markdown_to_pdf
 
-# Mark all tests in this module as slow (integration tests)
+# Mark all tests in this module as slow (integration tests). Only
+# test_markdown_to_pdf_basic runs by default; the pdf_variant tests need --run-pdf-variants.
 pytestmark = pytest.mark.slow
 
 
@@ -52,7 +56,8 @@ def test_markdown_to_pdf_basic(sample_markdown: Path, output_pdf: Path) -> None:
     assert output_pdf.stat().st_size > 0
 
 
-def test_markdown_to_pdf_with_custom_css(sample_markdown: Path, output_pdf: Path) -> None:
+@pytest.mark.pdf_variant
+def test_markdown_to_pdf_with_custom_css(sample_markdown: Path) -> None:
     """Test markdown to PDF conversion with custom CSS."""
     custom_css = """
         body {
@@ -60,14 +65,25 @@ def test_markdown_to_pdf_with_custom_css(sample_markdown: Path, output_pdf: Path
             font-size: 12pt;
         }
     """
+    output_pdf = io.BytesIO()
 
-    markdown_to_pdf(sample_markdown, output_pdf, css=custom_css)
+    markdown_to_pdf(sample_markdown, output_pdf, css=custom_css, compress=False)
 
-    # PDF should be created
-    assert output_pdf.exists()
-    assert output_pdf.stat().st_size > 0
+    # PDF should be written
+    assert output_pdf.getbuffer().nbytes > 0
+
+
+def test_markdown_to_html_does_not_leak_between_documents() -> None:
+    """Test that the shared converter starts each document from a clean state."""
+    with_footnote = _markdown_to_html("Text with a note.[^1]\n\n[^1]: The note.")
+    without_footnote = _markdown_to_html("Plain text.")
+
+    assert "The note." in with_footnote
+    assert "The note." not in without_footnote
+    assert without_footnote == "<p>Plain text.</p>"
 
 
+@pytest.mark.pdf_variant
 def test_markdown_to_pdf_with_images(tmp_path: Path) -> None:
     """Test markdown to PDF conversion with image references."""
     # Create a markdown file with an image
@@ -86,14 +102,15 @@ Some text after the image.
     image_file = tmp_path / "test_image.png"
     image_file.write_bytes(b"fake image data")
 
-    output_pdf = tmp_path / "output.pdf"
+    output_pdf = io.BytesIO()
 
     # Should not raise an error (image may not be found, but PDF should still be created)
-    markdown_to_pdf(md_file, output_pdf)
+    markdown_to_pdf(md_file, output_pdf, compress=False)
 
-    assert output_pdf.exists()
+    assert output_pdf.getbuffer().nbytes > 0
 
 
+@pytest.mark.pdf_variant
 def test_markdown_to_pdf_with_tables(tmp_path: Path) -> None:
     """Test markdown to PDF conversion with tables."""
     md_file = tmp_path / "test_table.md"
@@ -108,12 +125,13 @@ def test_markdown_to_pdf_with_tables(tmp_path: Path) -> None:
         encoding="utf-8",
     )
 
-    output_pdf = tmp_path / "output.pdf"
-    markdown_to_pdf(md_file, output_pdf)
+    output_pdf = io.BytesIO()
+    markdown_to_pdf(md_file, output_pdf, compress=False)
 
-    assert output_pdf.exists()
+    assert output_pdf.getbuffer().nbytes > 0
 
 
+@pytest.mark.pdf_variant
 def test_markdown_to_pdf_with_code_blocks(tmp_path: Path) -> None:
     """Test markdown to PDF conversion with code blocks."""
     md_file = tmp_path / "test_code.md"
@@ -128,12 +146,13 @@ def hello():
         encoding="utf-8",
     )
 
-    output_pdf = tmp_path / "output.pdf"
-    markdown_to_pdf(md_file, output_pdf)
+    output_pdf = io.BytesIO()
+    markdown_to_pdf(md_file, output_pdf, compress=False)
 
-    assert output_pdf.exists()
+    assert output_pdf.getbuffer().nbytes > 0
 
 
+@pytest.mark.pdf_variant
 def test_markdown_to_pdf_handles_unicode(tmp_path: Path) -> None:
     """Test markdown to PDF conversion with unicode characters."""
     md_file = tmp_path / "test_unicode.md"
@@ -148,12 +167,13 @@ Deutsch: äöüß
         encoding="utf-8",
     )
 
-    output_pdf = tmp_path / "output.pdf"
-    markdown_to_pdf(md_file, output_pdf)
+    output_pdf = io.BytesIO()
+    markdown_to_pdf(md_file, output_pdf, compress=False)
 
-    assert output_pdf.exists()
+    assert output_pdf.getbuffer().nbytes > 0
 
 
+@pytest.mark.pdf_variant
 def test_markdown_to_pdf_creates_parent_directories(tmp_path: Path) -> None:
     """Test that markdown_to_pdf works with parent directories (they must exist)."""
     md_file = tmp_path / "test.md"
@@ -164,12 +184,13 @@ def test_markdown_to_pdf_creates_parent_directories(tmp_path: Path) -> None:
     output_dir.mkdir(parents=True, exist_ok=True)
     output_pdf = output_dir / "output.pdf"
 
-    markdown_to_pdf(md_file, output_pdf)
+    markdown_to_pdf(md_file, output_pdf, compress=False)
 
     assert output_pdf.exists()
     assert output_pdf.parent.exists()
 
 
+@pytest.mark.pdf_variant
 def test_markdown_to_pdf_with_blockquote(tmp_path: Path) -> None:
     """Test markdown to PDF conversion with blockquotes."""
     md_file = tmp_path / "test_quote.md"
@@ -182,7 +203,7 @@ def test_markdown_to_pdf_with_blockquote(tmp_path: Path) -> None:
         encoding="utf-8",
     )
 
-    output_pdf = tmp_path / "output.pdf"
-    markdown_to_pdf(md_file, output_pdf)
+    output_pdf = io.BytesIO()
+    markdown_to_pdf(md_file, output_pdf, compress=False)
 
-    assert output_pdf.exists()
+    assert output_pdf.getbuffer().nbytes > 0
@@ -19,6 +19,8 @@ from mystery_agents.models.state import (
     VictimSpec,
 )
 from mystery_agents.utils.constants import TEST_DEFAULT_DURATION, TEST_DEFAULT_PLAYERS
+from mystery_agents.utils.image_batch import run_image_batch
+from mystery_agents.utils.image_generation import sanitize_image_filename
 
 
 @pytest.fixture
@@ -186,107 +188,66 @@ def test_run_without_victim_or_detective() -> None:
     assert result == state
 
 
-@pytest.mark.asyncio
-async def test_generate_victim_image_success(
-    game_state_with_victim: GameState, tmp_path: Path
-) -> None:
+def test_generate_victim_image_success(game_state_with_victim: GameState, tmp_path: Path) -> None:
     """Test successful victim image generation."""
     agent = HostImageAgent()
+    assert game_state_with_victim.crime is not None
+    victim = game_state_with_victim.crime.victim
 
+    # Mocked submit: run on the shared batch loop instead of a new loop per test
     with patch(
-        "mystery_agents.utils.image_generation.generate_image_with_gemini",
+        "mystery_agents.agents.a8_5_host_images.submit",
         new_callable=AsyncMock,
+        return_value=True,
     ) as mock_generate:
-        mock_generate.return_value = True
-
-        assert game_state_with_victim.crime is not None
-        victim = game_state_with_victim.crime.victim
-
-        # Call the async function directly instead of the sync wrapper
-        from mystery_agents.utils import image_generation
+        run_image_batch(agent._generate_victim_image(victim, game_state_with_victim, tmp_path))
 
-        prompt = agent._build_victim_image_prompt(victim, game_state_with_victim)
-        image_filename = f"{victim.id}_{victim.name.lower().replace(' ', '_')}.png"
-        image_path = tmp_path / image_filename
+    image_filename = f"{victim.id}_{sanitize_image_filename(victim.name)}.png"
+    assert victim.image_path == str(tmp_path / image_filename)
+    mock_generate.assert_awaited_once()
 
-        success = await image_generation.generate_image_with_gemini(prompt, image_path)
 
-        if success:
-            victim.image_path = str(image_path.absolute())
-
-        # Image path should be set
-        assert victim.image_path is not None
-        assert mock_generate.called
-
-
-@pytest.mark.asyncio
-async def test_generate_victim_image_failure(
-    game_state_with_victim: GameState, tmp_path: Path
-) -> None:
+def test_generate_victim_image_failure(game_state_with_victim: GameState, tmp_path: Path) -> None:
     """Test victim image generation failure."""
     agent = HostImageAgent()
+    assert game_state_with_victim.crime is not None
+    victim = game_state_with_victim.crime.victim
+    victim.image_path = "stale.png"
 
     with patch(
-        "mystery_agents.utils.image_generation.generate_image_with_gemini",
+        "mystery_agents.agents.a8_5_host_images.submit",
         new_callable=AsyncMock,
+        return_value=False,
     ) as mock_generate:
-        mock_generate.return_value = False
-
-        assert game_state_with_victim.crime is not None
-        victim = game_state_with_victim.crime.victim
-
-        # Call the async function directly instead of the sync wrapper
-        from mystery_agents.utils import image_generation
-
-        prompt = agent._build_victim_image_prompt(victim, game_state_with_victim)
-        image_filename = f"{victim.id}_{victim.name.lower().replace(' ', '_')}.png"
-        image_path = tmp_path / image_filename
-
-        success = await image_generation.generate_image_with_gemini(prompt, image_path)
+        run_image_batch(agent._generate_victim_image(victim, game_state_with_victim, tmp_path))
 
-        if success:
-            victim.image_path = str(image_path.absolute())
-        else:
-            victim.image_path = None
+    # Image path should be None after failure
+    assert victim.image_path is None
+    mock_generate.assert_awaited_once()
 
-        # Image path should be None after failure
-        assert victim.image_path is None
-        assert mock_generate.called
 
-
-@pytest.mark.asyncio
-async def test_generate_detective_image_success(
+def test_generate_detective_image_success(
     game_state_with_detective: GameState, tmp_path: Path
 ) -> None:
     """Test successful detective image generation."""
     agent = HostImageAgent()
+    assert game_state_with_detective.host_guide is not None
+    detective = game_state_with_detective.host_guide.host_act2_detective_role
+    assert detective is not None
 
     with patch(
-        "mystery_agents.utils.image_generation.generate_image_with_gemini",
+        "mystery_agents.agents.a8_5_host_images.submit",
         new_callable=AsyncMock,
+        return_value=True,
     ) as mock_generate:
-        mock_generate.return_value = True
-
-        assert game_state_with_detective.host_guide is not None
-        detective = game_state_with_detective.host_guide.host_act2_detective_role
-        assert detective is not None
+        run_image_batch(
+            agent._generate_detective_image(detective, game_state_with_detective, tmp_path)
+        )
 
-        # Call the async function directly instead of the sync wrapper
-        from mystery_agents.utils import image_generation
-
-        prompt = agent._build_detective_image_prompt(detective, game_state_with_detective)
-        detective_id = f"detective-{game_state_with_detective.meta.id[:8]}"
-        image_filename = f"{detective_id}_{detective.character_name.lower().replace(' ', '_')}.png"
-        image_path = tmp_path / image_filename
-
-        success = await image_generation.generate_image_with_gemini(prompt, image_path)
-
-        if success:
-            detective.image_path = str(image_path.absolute())
-
-        # Image path should be set
-        assert detective.image_path is not None
-        assert mock_generate.called
+    detective_id = f"detective-{game_state_with_detective.meta.id[:8]}"
+    image_filename = f"{detective_id}_{sanitize_image_filename(detective.character_name)}.png"
+    assert detective.image_path == str(tmp_path / image_filename)
+    mock_generate.assert_awaited_once()
 
 
 def test_build_victim_image_prompt(game_state_with_victim: GameState) -> None:
@@ -379,18 +340,152 @@ def test_build_detective_prompt_with_visual_style(game_state_with_detective: Gam
     assert "Film noir" in prompt
 
 
-def test_mock_output_creates_directories(game_state_with_victim: GameState) -> None:
-    """Test that mock output creates necessary directories."""
+def test_mock_output_skips_directories(game_state_with_victim: GameState, tmp_path: Path) -> None:
+    """Test that mock output doesn't touch the filesystem."""
     game_state_with_victim.config.dry_run = True
     agent = HostImageAgent()
+    mock_dir = tmp_path / "images" / "characters"
 
     with patch(
-        "mystery_agents.agents.a8_5_host_images.get_character_image_output_dir"
-    ) as mock_get_dir:
-        mock_dir = Path("/tmp/test_output/images/characters")
-        mock_get_dir.return_value = mock_dir
+        "mystery_agents.agents.a8_5_host_images.get_character_image_output_dir",
+        return_value=mock_dir,
+    ):
+        result = agent._mock_output(game_state_with_victim)
+
+    assert not mock_dir.exists()
+    assert result.crime is not None
+    assert result.crime.victim.image_path is not None
+
 
-        agent._mock_output(game_state_with_victim)
+def test_run_generates_victim_and_detective_concurrently(
+    game_state_with_victim: GameState,
+    game_state_with_detective: GameState,
+    tmp_path: Path,
+) -> None:
+    """Test that run generates both host images in a single gather call."""
+    game_state_with_victim.host_guide = game_state_with_detective.host_guide
+    agent = HostImageAgent()
 
-        # Directory should have been created (mkdir called)
-        mock_get_dir.assert_called()
+    with (
+        patch(
+            "mystery_agents.agents.a8_5_host_images.get_character_image_output_dir",
+            return_value=tmp_path,
+        ),
+        patch(
+            "mystery_agents.agents.a8_5_host_images.submit",
+            new_callable=AsyncMock,
+            return_value=True,
+        ) as mock_generate,
+    ):
+        result = agent.run(game_state_with_victim)
+
+    assert mock_generate.await_count == 2
+    assert result.crime is not None
+    assert result.crime.victim.image_path is not None
+    assert result.host_guide is not None
+    assert result.host_guide.host_act2_detective_role is not None
+    assert result.host_guide.host_act2_detective_role.image_path is not None
+
+
+def test_run_isolates_failures_between_host_images(
+    game_state_with_victim: GameState,
+    game_state_with_detective: GameState,
+    tmp_path: Path,
+) -> None:
+    """Test that a failing victim image doesn't prevent the detective image."""
+    game_state_with_victim.host_guide = game_state_with_detective.host_guide
+    agent = HostImageAgent()
+
+    async def fake_generate(prompt: str, output_path: Path, use_cache: bool = False) -> bool:
+        if "VICTIM" in prompt:
+            raise RuntimeError("API error")
+        return True
+
+    with (
+        patch(
+            "mystery_agents.agents.a8_5_host_images.get_character_image_output_dir",
+            return_value=tmp_path,
+        ),
+        patch(
+            "mystery_agents.agents.a8_5_host_images.submit",
+            side_effect=fake_generate,
+        ),
+    ):
+        result = agent.run(game_state_with_victim)
+
+    assert result.crime is not None
+    assert result.crime.victim.image_path is None
+    assert result.host_guide is not None
+    assert result.host_guide.host_act2_detective_role is not None
+    assert result.host_guide.host_act2_detective_role.image_path is not None
+
+
+def test_style_block_is_shared_between_host_prompts(
+    game_state_with_victim: GameState, game_state_with_detective: GameState
+) -> None:
+    """Test that the visual style block is rendered once and reused for both prompts."""
+    from mystery_agents.models.state import VisualStyle
+
+    game_state_with_victim.host_guide = game_state_with_detective.host_guide
+    game_state_with_victim.visual_style = VisualStyle(
+        style_description="Film noir",
+        art_direction="Classic mystery",
+        color_palette=["dark", "muted"],
+        color_grading="High contrast",
+        lighting_setup="Dramatic shadows",
+        lighting_mood="Mysterious",
+        background_aesthetic="Elegant period setting",
+        background_blur="Soft focus",
+        technical_specs="8K resolution",
+        camera_specs="Portrait lens",
+        negative_prompts=["No text", "No labels"],
+    )
+    agent = HostImageAgent()
+    assert game_state_with_victim.crime is not None
+    assert game_state_with_victim.host_guide is not None
+    detective = game_state_with_victim.host_guide.host_act2_detective_role
+    assert detective is not None
+
+    with patch(
+        "mystery_agents.agents.a8_5_host_images.build_visual_style_block",
+        return_value="\nSHARED STYLE BLOCK\n",
+    ) as mock_build:
+        victim_prompt = agent._build_victim_image_prompt(
+            game_state_with_victim.crime.victim, game_state_with_victim
+        )
+        detective_prompt = agent._build_detective_image_prompt(detective, game_state_with_victim)
+
+    mock_build.assert_called_once()
+    assert "SHARED STYLE BLOCK" in victim_prompt
+    assert "SHARED STYLE BLOCK" in detective_prompt
+    assert "This is the VICTIM" in victim_prompt
+    assert "This is the DETECTIVE" in detective_prompt
+
+
+def test_run_computes_setting_context_once(
+    game_state_with_victim: GameState,
+    game_state_with_detective: GameState,
+    tmp_path: Path,
+) -> None:
+    """Test that world/setting lookups happen once per run, not once per prompt."""
+    game_state_with_victim.host_guide = game_state_with_detective.host_guide
+    agent = HostImageAgent()
+
+    with (
+        patch(
+            "mystery_agents.agents.a8_5_host_images.get_character_image_output_dir",
+            return_value=tmp_path,
+        ),
+        patch(
+            "mystery_agents.agents.a8_5_host_images.submit",
+            new_callable=AsyncMock,
+            return_value=True,
+        ),
+        patch(
+            "mystery_agents.agents.a8_5_host_images.safe_get_world_epoch",
+            return_value="1920s",
+        ) as mock_epoch,
+    ):
+        agent.run(game_state_with_victim)
+
+    mock_epoch.assert_called_once()
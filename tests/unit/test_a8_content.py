@@ -1,6 +1,6 @@
 """Tests for ContentGenerationAgent (A8)."""
 
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
 import pytest
 
@@ -189,18 +189,20 @@ def test_run_with_llm_invocation(complete_game_state: GameState) -> None:
         clues=[],
     )
 
-    with patch.object(agent, "invoke", return_value=mock_output) as mock_invoke:
-        agent.run(complete_game_state)
+    # The agent is local to the test, so the mock doesn't need restoring
+    mock_invoke = MagicMock(return_value=mock_output)
+    agent.invoke = mock_invoke  # type: ignore[method-assign]
+    agent.run(complete_game_state)
 
-        # Should have called invoke
-        assert mock_invoke.called
-        # Should have passed user message
-        call_args = mock_invoke.call_args
-        assert call_args is not None
-        user_message = call_args[0][1] if len(call_args[0]) > 1 else None
-        assert user_message is not None
-        assert isinstance(user_message, str)
-        assert len(user_message) > 0
+    # Should have called invoke
+    assert mock_invoke.called
+    # Should have passed user message
+    call_args = mock_invoke.call_args
+    assert call_args is not None
+    user_message = call_args[0][1] if len(call_args[0]) > 1 else None
+    assert user_message is not None
+    assert isinstance(user_message, str)
+    assert len(user_message) > 0
 
 
 def test_run_without_killer_selection() -> None:
@@ -351,23 +353,25 @@ def test_user_message_includes_all_context(complete_game_state: GameState) -> No
         clues=[],
     )
 
-    with patch.object(agent, "invoke", return_value=mock_output) as mock_invoke:
-        agent.run(complete_game_state)
-
-        call_args = mock_invoke.call_args
-        user_message = call_args[0][1] if len(call_args[0]) > 1 else ""
-
-        # Should include key information
-        assert "GAME INFO" in user_message
-        assert "SETTING" in user_message
-        assert "VICTIM" in user_message
-        assert "CHARACTERS" in user_message
-        assert "CRIME" in user_message
-        assert "SOLUTION" in user_message
-        assert "REQUIREMENTS" in user_message
-
-        # Should include specific values
-        assert str(complete_game_state.config.duration_minutes) in user_message
-        assert str(len(complete_game_state.characters)) in user_message
-        if complete_game_state.killer_selection:
-            assert complete_game_state.killer_selection.killer_id in user_message
+    # The agent is local to the test, so the mock doesn't need restoring
+    mock_invoke = MagicMock(return_value=mock_output)
+    agent.invoke = mock_invoke  # type: ignore[method-assign]
+    agent.run(complete_game_state)
+
+    call_args = mock_invoke.call_args
+    user_message = call_args[0][1] if len(call_args[0]) > 1 else ""
+
+    # Should include key information
+    assert "GAME INFO" in user_message
+    assert "SETTING" in user_message
+    assert "VICTIM" in user_message
+    assert "CHARACTERS" in user_message
+    assert "CRIME" in user_message
+    assert "SOLUTION" in user_message
+    assert "REQUIREMENTS" in user_message
+
+    # Should include specific values
+    assert str(complete_game_state.config.duration_minutes) in user_message
+    assert str(len(complete_game_state.characters)) in user_message
+    if complete_game_state.killer_selection:
+        assert complete_game_state.killer_selection.killer_id in user_message
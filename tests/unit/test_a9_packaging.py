@@ -1,7 +1,12 @@
 """Additional unit tests for PackagingAgent (A9)."""
 
+from collections.abc import Callable
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -345,14 +350,11 @@ def test_create_zip(tmp_path: Path) -> None:
     import zipfile
 
     with zipfile.ZipFile(output_path, "r") as zip_ref:
-        files = zip_ref.namelist()
         # _create_zip uses source_dir.parent as base, so files include parent directory
         # The exact structure depends on how source_dir is created relative to tmp_path
         # Check that all expected files are present (with any prefix)
-        file_names = [f.split("/")[-1] for f in files]  # Get just filenames
-        assert "file1.txt" in file_names
-        assert "file2.txt" in file_names
-        assert "file3.txt" in file_names
+        file_names = {Path(f).name for f in zip_ref.namelist()}
+        assert {"file1.txt", "file2.txt", "file3.txt"} <= file_names
 
 
 def test_create_zip_empty_directory(tmp_path: Path) -> None:
@@ -369,120 +371,109 @@ def test_create_zip_empty_directory(tmp_path: Path) -> None:
     assert output_path.exists()
 
 
-def test_generate_all_pdfs_empty_list() -> None:
-    """Test that _generate_all_pdfs handles empty task list."""
-    agent = PackagingAgent()
-    mock_log = MagicMock()
-    mock_log.state = MagicMock()
-    mock_log.state.config = MagicMock()
-    mock_log.state.config.verbosity = 0
+class _FakeExecutor:
+    """In-process stand-in for ProcessPoolExecutor that resolves futures with preset outcomes."""
 
-    # Should not raise
-    agent._generate_all_pdfs([], mock_log, max_workers=2)
+    def __init__(self, outcomes: list[tuple[bool, str] | BaseException]) -> None:
+        """Queue one outcome per submitted task (a result tuple or an exception to raise)."""
+        self.outcomes = list(outcomes)
+        self.submitted: list[Any] = []
 
-    # Should not call executor
-    assert not hasattr(agent, "_executor_called")
+    def __call__(self, max_workers: int) -> "_FakeExecutor":
+        """Stand in for the executor class: 'constructing' it returns this instance."""
+        return self
 
+    def __enter__(self) -> "_FakeExecutor":
+        return self
 
-def test_generate_all_pdfs_with_tasks(tmp_path: Path) -> None:
-    """Test that _generate_all_pdfs processes PDF tasks."""
-    agent = PackagingAgent()
-    mock_log = MagicMock()
-    mock_log.state = MagicMock()
-    mock_log.state.config = MagicMock()
-    mock_log.state.config.verbosity = 0
+    def __exit__(self, *exc_info: object) -> None:
+        return None
 
-    # Create test markdown files
-    md1 = tmp_path / "test1.md"
-    md1.write_text("# Test 1")
-    pdf1 = tmp_path / "test1.pdf"
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future[Any]:
+        """Record the task and return a future that is already resolved."""
+        self.submitted.append(args)
+        future: Future[Any] = Future()
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+        return future
 
-    md2 = tmp_path / "test2.md"
-    md2.write_text("# Test 2")
-    pdf2 = tmp_path / "test2.pdf"
 
-    pdf_tasks = [(md1, pdf1), (md2, pdf2)]
+@pytest.fixture
+def pdf_log() -> SimpleNamespace:
+    """Create a stand-in logger with only the config and methods _generate_all_pdfs uses."""
+    return SimpleNamespace(
+        state=SimpleNamespace(config=SimpleNamespace(verbosity=0)),
+        info=Mock(),
+        debug=Mock(),
+        warning=Mock(),
+        error=Mock(),
+    )
 
-    # Mock ProcessPoolExecutor to avoid actual parallel execution in tests
-    with patch("mystery_agents.agents.a9_packaging.ProcessPoolExecutor") as mock_executor:
-        mock_executor_instance = MagicMock()
-        mock_executor.return_value.__enter__.return_value = mock_executor_instance
 
-        # Mock future results
-        mock_future1 = MagicMock()
-        mock_future1.result.return_value = (True, "")
-        mock_future2 = MagicMock()
-        mock_future2.result.return_value = (True, "")
+def test_generate_all_pdfs_empty_list(pdf_log: SimpleNamespace) -> None:
+    """Test that _generate_all_pdfs handles empty task list."""
+    agent = PackagingAgent()
 
-        mock_executor_instance.submit.side_effect = [mock_future1, mock_future2]
+    # Should not raise
+    agent._generate_all_pdfs([], pdf_log, max_workers=2)
 
-        agent._generate_all_pdfs(pdf_tasks, mock_log, max_workers=2)
+    # Should return before starting the batch
+    assert not pdf_log.info.called
 
-        # Should have submitted tasks
-        assert mock_executor_instance.submit.call_count == 2
 
+def _install_executor(
+    monkeypatch: pytest.MonkeyPatch, outcomes: list[tuple[bool, str] | BaseException]
+) -> _FakeExecutor:
+    """Replace the packaging module's ProcessPoolExecutor with a fake."""
+    executor = _FakeExecutor(outcomes)
+    monkeypatch.setattr("mystery_agents.agents.a9_packaging.ProcessPoolExecutor", executor)
+    return executor
 
-def test_generate_all_pdfs_with_failures(tmp_path: Path) -> None:
-    """Test that _generate_all_pdfs handles PDF generation failures."""
-    agent = PackagingAgent()
-    mock_log = MagicMock()
-    mock_log.state = MagicMock()
-    mock_log.state.config = MagicMock()
-    mock_log.state.config.verbosity = 0
 
-    # Create test markdown files
-    md1 = tmp_path / "test1.md"
-    md1.write_text("# Test 1")
-    pdf1 = tmp_path / "test1.pdf"
+def test_generate_all_pdfs_with_tasks(
+    pdf_log: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that _generate_all_pdfs processes PDF tasks."""
+    agent = PackagingAgent()
+    pdf_tasks = [
+        (Path("test1.md"), Path("test1.pdf")),
+        (Path("test2.md"), Path("test2.pdf")),
+    ]
+    executor = _install_executor(monkeypatch, [(True, ""), (True, "")])
 
-    pdf_tasks = [(md1, pdf1)]
+    agent._generate_all_pdfs(pdf_tasks, pdf_log, max_workers=2)
 
-    # Mock ProcessPoolExecutor
-    with patch("mystery_agents.agents.a9_packaging.ProcessPoolExecutor") as mock_executor:
-        mock_executor_instance = MagicMock()
-        mock_executor.return_value.__enter__.return_value = mock_executor_instance
+    # Should have submitted one task per PDF, with the worker settings
+    assert executor.submitted == [((md, pdf, 0, "en"),) for md, pdf in pdf_tasks]
+    assert not pdf_log.warning.called
 
-        # Mock future with failure
-        mock_future = MagicMock()
-        mock_future.result.return_value = (False, "PDF generation failed")
 
-        mock_executor_instance.submit.return_value = mock_future
+def test_generate_all_pdfs_with_failures(
+    pdf_log: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that _generate_all_pdfs handles PDF generation failures."""
+    agent = PackagingAgent()
+    pdf_tasks = [(Path("test1.md"), Path("test1.pdf"))]
+    _install_executor(monkeypatch, [(False, "PDF generation failed")])
 
-        agent._generate_all_pdfs(pdf_tasks, mock_log, max_workers=2)
+    agent._generate_all_pdfs(pdf_tasks, pdf_log, max_workers=2)
 
-        # Should have logged the error
-        assert mock_log.warning.called or mock_log.error.called
+    # Should have logged the error
+    assert pdf_log.warning.called
 
 
-def test_generate_all_pdfs_with_timeout(tmp_path: Path) -> None:
+def test_generate_all_pdfs_with_timeout(
+    pdf_log: SimpleNamespace, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that _generate_all_pdfs handles timeouts."""
     agent = PackagingAgent()
-    mock_log = MagicMock()
-    mock_log.state = MagicMock()
-    mock_log.state.config = MagicMock()
-    mock_log.state.config.verbosity = 0
-
-    # Create test markdown files
-    md1 = tmp_path / "test1.md"
-    md1.write_text("# Test 1")
-    pdf1 = tmp_path / "test1.pdf"
-
-    pdf_tasks = [(md1, pdf1)]
-
-    # Mock ProcessPoolExecutor
-    with patch("mystery_agents.agents.a9_packaging.ProcessPoolExecutor") as mock_executor:
-        from concurrent.futures import TimeoutError as FutureTimeoutError
-
-        mock_executor_instance = MagicMock()
-        mock_executor.return_value.__enter__.return_value = mock_executor_instance
-
-        # Mock future with timeout
-        mock_future = MagicMock()
-        mock_future.result.side_effect = FutureTimeoutError()
-
-        mock_executor_instance.submit.return_value = mock_future
+    pdf_tasks = [(Path("test1.md"), Path("test1.pdf"))]
+    _install_executor(monkeypatch, [FutureTimeoutError()])
 
-        agent._generate_all_pdfs(pdf_tasks, mock_log, max_workers=2)
+    agent._generate_all_pdfs(pdf_tasks, pdf_log, max_workers=2)
 
-        # Should have logged the timeout
-        assert mock_log.error.called
+    # Should have logged the timeout
+    assert pdf_log.error.called
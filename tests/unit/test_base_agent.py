@@ -1,6 +1,7 @@
 """Unit tests for BaseAgent class."""
 
-from unittest.mock import MagicMock, patch
+import logging
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from langchain_core.language_models import BaseChatModel
@@ -57,7 +58,8 @@ def test_base_agent_initialization(mock_llm: BaseChatModel) -> None:
 
     assert agent.llm == mock_llm
     assert agent.response_format is None
-    assert agent.agent is not None
+    # Without a response format the model is used as-is
+    assert agent.structured_llm is mock_llm
 
 
 def test_base_agent_initialization_with_response_format(mock_llm: BaseChatModel) -> None:
@@ -112,15 +114,25 @@ def test_invoke_with_structured_response(mock_llm: BaseChatModel, basic_state: G
     expected_output = _TestOutputFormat(result="success")
 
     with patch("mystery_agents.agents.base.create_agent") as mock_create_agent:
-        mock_agent = MagicMock()
-        mock_agent.invoke.return_value = {"structured_response": expected_output}
-        mock_create_agent.return_value = mock_agent
+        mock_structured_llm = MagicMock()
+        mock_structured_llm.invoke.return_value = expected_output
 
-        agent.agent = mock_agent
+        agent.structured_llm = mock_structured_llm
         result = agent.invoke(basic_state)
 
         assert result == expected_output
-        assert mock_agent.invoke.call_count == 1
+        assert mock_structured_llm.invoke.call_count == 1
+        # Tool-less agents call the model directly, without an agent graph
+        mock_create_agent.assert_not_called()
+
+
+def test_structured_llm_binds_response_format(mock_llm: MagicMock) -> None:
+    """Test that the model is bound to the response format once."""
+    agent = _TestAgent(llm=mock_llm, response_format=_TestOutputFormat)
+
+    assert agent.structured_llm is agent.structured_llm
+    assert agent.structured_llm is mock_llm.with_structured_output.return_value
+    mock_llm.with_structured_output.assert_called_once_with(_TestOutputFormat)
 
 
 def test_invoke_with_debug_mode(mock_llm: BaseChatModel) -> None:
@@ -151,23 +163,61 @@ def test_invoke_with_debug_mode(mock_llm: BaseChatModel) -> None:
         assert mock_create_agent.call_count == 1
 
 
+def test_debug_agent_is_reused_across_invocations(mock_llm: BaseChatModel) -> None:
+    """Test that the debug agent is built once and reused for later calls."""
+    state = GameState(
+        meta=MetaInfo(),
+        config=GameConfig(
+            players=PlayerConfig(total=TEST_DEFAULT_PLAYERS),
+            dry_run=False,
+            debug_model=True,
+        ),
+    )
+
+    agent = _TestAgent(llm=mock_llm, response_format=_TestOutputFormat)
+
+    with patch("mystery_agents.agents.base.create_agent") as mock_create_agent:
+        mock_agent = MagicMock()
+        mock_agent.invoke.return_value = {
+            "structured_response": _TestOutputFormat(result="debug_success")
+        }
+        mock_create_agent.return_value = mock_agent
+
+        agent.invoke(state)
+        agent.invoke(state)
+
+        assert mock_create_agent.call_count == 1
+        assert mock_agent.invoke.call_count == 2
+
+
 def test_invoke_without_structured_response_raises_error(
     mock_llm: BaseChatModel, basic_state: GameState
 ) -> None:
     """Test invoke raises error when structured response is missing."""
     agent = _TestAgent(llm=mock_llm, response_format=_TestOutputFormat)
 
-    with patch("mystery_agents.agents.base.create_agent") as mock_create_agent:
-        mock_agent = MagicMock()
-        # Return result without structured_response
-        mock_agent.invoke.return_value = {"messages": [AIMessage(content="text response")]}
-        mock_create_agent.return_value = mock_agent
+    agent.structured_llm = MagicMock()
+    agent.structured_llm.invoke.return_value = None
+
+    with pytest.raises(ValueError, match="No structured response returned"):
+        agent.invoke(basic_state)
 
-        agent.agent = mock_agent
 
+def test_missing_structured_response_is_logged_in_debug_mode(
+    mock_llm: BaseChatModel, basic_state: GameState, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that the raw response is logged (not printed) when debug mode is enabled."""
+    basic_state.config.debug_model = True
+    agent = _TestAgent(llm=mock_llm, response_format=_TestOutputFormat)
+    agent.debug_agent = MagicMock()
+    agent.debug_agent.invoke.return_value = {"messages": [AIMessage(content="text response")]}
+
+    with caplog.at_level(logging.DEBUG, logger="mystery_agents.agents.base"):
         with pytest.raises(ValueError, match="No structured_response in agent result"):
             agent.invoke(basic_state)
 
+    assert "text response" in caplog.text
+
 
 def test_invoke_without_response_format_returns_content(
     mock_llm: BaseChatModel, basic_state: GameState
@@ -177,17 +227,12 @@ def test_invoke_without_response_format_returns_content(
 
     expected_content = "Test response content"
 
-    with patch("mystery_agents.agents.base.create_agent") as mock_create_agent:
-        mock_agent = MagicMock()
-        mock_agent.invoke.return_value = {
-            "messages": [AIMessage(content=expected_content)],
-        }
-        mock_create_agent.return_value = mock_agent
+    agent.structured_llm = MagicMock()
+    agent.structured_llm.invoke.return_value = AIMessage(content=expected_content)
 
-        agent.agent = mock_agent
-        result = agent.invoke(basic_state)
+    result = agent.invoke(basic_state)
 
-        assert result == expected_content
+    assert result == expected_content
 
 
 def test_invoke_with_custom_user_message(mock_llm: BaseChatModel, basic_state: GameState) -> None:
@@ -195,16 +240,75 @@ def test_invoke_with_custom_user_message(mock_llm: BaseChatModel, basic_state: G
     agent = _TestAgent(llm=mock_llm)
     custom_message = "Custom test message"
 
-    with patch("mystery_agents.agents.base.create_agent") as mock_create_agent:
-        mock_agent = MagicMock()
-        mock_agent.invoke.return_value = {"messages": [AIMessage(content="response")]}
-        mock_create_agent.return_value = mock_agent
+    mock_structured_llm = MagicMock()
+    mock_structured_llm.invoke.return_value = AIMessage(content="response")
+    agent.structured_llm = mock_structured_llm
+
+    agent.invoke(basic_state, user_message=custom_message)
+
+    # Verify the message was passed (check call args)
+    messages = mock_structured_llm.invoke.call_args[0][0]
+    assert len(messages) == 2  # SystemMessage and HumanMessage
+    assert messages[1].content == custom_message
+
+
+def test_base_agent_llm_factory_is_lazy(mock_llm: BaseChatModel) -> None:
+    """Test that an LLM factory is only called on first access, and only once."""
+    calls: list[int] = []
+
+    def factory() -> BaseChatModel:
+        calls.append(1)
+        return mock_llm
+
+    agent = _TestAgent(llm=factory, response_format=_TestOutputFormat)
+
+    assert calls == []
+
+    assert agent.llm is mock_llm
+    assert agent.llm is mock_llm
+    assert agent.structured_llm is agent.structured_llm
+
+    assert calls == [1]
+
+
+def test_base_agent_static_system_prompt(mock_llm: BaseChatModel, basic_state: GameState) -> None:
+    """Test that a static system prompt passed to __init__ is returned as-is."""
+
+    class _StaticPromptAgent(BaseAgent):
+        pass
+
+    agent = _StaticPromptAgent(llm=mock_llm, system_prompt="Static prompt")
+
+    assert agent.get_system_prompt(basic_state) == "Static prompt"
+
+
+def test_base_agent_missing_system_prompt_raises(
+    mock_llm: BaseChatModel, basic_state: GameState
+) -> None:
+    """Test that agents without a static prompt must override get_system_prompt."""
+
+    class _NoPromptAgent(BaseAgent):
+        pass
+
+    agent = _NoPromptAgent(llm=mock_llm)
+
+    with pytest.raises(NotImplementedError, match="_NoPromptAgent"):
+        agent.get_system_prompt(basic_state)
+
+
+async def test_ainvoke_with_structured_response(
+    mock_llm: BaseChatModel, basic_state: GameState
+) -> None:
+    """Test async invoke returns the structured response."""
+    agent = _TestAgent(llm=mock_llm, response_format=_TestOutputFormat)
+    expected_output = _TestOutputFormat(result="async_success")
+
+    mock_structured_llm = MagicMock()
+    mock_structured_llm.ainvoke = AsyncMock(return_value=expected_output)
+    agent.structured_llm = mock_structured_llm
 
-        agent.agent = mock_agent
-        agent.invoke(basic_state, user_message=custom_message)
+    result = await agent.ainvoke(basic_state, "Test message")
 
-        # Verify the message was passed (check call args)
-        call_args = mock_agent.invoke.call_args
-        messages = call_args[0][0]["messages"]
-        assert len(messages) == 2  # SystemMessage and HumanMessage
-        assert messages[1].content == custom_message
+    assert result == expected_output
+    mock_structured_llm.ainvoke.assert_awaited_once()
+    mock_structured_llm.invoke.assert_not_called()
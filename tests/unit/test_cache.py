@@ -1,10 +1,13 @@
 """Tests for caching utilities (LLMCache and AgentFactory)."""
 
+from unittest.mock import patch
+
 import pytest
 
 from mystery_agents.agents.a2_world import WorldAgent
 from mystery_agents.agents.a3_characters import CharactersAgent
 from mystery_agents.agents.v2_game_logic_validator import GameLogicValidatorAgent
+from mystery_agents.config import LLMConfig, _load_llm_settings
 from mystery_agents.utils.cache import (
     AgentFactory,
     LLMCache,
@@ -19,13 +22,6 @@ def clear_caches_before_test() -> None:
     clear_all_caches()
 
 
-def test_llm_cache_singleton() -> None:
-    """Test that LLMCache is a singleton."""
-    cache1 = LLMCache()
-    cache2 = LLMCache()
-    assert cache1 is cache2
-
-
 def test_llm_cache_returns_same_instance(mock_google_api_key: None) -> None:
     """Test that LLMCache returns the same LLM instance for the same tier."""
     llm1 = LLMCache.get_model("tier1")
@@ -68,6 +64,37 @@ def test_llm_cache_stats(mock_google_api_key: None) -> None:
     assert set(stats["tiers"]) == {"tier1", "tier2", "tier3"}
 
 
+def test_llm_config_builds_only_requested_tier(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that LLMConfig constructs a single model for the requested tier."""
+    monkeypatch.setenv("LLM_MODEL_TIER2", "custom-tier2-model")
+    monkeypatch.setenv("LLM_TEMPERATURE_TIER2", "0.3")
+    _load_llm_settings.cache_clear()
+
+    with patch("mystery_agents.config.ChatGoogleGenerativeAI") as mock_chat:
+        LLMConfig.get_model("tier2")
+
+    mock_chat.assert_called_once()
+    assert mock_chat.call_args.kwargs["model"] == "custom-tier2-model"
+    assert mock_chat.call_args.kwargs["temperature"] == 0.3
+    _load_llm_settings.cache_clear()
+
+
+def test_llm_cache_keeps_first_stored_model() -> None:
+    """Test that a model built concurrently for the same tier doesn't replace the stored one."""
+    winner = object()
+
+    def build_while_another_caller_stores(tier: str) -> object:
+        # Simulate another thread finishing first while this model is being built
+        LLMCache._cache[tier] = winner  # type: ignore[assignment]
+        return object()
+
+    with patch.object(LLMConfig, "get_model", side_effect=build_while_another_caller_stores):
+        model = LLMCache.get_model("tier1")
+
+    assert model is winner
+    assert LLMCache.get_model("tier1") is winner
+
+
 def test_llm_cache_clear() -> None:
     """Test clearing the LLM cache."""
     # Populate cache
@@ -81,13 +108,6 @@ def test_llm_cache_clear() -> None:
     assert stats["tiers"] == []
 
 
-def test_agent_factory_singleton() -> None:
-    """Test that AgentFactory is a singleton."""
-    factory1 = AgentFactory()
-    factory2 = AgentFactory()
-    assert factory1 is factory2
-
-
 def test_agent_factory_returns_same_instance(mock_google_api_key: None) -> None:
     """Test that AgentFactory returns the same agent instance for the same class."""
     agent1 = AgentFactory.get_agent(WorldAgent)
@@ -7,6 +7,7 @@ import pytest
 
 from mystery_agents.agents.a3_5_character_images import CharacterImageAgent
 from mystery_agents.models.state import CharacterSpec, GameConfig, GameState, MetaInfo, PlayerConfig
+from mystery_agents.utils.image_batch import get_image_batch_processor
 
 
 @pytest.fixture
@@ -57,7 +58,28 @@ def test_character_image_agent_initialization(mock_google_api_key: None) -> None
     agent = CharacterImageAgent(llm=MagicMock())
 
     assert agent is not None
-    assert agent.MAX_CONCURRENT_REQUESTS == 5
+    # Concurrency is limited by the shared image batch processor
+    assert get_image_batch_processor().max_concurrency == 5
+
+
+def test_character_image_agent_logs_processor_limits(
+    game_state_with_characters: GameState, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that the start message reports the shared processor's actual limits."""
+    agent = CharacterImageAgent(llm=MagicMock())
+    processor = get_image_batch_processor()
+
+    with (
+        caplog.at_level("INFO", logger="mystery_agents.agents.a3_5_character_images"),
+        patch("mystery_agents.agents.a3_5_character_images.run_image_batch") as mock_run,
+    ):
+        agent.run(game_state_with_characters)
+        mock_run.call_args[0][0].close()
+
+    assert (
+        f"(max {processor.max_concurrency} concurrent, {processor.rate_limit} requests/min)"
+        in caplog.text
+    )
 
 
 def test_character_image_agent_dry_run(game_state_with_characters: GameState) -> None:
@@ -119,7 +141,6 @@ def test_get_image_output_dir(
     assert str(state.meta.id[:8]) in str(output_dir)
 
 
-@pytest.mark.asyncio
 async def test_generate_character_image_success(
     game_state_with_characters: GameState,
     mock_google_api_key: None,
@@ -133,7 +154,7 @@ async def test_generate_character_image_success(
 
     # Mock the shared utility function to succeed
     with patch(
-        "mystery_agents.agents.a3_5_character_images.generate_image_with_gemini",
+        "mystery_agents.agents.a3_5_character_images.submit",
         new_callable=AsyncMock,
     ) as mock_api:
         mock_api.return_value = True  # Simulate successful image generation
@@ -145,7 +166,6 @@ async def test_generate_character_image_success(
         assert mock_api.called
 
 
-@pytest.mark.asyncio
 async def test_generate_character_image_retry(
     game_state_with_characters: GameState,
     mock_google_api_key: None,
@@ -159,7 +179,7 @@ async def test_generate_character_image_retry(
 
     # Mock the utility function to succeed (handles retries internally)
     with patch(
-        "mystery_agents.agents.a3_5_character_images.generate_image_with_gemini",
+        "mystery_agents.agents.a3_5_character_images.submit",
         new_callable=AsyncMock,
     ) as mock_api:
         mock_api.return_value = True  # Simulate success after retries
@@ -171,7 +191,6 @@ async def test_generate_character_image_retry(
         assert mock_api.called
 
 
-@pytest.mark.asyncio
 async def test_generate_character_image_max_retries_exceeded(
     game_state_with_characters: GameState,
     mock_google_api_key: None,
@@ -185,7 +204,7 @@ async def test_generate_character_image_max_retries_exceeded(
 
     # Mock the utility function to fail (exhausted all retries)
     with patch(
-        "mystery_agents.agents.a3_5_character_images.generate_image_with_gemini",
+        "mystery_agents.agents.a3_5_character_images.submit",
         new_callable=AsyncMock,
     ) as mock_api:
         mock_api.return_value = False  # Simulate failure after all retries
@@ -197,7 +216,6 @@ async def test_generate_character_image_max_retries_exceeded(
         assert mock_api.called
 
 
-@pytest.mark.asyncio
 async def test_generate_all_images_parallel(
     game_state_with_characters: GameState,
     mock_google_api_key: None,
@@ -209,7 +227,7 @@ async def test_generate_all_images_parallel(
 
     # Mock the utility function
     with patch(
-        "mystery_agents.agents.a3_5_character_images.generate_image_with_gemini",
+        "mystery_agents.agents.a3_5_character_images.submit",
         new_callable=AsyncMock,
     ) as mock_api:
         mock_api.return_value = True  # Always succeed
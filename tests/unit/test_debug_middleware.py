@@ -1,5 +1,6 @@
 """Tests for debug middleware."""
 
+import logging
 from typing import Any, cast
 from unittest.mock import MagicMock
 
@@ -7,9 +8,17 @@ import pytest
 from langchain.agents.middleware import AgentState
 from langchain_core.messages import AIMessage, HumanMessage
 
+from mystery_agents.utils.debug_middleware import _dump_preview
 from mystery_agents.utils.debug_middleware import _log_model_response_impl as log_model_response
 
 
+@pytest.fixture(autouse=True)
+def debug_logging(caplog: pytest.LogCaptureFixture) -> pytest.LogCaptureFixture:
+    """Enable DEBUG logging for the middleware so its body runs."""
+    caplog.set_level(logging.DEBUG, logger="mystery_agents.utils.debug_middleware")
+    return caplog
+
+
 @pytest.fixture
 def mock_runtime() -> MagicMock:
     """Create a mock runtime."""
@@ -249,3 +258,98 @@ def test_log_model_response_with_dict_state_keys(mock_runtime: MagicMock) -> Non
     result = log_model_response(state, mock_runtime)
 
     assert result is None
+
+
+def test_log_model_response_logs_content(
+    mock_runtime: MagicMock, debug_logging: pytest.LogCaptureFixture
+) -> None:
+    """Test that the response content is written to the debug log."""
+    state = cast(AgentState, {"messages": [AIMessage(content="Logged response")]})
+
+    log_model_response(state, mock_runtime)
+
+    assert "Logged response" in debug_logging.text
+
+
+def test_log_model_response_skipped_without_debug(
+    mock_runtime: MagicMock, debug_logging: pytest.LogCaptureFixture
+) -> None:
+    """Test that nothing is serialized when DEBUG logging is disabled."""
+    debug_logging.set_level(logging.INFO, logger="mystery_agents.utils.debug_middleware")
+    structured = MagicMock()
+    state = cast(
+        AgentState,
+        {"messages": [AIMessage(content="Response")], "structured_response": structured},
+    )
+
+    result = log_model_response(state, mock_runtime)
+
+    assert result is None
+    structured.model_dump.assert_not_called()
+    assert not debug_logging.records
+
+
+def test_dump_preview_truncates_long_output() -> None:
+    """Test that the JSON preview is capped at the limit and marked as truncated."""
+    preview = _dump_preview({"items": list(range(1000))}, limit=50)
+
+    assert preview.startswith('{\n  "items": [')
+    assert preview.endswith("... (truncated)")
+    assert len(preview) == 50 + len("\n... (truncated)")
+
+
+def test_dump_preview_keeps_short_output() -> None:
+    """Test that short output is returned whole, rendering unknown types with str."""
+    assert _dump_preview({"value": {1}}) == '{\n  "value": "{1}"\n}'
+
+
+def test_log_model_response_previews_json_objects_only(
+    mock_runtime: MagicMock, debug_logging: pytest.LogCaptureFixture
+) -> None:
+    """Test that only content parsing to a JSON object gets the JSON preview."""
+    for content in ("plain text", "42", '{"data": invalid}'):
+        log_model_response(
+            cast(AgentState, {"messages": [AIMessage(content=content)]}), mock_runtime
+        )
+    assert "Content is valid JSON" not in debug_logging.text
+
+    log_model_response(
+        cast(AgentState, {"messages": [AIMessage(content=' {"result": "ok"}')]}), mock_runtime
+    )
+    assert "Content is valid JSON" in debug_logging.text
+
+
+def test_log_model_response_emits_single_record(
+    mock_runtime: MagicMock, debug_logging: pytest.LogCaptureFixture
+) -> None:
+    """Test that each hook call is logged as one record, including error details."""
+
+    class ErrorObject:
+        """Object whose model_dump fails."""
+
+        def model_dump(self) -> Any:
+            raise RuntimeError("dump failed")
+
+    state = cast(
+        AgentState,
+        {"messages": [AIMessage(content="Response")], "structured_response": ErrorObject()},
+    )
+
+    log_model_response(state, mock_runtime)
+
+    assert len(debug_logging.records) == 1
+    message = debug_logging.records[0].getMessage()
+    assert "Response" in message
+    assert "RuntimeError: dump failed" in message
+
+
+def test_log_model_response_caps_state_keys(
+    mock_runtime: MagicMock, debug_logging: pytest.LogCaptureFixture
+) -> None:
+    """Test that only the first state keys are listed, with a count of the rest."""
+    state = cast(AgentState, {f"key{i}": i for i in range(25)})
+
+    log_model_response(state, mock_runtime)
+
+    assert "'key19'] (+5 more)" in debug_logging.text
+    assert "key20" not in debug_logging.text
@@ -2,13 +2,17 @@
 
 import json
 import tempfile
+from collections.abc import Mapping
 from pathlib import Path
 
+import pytest
+
 from mystery_agents.utils.i18n import (
     TranslationManager,
     get_clue_labels,
     get_document_labels,
     get_language_name,
+    get_translation_manager,
     translate_epoch,
     translate_room_name,
 )
@@ -26,6 +30,22 @@ class TestTranslationManager:
         tm3 = TranslationManager("es")
         assert tm1 is not tm3, "Should return different instances for different languages"
 
+    def test_get_translation_manager_returns_singleton(self) -> None:
+        """Test that the cached lookup returns the per-language singleton."""
+        assert get_translation_manager("es") is TranslationManager("es")
+        assert get_translation_manager("es") is get_translation_manager("es")
+        assert get_translation_manager("en") is not get_translation_manager("es")
+
+    def test_get_translation_manager_follows_singleton_reset(self) -> None:
+        """Test that helpers pick up a new manager after the singletons are cleared."""
+        labels = get_document_labels("es")
+
+        TranslationManager._instances.clear()
+
+        assert get_translation_manager("es") is TranslationManager("es")
+        assert get_document_labels("es") is not labels
+        assert get_document_labels("es") == labels
+
     def test_load_english_translations(self) -> None:
         """Test loading English translations."""
         tm = TranslationManager("en")
@@ -249,7 +269,7 @@ class TestBackwardCompatibilityFunctions:
         """Test get_document_labels for English."""
         labels = get_document_labels("en")
 
-        assert isinstance(labels, dict)
+        assert isinstance(labels, Mapping)
         assert "host_guide_title" in labels
         assert "game_information" in labels
         assert labels["host_guide_title"] == "Mystery Party Host Guide"
@@ -258,7 +278,7 @@ class TestBackwardCompatibilityFunctions:
         """Test get_document_labels for Spanish."""
         labels = get_document_labels("es")
 
-        assert isinstance(labels, dict)
+        assert isinstance(labels, Mapping)
         assert "host_guide_title" in labels
         assert labels["host_guide_title"] == "Guía del anfitrión - Fiesta misterio"
 
@@ -266,7 +286,7 @@ class TestBackwardCompatibilityFunctions:
         """Test get_clue_labels for English."""
         labels = get_clue_labels("en")
 
-        assert isinstance(labels, dict)
+        assert isinstance(labels, Mapping)
         assert "clue" in labels
         assert "type" in labels
         assert labels["clue"] == "Clue"
@@ -275,10 +295,19 @@ class TestBackwardCompatibilityFunctions:
         """Test get_clue_labels for Spanish."""
         labels = get_clue_labels("es")
 
-        assert isinstance(labels, dict)
+        assert isinstance(labels, Mapping)
         assert "clue" in labels
         assert labels["clue"] == "Pista"
 
+    def test_labels_are_built_once_and_read_only(self) -> None:
+        """Test that label mappings are reused per language and can't be mutated."""
+        labels = get_document_labels("es")
+
+        assert get_document_labels("es") is labels
+        assert get_clue_labels("es") is get_clue_labels("es")
+        with pytest.raises(TypeError):
+            labels["host_guide_title"] = "changed"  # type: ignore[index]
+
     def test_get_language_name(self) -> None:
         """Test get_language_name function."""
         assert get_language_name("en") == "English"
@@ -0,0 +1,98 @@
+"""Tests for the shared image batch processor."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+from mystery_agents.utils.image_batch import ImageBatchProcessor, get_image_batch_processor
+
+
+async def test_submit_respects_max_concurrency(tmp_path: Path) -> None:
+    """Test that no more than max_concurrency requests are in flight at once."""
+    processor = ImageBatchProcessor(max_concurrency=2, rate_limit=0)
+    in_flight = 0
+    peak = 0
+
+    async def fake_generate(prompt: str, output_path: Path) -> bool:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return True
+
+    with patch(
+        "mystery_agents.utils.image_batch.generate_image_with_gemini",
+        side_effect=fake_generate,
+    ):
+        results = await asyncio.gather(
+            *(processor.submit(f"prompt {i}", tmp_path / f"{i}.png") for i in range(6))
+        )
+
+    assert results == [True] * 6
+    assert peak == 2
+
+
+async def test_submit_spaces_requests_by_rate_limit(tmp_path: Path) -> None:
+    """Test that request starts are spaced according to the rate limit."""
+    processor = ImageBatchProcessor(max_concurrency=5, rate_limit=60)
+    sleeps: list[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        sleeps.append(delay)
+
+    async def fake_generate(prompt: str, output_path: Path) -> bool:
+        return True
+
+    with (
+        patch(
+            "mystery_agents.utils.image_batch.generate_image_with_gemini",
+            side_effect=fake_generate,
+        ),
+        patch("mystery_agents.utils.image_batch.asyncio.sleep", side_effect=fake_sleep),
+    ):
+        await asyncio.gather(
+            *(processor.submit(f"prompt {i}", tmp_path / f"{i}.png") for i in range(3))
+        )
+
+    # First request starts immediately, the next two wait for their slots
+    assert len(sleeps) == 2
+    assert all(delay > 0 for delay in sleeps)
+
+
+def test_processor_rebinds_across_event_loops(tmp_path: Path) -> None:
+    """Test that the processor can be reused across separate asyncio.run calls."""
+    processor = ImageBatchProcessor(max_concurrency=1, rate_limit=0)
+
+    async def fake_generate(prompt: str, output_path: Path) -> bool:
+        return True
+
+    with patch(
+        "mystery_agents.utils.image_batch.generate_image_with_gemini",
+        side_effect=fake_generate,
+    ):
+        assert asyncio.run(processor.submit("first", tmp_path / "a.png")) is True
+        assert asyncio.run(processor.submit("second", tmp_path / "b.png")) is True
+
+
+def test_get_image_batch_processor_is_shared() -> None:
+    """Test that all agents share the same processor instance."""
+    assert get_image_batch_processor() is get_image_batch_processor()
+
+
+def test_run_reuses_one_event_loop() -> None:
+    """Test that batches run on the same persistent event loop until closed."""
+    processor = ImageBatchProcessor(max_concurrency=1, rate_limit=0)
+
+    async def current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    try:
+        first = processor.run(current_loop())
+        second = processor.run(current_loop())
+        assert first is second
+        assert not first.is_closed()
+    finally:
+        processor.close()
+
+    assert first.is_closed()
@@ -0,0 +1,93 @@
+"""Tests for the content-addressed image cache."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mystery_agents.utils.image_batch import ImageBatchProcessor
+from mystery_agents.utils.image_cache import (
+    image_cache_key,
+    load_cached_image,
+    store_cached_image,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Iterator[Path]:
+    """Redirect the image cache to a temporary directory."""
+    directory = tmp_path / "cache"
+    with patch("mystery_agents.utils.image_cache.get_image_cache_dir", return_value=directory):
+        yield directory
+
+
+def test_image_cache_key_is_stable_and_prompt_specific() -> None:
+    """Test that identical prompts share a key and different prompts don't."""
+    assert image_cache_key("prompt") == image_cache_key("prompt")
+    assert image_cache_key("prompt") != image_cache_key("other prompt")
+
+
+def test_load_cached_image_miss(cache_dir: Path, tmp_path: Path) -> None:
+    """Test that a missing cache entry reports a miss."""
+    assert load_cached_image("prompt", tmp_path / "out.png") is False
+
+
+def test_store_and_load_cached_image(cache_dir: Path, tmp_path: Path) -> None:
+    """Test that a stored image is copied back for the same prompt."""
+    generated = tmp_path / "generated.png"
+    generated.write_bytes(b"image-bytes")
+
+    store_cached_image("prompt", generated)
+    output_path = tmp_path / "out.png"
+
+    assert load_cached_image("prompt", output_path) is True
+    assert output_path.read_bytes() == b"image-bytes"
+
+
+def test_store_cached_image_never_exposes_partial_files(cache_dir: Path, tmp_path: Path) -> None:
+    """Test that an interrupted copy leaves neither a cache entry nor a temporary file."""
+    generated = tmp_path / "generated.png"
+    generated.write_bytes(b"image-bytes")
+
+    def interrupted_copy(src: Path, dst: Path) -> None:
+        Path(dst).write_bytes(b"image")
+        raise OSError("disk full")
+
+    with patch("mystery_agents.utils.image_cache.shutil.copyfile", side_effect=interrupted_copy):
+        store_cached_image("prompt", generated)
+
+    assert list(cache_dir.iterdir()) == []
+    assert load_cached_image("prompt", tmp_path / "out.png") is False
+
+
+async def test_submit_with_cache_skips_generation_on_hit(cache_dir: Path, tmp_path: Path) -> None:
+    """Test that a cache hit skips the Gemini call entirely."""
+    generated = tmp_path / "generated.png"
+    generated.write_bytes(b"image-bytes")
+    store_cached_image("prompt", generated)
+
+    processor = ImageBatchProcessor(rate_limit=0)
+    with patch(
+        "mystery_agents.utils.image_batch.generate_image_with_gemini", new_callable=AsyncMock
+    ) as mock_generate:
+        success = await processor.submit("prompt", tmp_path / "out.png", use_cache=True)
+
+    assert success is True
+    mock_generate.assert_not_called()
+
+
+async def test_submit_with_cache_stores_new_images(cache_dir: Path, tmp_path: Path) -> None:
+    """Test that freshly generated images are added to the cache."""
+
+    async def fake_generate(prompt: str, output_path: Path) -> bool:
+        output_path.write_bytes(b"fresh-image")
+        return True
+
+    processor = ImageBatchProcessor(rate_limit=0)
+    with patch(
+        "mystery_agents.utils.image_batch.generate_image_with_gemini", side_effect=fake_generate
+    ):
+        await processor.submit("prompt", tmp_path / "out.png", use_cache=True)
+
+    assert (cache_dir / f"{image_cache_key('prompt')}.png").read_bytes() == b"fresh-image"
@@ -12,8 +12,10 @@ from PIL import Image as PILImage
 
 from mystery_agents.utils.image_generation import (
     _call_gemini_image_api,
+    _save_image_bytes,
     generate_image_with_gemini,
     get_character_image_output_dir,
+    sanitize_image_filename,
 )
 
 
@@ -34,7 +36,6 @@ def sample_base64_image(sample_image_data: bytes) -> str:
     return f"data:image/png;base64,{b64_data}"
 
 
-@pytest.mark.asyncio
 async def test_generate_image_with_gemini_success(
     tmp_path: Path, mock_google_api_key: None, sample_base64_image: str
 ) -> None:
@@ -52,7 +53,6 @@ async def test_generate_image_with_gemini_success(
         assert mock_call.call_args[0][1] == output_path
 
 
-@pytest.mark.asyncio
 async def test_generate_image_with_gemini_retry_on_failure(
     tmp_path: Path, mock_google_api_key: None
 ) -> None:
@@ -81,7 +81,6 @@ async def test_generate_image_with_gemini_retry_on_failure(
             assert call_count == 3
 
 
-@pytest.mark.asyncio
 async def test_generate_image_with_gemini_max_retries_exceeded(
     tmp_path: Path, mock_google_api_key: None
 ) -> None:
@@ -100,7 +99,6 @@ async def test_generate_image_with_gemini_max_retries_exceeded(
             assert result is False
 
 
-@pytest.mark.asyncio
 async def test_generate_image_with_gemini_exponential_backoff(
     tmp_path: Path, mock_google_api_key: None
 ) -> None:
@@ -128,7 +126,6 @@ async def test_generate_image_with_gemini_exponential_backoff(
             assert delays[2] == 0.4
 
 
-@pytest.mark.asyncio
 async def test_call_gemini_image_api_success(
     tmp_path: Path, mock_google_api_key: None, sample_base64_image: str
 ) -> None:
@@ -176,7 +173,6 @@ async def test_call_gemini_image_api_success(
             assert call_args[1]["generation_config"]["response_modalities"] == ["IMAGE"]
 
 
-@pytest.mark.asyncio
 async def test_call_gemini_image_api_no_api_key(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that API call raises error when API key is missing."""
     monkeypatch.delenv("GOOGLE_API_KEY", raising=False)
@@ -184,7 +180,6 @@ async def test_call_gemini_image_api_no_api_key(monkeypatch: pytest.MonkeyPatch)
         await _call_gemini_image_api("Test prompt", Path("/tmp/test.png"))
 
 
-@pytest.mark.asyncio
 async def test_call_gemini_image_api_invalid_response_format(
     tmp_path: Path, mock_google_api_key: None
 ) -> None:
@@ -215,7 +210,6 @@ async def test_call_gemini_image_api_invalid_response_format(
                 await _call_gemini_image_api("Test prompt", output_path)
 
 
-@pytest.mark.asyncio
 async def test_call_gemini_image_api_no_image_url(
     tmp_path: Path, mock_google_api_key: None
 ) -> None:
@@ -246,7 +240,6 @@ async def test_call_gemini_image_api_no_image_url(
                 await _call_gemini_image_api("Test prompt", output_path)
 
 
-@pytest.mark.asyncio
 async def test_call_gemini_image_api_invalid_url_format(
     tmp_path: Path, mock_google_api_key: None
 ) -> None:
@@ -277,7 +270,6 @@ async def test_call_gemini_image_api_invalid_url_format(
                 await _call_gemini_image_api("Test prompt", output_path)
 
 
-@pytest.mark.asyncio
 async def test_call_gemini_image_api_missing_url(tmp_path: Path, mock_google_api_key: None) -> None:
     """Test that API call raises error when URL is missing."""
     output_path = tmp_path / "test_image.png"
@@ -333,3 +325,51 @@ def test_get_character_image_output_dir_long_id() -> None:
     result = get_character_image_output_dir(game_id)
 
     assert f"game_{game_id}" in str(result)
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Lord Blackwood", "lord_blackwood"),
+        ("José María", "josé_maría"),
+        ("AC/DC: The Band", "ac_dc_the_band"),
+        ("O'Brien", "o_brien"),
+    ],
+)
+def test_sanitize_image_filename(name: str, expected: str) -> None:
+    """Test that names are converted into filesystem-safe filename components."""
+    assert sanitize_image_filename(name) == expected
+
+
+def test_save_image_bytes_writes_png_as_is(tmp_path: Path, sample_image_data: bytes) -> None:
+    """Test that PNG payloads are written without re-encoding."""
+    output_path = tmp_path / "image.png"
+
+    with patch("mystery_agents.utils.image_generation.PILImage.open") as mock_open:
+        _save_image_bytes(sample_image_data, output_path)
+
+    mock_open.assert_not_called()
+    assert output_path.read_bytes() == sample_image_data
+
+
+def test_save_image_bytes_converts_other_formats(tmp_path: Path) -> None:
+    """Test that non-PNG payloads are converted to PNG."""
+    buffer = BytesIO()
+    PILImage.new("RGB", (10, 10), color="blue").save(buffer, format="JPEG")
+    output_path = tmp_path / "image.png"
+
+    _save_image_bytes(buffer.getvalue(), output_path)
+
+    with PILImage.open(output_path) as saved:
+        assert saved.format == "PNG"
+
+
+def test_save_image_bytes_creates_parent_directory(
+    tmp_path: Path, sample_image_data: bytes
+) -> None:
+    """Test that the image directory is created when the image is written."""
+    output_path = tmp_path / "images" / "characters" / "image.png"
+
+    _save_image_bytes(sample_image_data, output_path)
+
+    assert output_path.exists()
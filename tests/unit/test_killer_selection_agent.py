@@ -159,3 +159,33 @@ def test_killer_selection_validates_killer_id(state_with_timeline: GameState) ->
     killer_ids = [c.id for c in state_with_timeline.characters]
     assert result.killer_selection is not None
     assert result.killer_selection.killer_id in killer_ids
+
+
+def test_killer_selection_prompt_resolves_character_names(
+    state_with_timeline: GameState,
+) -> None:
+    """Test that timeline events list character names and invalid killer IDs fall back."""
+    from unittest.mock import patch
+
+    from mystery_agents.models.state import KillerSelection
+
+    state_with_timeline.config.dry_run = False
+    agent = KillerSelectionAgent()
+    llm_result = KillerSelection(
+        killer_id="not-a-suspect",
+        rationale="Rationale",
+        modified_events=[],
+        truth_narrative="Truth",
+    )
+
+    with patch.object(agent, "invoke", return_value=llm_result) as mock_invoke:
+        result = agent.run(state_with_timeline)
+
+    user_message = mock_invoke.call_args[0][1]
+    first_names = ", ".join(c.name for c in state_with_timeline.characters[:3])
+    assert f"[{first_names}]" in user_message
+    assert "(Location: main_hall)" in user_message
+    # Events without involved characters get no name list
+    assert "• 22:30 (Location: study): Murder occurs" in user_message
+    assert result.killer_selection is not None
+    assert result.killer_selection.killer_id == state_with_timeline.characters[0].id
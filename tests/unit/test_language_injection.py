@@ -1,7 +1,7 @@
 """Tests for language injection in BaseAgent."""
 
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -126,15 +126,15 @@ class TestInvokeWithLanguageInjection:
         self, mock_llm: MagicMock, spanish_state: GameState
     ) -> None:
         """Test that invoke appends language injection to system prompt for Spanish."""
-        # Mock the agent invoke to capture the messages
+        # Mock the model invoke to capture the messages
         captured_messages: list[Any] = []
 
-        def mock_invoke(inputs: Any) -> dict[str, Any]:
-            captured_messages.extend(inputs["messages"])
-            return {"messages": [MagicMock(content="test response")]}
+        def mock_invoke(messages: list[Any]) -> Any:
+            captured_messages.extend(messages)
+            return MagicMock(content="test response")
 
         agent = MockAgent(mock_llm)
-        agent.agent.invoke = mock_invoke  # type: ignore[assignment]
+        agent.structured_llm.invoke = mock_invoke  # type: ignore[assignment]
 
         agent.invoke(spanish_state)
 
@@ -150,15 +150,15 @@ class TestInvokeWithLanguageInjection:
         self, mock_llm: MagicMock, english_state: GameState
     ) -> None:
         """Test that invoke does not inject language instructions for English."""
-        # Mock the agent invoke to capture the messages
+        # Mock the model invoke to capture the messages
         captured_messages: list[Any] = []
 
-        def mock_invoke(inputs: Any) -> dict[str, Any]:
-            captured_messages.extend(inputs["messages"])
-            return {"messages": [MagicMock(content="test response")]}
+        def mock_invoke(messages: list[Any]) -> Any:
+            captured_messages.extend(messages)
+            return MagicMock(content="test response")
 
         agent = MockAgent(mock_llm)
-        agent.agent.invoke = mock_invoke  # type: ignore[assignment]
+        agent.structured_llm.invoke = mock_invoke  # type: ignore[assignment]
 
         agent.invoke(english_state)
 
@@ -177,12 +177,12 @@ class TestInvokeWithLanguageInjection:
         """Test that language injection is appended (not prepended) to system prompt."""
         captured_messages: list[Any] = []
 
-        def mock_invoke(inputs: Any) -> dict[str, Any]:
-            captured_messages.extend(inputs["messages"])
-            return {"messages": [MagicMock(content="test response")]}
+        def mock_invoke(messages: list[Any]) -> Any:
+            captured_messages.extend(messages)
+            return MagicMock(content="test response")
 
         agent = MockAgent(mock_llm)
-        agent.agent.invoke = mock_invoke  # type: ignore[assignment]
+        agent.structured_llm.invoke = mock_invoke  # type: ignore[assignment]
 
         agent.invoke(spanish_state)
 
@@ -214,3 +214,34 @@ class TestLanguageInjectionWithDifferentLanguages:
 
         # Spanish should show "Spanish" (from get_language_name)
         assert "Spanish" in injection
+
+
+class TestSystemPromptMemoization:
+    """Test that composed system prompts are reused across invocations."""
+
+    def test_static_prompt_is_composed_once_per_language(
+        self, mock_llm: MagicMock, english_state: GameState, spanish_state: GameState
+    ) -> None:
+        """Test that agents with a static prompt reuse the composed prompt per language."""
+
+        class StaticAgent(BaseAgent):
+            pass
+
+        agent = StaticAgent(mock_llm, system_prompt="Static prompt")
+
+        spanish_prompt = agent._get_full_system_prompt(spanish_state)
+
+        assert agent._get_full_system_prompt(spanish_state) is spanish_prompt
+        assert spanish_prompt.startswith("Static prompt")
+        assert "CRITICAL LANGUAGE REQUIREMENTS" in spanish_prompt
+        assert agent._get_full_system_prompt(english_state) == "Static prompt"
+
+    def test_dynamic_prompt_is_rebuilt_each_time(
+        self, mock_llm: MagicMock, spanish_state: GameState
+    ) -> None:
+        """Test that agents overriding get_system_prompt still get a fresh prompt."""
+        agent = MockAgent(mock_llm)
+
+        with patch.object(agent, "get_system_prompt", side_effect=["First", "Second"]):
+            assert agent._get_full_system_prompt(spanish_state).startswith("First")
+            assert agent._get_full_system_prompt(spanish_state).startswith("Second")
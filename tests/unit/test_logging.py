@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import warnings
 from pathlib import Path
 from unittest.mock import patch
 
@@ -195,11 +196,57 @@ def test_setup_logging_file_handler(tmp_path: Path) -> None:
     assert "Test log message" in content
 
 
-def test_custom_formatter_extracts_agent_name() -> None:
-    """Test that custom formatter extracts agent name from module path."""
-    from mystery_agents.utils.logging_config import CustomFormatter
+def test_setup_logging_file_not_created_until_logged(tmp_path: Path) -> None:
+    """Test that the log file is only opened once a record is written."""
+    log_file = tmp_path / "unused.log"
 
-    formatter = CustomFormatter()
+    setup_logging(verbosity=1, quiet=False, log_file=str(log_file))
+
+    assert not log_file.exists()
+
+
+def test_setup_logging_adds_single_third_party_warnings_filter() -> None:
+    """Test that third-party warnings are silenced by one filter, even across repeated setups."""
+    with warnings.catch_warnings():
+        setup_logging(verbosity=0, quiet=False, log_file=None)
+        setup_logging(verbosity=0, quiet=False, log_file=None)
+
+        third_party = [f for f in warnings.filters if "fontTools" in str(f[3])]
+        assert len(third_party) == 1
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.warn_explicit("noisy", UserWarning, "css.py", 1, module="weasyprint.css")
+            warnings.warn_explicit("kept", UserWarning, "app.py", 1, module="mystery_agents")
+        assert [str(w.message) for w in caught] == ["kept"]
+
+
+def test_setup_logging_debug_model_without_verbose(capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that --debug shows model responses on stderr without -vv."""
+    from langchain_core.messages import AIMessage
+
+    from mystery_agents.utils.debug_middleware import _log_model_response_impl
+
+    setup_logging(verbosity=0, quiet=False, log_file=None, debug_model=True)
+    try:
+        _log_model_response_impl({"messages": [AIMessage(content="model says hi")]}, None)  # type: ignore[arg-type]
+        assert "model says hi" in capsys.readouterr().err
+    finally:
+        setup_logging(verbosity=0, quiet=False, log_file=None)
+
+    # Without --debug the middleware logger is back to the root level
+    _log_model_response_impl({"messages": [AIMessage(content="model says hi")]}, None)  # type: ignore[arg-type]
+    assert "model says hi" not in capsys.readouterr().err
+
+
+def test_log_format_extracts_agent_name() -> None:
+    """Test that the log format shows the agent name instead of the module path."""
+    from mystery_agents.utils.logging_config import (
+        LOG_DATE_FORMAT,
+        LOG_FORMAT,
+        AgentNameFilter,
+    )
+
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=LOG_DATE_FORMAT)
 
     # Create a mock log record
     record = logging.LogRecord(
@@ -212,6 +259,7 @@ def test_custom_formatter_extracts_agent_name() -> None:
         exc_info=None,
     )
 
+    assert AgentNameFilter().filter(record)
     formatted = formatter.format(record)
 
     # Should contain [a2_world] not the full path
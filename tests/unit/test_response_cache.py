@@ -0,0 +1,122 @@
+"""Tests for the content-addressed LLM response cache."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.language_models import BaseChatModel
+from pydantic import BaseModel
+
+from mystery_agents.agents.base import BaseAgent
+from mystery_agents.models.state import GameConfig, GameState, MetaInfo, PlayerConfig
+from mystery_agents.utils.response_cache import (
+    load_cached_response,
+    response_cache_key,
+    store_cached_response,
+)
+
+
+class _Output(BaseModel):
+    """Structured output used by the cache tests."""
+
+    result: str
+
+
+class _CachedAgent(BaseAgent):
+    """Minimal agent with a structured response format."""
+
+    def __init__(self) -> None:
+        """Initialize with a mock LLM."""
+        super().__init__(
+            llm=MagicMock(spec=BaseChatModel),
+            response_format=_Output,
+            system_prompt="System prompt",
+        )
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path) -> Iterator[Path]:
+    """Redirect the response cache to a temporary directory."""
+    directory = tmp_path / "cache"
+    with patch(
+        "mystery_agents.utils.response_cache.get_response_cache_dir", return_value=directory
+    ):
+        yield directory
+
+
+@pytest.fixture
+def cached_state() -> GameState:
+    """Create a game state with the response cache enabled."""
+    return GameState(
+        meta=MetaInfo(),
+        config=GameConfig(players=PlayerConfig(total=6), enable_response_cache=True),
+    )
+
+
+def test_response_cache_key_is_stable_and_input_specific() -> None:
+    """Test that identical inputs share a key and different inputs don't."""
+    assert response_cache_key("model", "prompt") == response_cache_key("model", "prompt")
+    assert response_cache_key("model", "prompt") != response_cache_key("model", "other")
+    assert response_cache_key("a", "bc") != response_cache_key("ab", "c")
+
+
+def test_load_cached_response_miss(cache_dir: Path) -> None:
+    """Test that a missing cache entry reports a miss."""
+    assert load_cached_response("missing", _Output) is None
+
+
+def test_store_and_load_cached_response(cache_dir: Path) -> None:
+    """Test that a stored response is parsed back into the same model."""
+    store_cached_response("key", _Output(result="cached"))
+
+    assert load_cached_response("key", _Output) == _Output(result="cached")
+    assert not list(cache_dir.glob("*.tmp"))
+
+
+def test_load_cached_response_ignores_invalid_entries(cache_dir: Path) -> None:
+    """Test that entries that no longer match the schema are treated as misses."""
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "key.json").write_text('{"unexpected": 1}')
+
+    assert load_cached_response("key", _Output) is None
+
+
+def test_invoke_reuses_cached_response(cache_dir: Path, cached_state: GameState) -> None:
+    """Test that a repeated invocation is served from the cache without an LLM call."""
+    agent = _CachedAgent()
+    agent.structured_llm = MagicMock()
+    agent.structured_llm.invoke.return_value = _Output(result="fresh")
+
+    first = agent.invoke(cached_state, "Same message")
+    second = agent.invoke(cached_state, "Same message")
+
+    assert first == second == _Output(result="fresh")
+    agent.structured_llm.invoke.assert_called_once()
+
+
+def test_invoke_retries_bypass_cached_response(cache_dir: Path, cached_state: GameState) -> None:
+    """Test that a retry with the same prompts doesn't get the previous response back."""
+    agent = _CachedAgent()
+    agent.structured_llm = MagicMock()
+    agent.structured_llm.invoke.return_value = _Output(result="fresh")
+
+    agent.invoke(cached_state, "Same message")
+    cached_state.retry_count += 1
+    agent.invoke(cached_state, "Same message")
+
+    assert agent.structured_llm.invoke.call_count == 2
+
+
+def test_invoke_without_cache_flag_skips_cache(cache_dir: Path, cached_state: GameState) -> None:
+    """Test that the cache is not touched unless enabled."""
+    cached_state.config.enable_response_cache = False
+    agent = _CachedAgent()
+    agent.structured_llm = MagicMock()
+    agent.structured_llm.invoke.return_value = _Output(result="fresh")
+
+    agent.invoke(cached_state, "Same message")
+    agent.invoke(cached_state, "Same message")
+
+    assert agent.structured_llm.invoke.call_count == 2
+    assert not cache_dir.exists()
@@ -3,6 +3,7 @@
 import pytest
 
 from mystery_agents.models.state import (
+    CharacterSpec,
     CrimeScene,
     CrimeSpec,
     GameConfig,
@@ -15,6 +16,9 @@ from mystery_agents.models.state import (
 )
 from mystery_agents.utils.constants import TEST_DEFAULT_DURATION, TEST_DEFAULT_PLAYERS
 from mystery_agents.utils.state_helpers import (
+    get_characters_by_id,
+    get_crime_fields,
+    get_world_fields,
     safe_get_crime_method_description,
     safe_get_crime_scene_description,
     safe_get_crime_scene_room_id,
@@ -247,3 +251,59 @@ def test_safe_get_crime_scene_room_id_without_crime(empty_state: GameState) -> N
     """Test getting scene room ID when crime doesn't exist."""
     result = safe_get_crime_scene_room_id(empty_state)
     assert result == "N/A"
+
+
+def test_get_characters_by_id(empty_state: GameState) -> None:
+    """Test indexing characters by ID."""
+    character = CharacterSpec(
+        id="char-001",
+        name="Elena Martinez",
+        gender="female",
+        age_range="30-35",
+        role="Detective",
+        public_description="Sharp and observant",
+        personality_traits=["clever"],
+        relation_to_victim="Former colleague",
+        personal_secrets=["Has gambling debts"],
+        personal_goals=["Solve the case"],
+        act1_objectives=["Find evidence"],
+        motive_for_crime="Revenge for past wrongs",
+    )
+    empty_state.characters = [character]
+
+    assert get_characters_by_id(empty_state) == {"char-001": character}
+
+
+def test_get_characters_by_id_without_characters(empty_state: GameState) -> None:
+    """Test indexing an empty character list."""
+    assert get_characters_by_id(empty_state) == {}
+
+
+def test_get_world_fields_with_world(state_with_world: GameState) -> None:
+    """Test that world fields match the individual helpers."""
+    fields = get_world_fields(state_with_world)
+
+    assert fields.location_name == safe_get_world_location_name(state_with_world)
+    assert fields.epoch == safe_get_world_epoch(state_with_world)
+    assert fields.location_type == safe_get_world_location_type(state_with_world)
+    assert fields.visual_keywords == safe_get_world_visual_keywords(state_with_world)
+
+
+def test_get_world_fields_without_world(empty_state: GameState) -> None:
+    """Test that every world field is N/A without a world."""
+    assert set(get_world_fields(empty_state)) == {"N/A"}
+
+
+def test_get_crime_fields_with_crime(state_with_crime: GameState) -> None:
+    """Test that crime fields match the individual helpers."""
+    fields = get_crime_fields(state_with_crime)
+
+    assert fields.victim_name == safe_get_crime_victim_name(state_with_crime)
+    assert fields.victim_secrets == safe_get_crime_victim_secrets(state_with_crime)
+    assert fields.weapon == safe_get_crime_weapon(state_with_crime)
+    assert fields.scene_room_id == safe_get_crime_scene_room_id(state_with_crime)
+
+
+def test_get_crime_fields_without_crime(empty_state: GameState) -> None:
+    """Test that every crime field is N/A without a crime."""
+    assert set(get_crime_fields(empty_state)) == {"N/A"}
@@ -1,6 +1,11 @@
 """Unit tests for validator agents (V1, V2)."""
 
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
+from langchain_core.language_models import BaseChatModel
+from pydantic import ValidationError
 
 from mystery_agents.agents.a2_world import WorldAgent
 from mystery_agents.agents.a3_characters import CharactersAgent
@@ -9,12 +14,13 @@ from mystery_agents.agents.a5_crime import CrimeAgent
 from mystery_agents.agents.a6_timeline import TimelineAgent
 from mystery_agents.agents.a7_killer_selection import KillerSelectionAgent
 from mystery_agents.agents.v1_world_validator import WorldValidatorAgent
-from mystery_agents.agents.v2_game_logic_validator import GameLogicValidatorAgent
+from mystery_agents.agents.v2_game_logic_validator import GameLogicValidatorAgent, _merge_reports
 from mystery_agents.models.state import (
     GameConfig,
     GameState,
     MetaInfo,
     PlayerConfig,
+    ValidationIssue,
     ValidationReport,
     WorldValidation,
 )
@@ -147,10 +153,120 @@ def test_validation_agent_run_dry_run(state_with_full_game: GameState) -> None:
     """Test GameLogicValidatorAgent run in dry run mode."""
     agent = GameLogicValidatorAgent()
 
-    result = agent.run(state_with_full_game)
+    with patch.object(agent, "_build_user_message") as mock_build:
+        result = agent.run(state_with_full_game)
 
     assert result.validation is not None
     assert result.validation.is_consistent is True
+    # Dry runs never assemble the validation context
+    mock_build.assert_not_called()
+
+
+def test_validation_agent_build_user_message(state_with_full_game: GameState) -> None:
+    """Test that the validation prompt summarizes the game state."""
+    agent = GameLogicValidatorAgent()
+
+    message = agent._build_user_message(state_with_full_game)
+
+    assert state_with_full_game.timeline_global is not None
+    event_count = sum(len(b.events) for b in state_with_full_game.timeline_global.time_blocks)
+    assert f"COMPLETE TIMELINE ({event_count} events):" in message
+    for char in state_with_full_game.characters:
+        assert f"- {char.name} (ID: {char.id})" in message
+
+
+def test_validation_agent_mock_report_is_frozen(state_with_full_game: GameState) -> None:
+    """Test that the shared dry-run report can't be mutated."""
+    agent = GameLogicValidatorAgent()
+    result = agent._mock_output(state_with_full_game)
+
+    assert result.validation is not None
+    with pytest.raises(ValidationError):
+        result.validation.is_consistent = False
+
+
+def test_merge_reports_majority_verdict() -> None:
+    """Test that merged reports keep the majority verdict and its de-duplicated issues."""
+    issue = ValidationIssue(type="logic_gap", description="No motive", related_ids=[])
+    reports = [
+        ValidationReport(is_consistent=False, issues=[issue], suggested_fixes=["Add motive"]),
+        ValidationReport(is_consistent=True, issues=[], suggested_fixes=["Ignored"]),
+        ValidationReport(is_consistent=False, issues=[issue], suggested_fixes=["Add motive"]),
+    ]
+
+    merged = _merge_reports(reports)
+
+    assert merged.is_consistent is False
+    assert merged.issues == [issue]
+    assert merged.suggested_fixes == ["Add motive"]
+
+
+def test_merge_reports_tie_fails_validation() -> None:
+    """Test that a tied vote doesn't pass validation."""
+    reports = [
+        ValidationReport(is_consistent=True),
+        ValidationReport(is_consistent=False),
+    ]
+
+    assert _merge_reports(reports).is_consistent is False
+
+
+def test_validation_agent_ensemble_samples_concurrently(
+    state_with_full_game: GameState,
+) -> None:
+    """Test that the ensemble mode majority-votes several validator samples."""
+    state_with_full_game.config.dry_run = False
+    state_with_full_game.config.validator_ensemble = True
+    agent = GameLogicValidatorAgent()
+
+    with patch.object(
+        agent,
+        "ainvoke",
+        new=AsyncMock(
+            side_effect=[
+                ValidationReport(is_consistent=True),
+                ValidationReport(is_consistent=True),
+                ValidationReport(is_consistent=False),
+            ]
+        ),
+    ) as mock_ainvoke:
+        result = agent.run(state_with_full_game)
+
+    assert mock_ainvoke.await_count == 3
+    assert result.validation is not None
+    assert result.validation.is_consistent is True
+
+
+def test_validation_agent_ensemble_caches_each_sample(
+    state_with_full_game: GameState, tmp_path: Path
+) -> None:
+    """Test that cached ensemble runs replay every sample, not one shared response."""
+    state_with_full_game.config.dry_run = False
+    state_with_full_game.config.validator_ensemble = True
+    state_with_full_game.config.enable_response_cache = True
+    agent = GameLogicValidatorAgent()
+    agent.llm = MagicMock(spec=BaseChatModel)
+    agent.structured_llm = MagicMock()
+    agent.structured_llm.ainvoke = AsyncMock(
+        side_effect=[
+            ValidationReport(is_consistent=False),
+            ValidationReport(is_consistent=False),
+            ValidationReport(is_consistent=True),
+        ]
+    )
+    cache_dir = tmp_path / "cache"
+
+    with patch(
+        "mystery_agents.utils.response_cache.get_response_cache_dir", return_value=cache_dir
+    ):
+        first = agent.run(state_with_full_game).validation
+        second = agent.run(state_with_full_game).validation
+
+    # One cache entry per sample, and the second run is served entirely from them
+    assert len(list(cache_dir.glob("*.json"))) == 3
+    assert agent.structured_llm.ainvoke.await_count == 3
+    assert first is not None and first.is_consistent is False
+    assert second == first
 
 
 def test_world_validator_without_world() -> None:
@@ -102,8 +102,8 @@ def test_should_retry_world_validation_no_validation(basic_state: GameState) ->
 def test_node_functions_dry_run(basic_state: GameState) -> None:
     """Test that node functions work in dry run mode."""
     from mystery_agents.graph.workflow import (
+        a2_5_a3_style_and_characters_node,
         a2_world_node,
-        a3_characters_node,
         a4_relationships_node,
         a5_crime_node,
         a6_timeline_node,
@@ -114,8 +114,9 @@ def test_node_functions_dry_run(basic_state: GameState) -> None:
     state = a2_world_node(basic_state)
     assert state.world is not None
 
-    # Test characters node
-    state = a3_characters_node(state)
+    # Test visual style + characters node
+    state = a2_5_a3_style_and_characters_node(state)
+    assert state.visual_style is not None
     assert len(state.characters) > 0
 
     # Test relationships node